@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Time from the first message to the first event, with and without the AgentLoop pool.
+
+Usage:
+    PYTHONPATH=. python scripts/bench_agent_pool.py [--runtime fake|vibe] [--sessions 10]
+
+With --runtime fake (the default) a synthetic runtime simulates module imports,
+VibeConfig.load() and AgentLoop construction using the --import-ms/--config-ms/
+--build-ms delays. With --runtime vibe the real Mistral Vibe runtime is loaded;
+the real AgentLoop then talks to its configured model, so the measurement
+includes the first model round-trip.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from vibecheck import bridge as bridge_module
+from vibecheck.agent_pool import AgentLoopPool
+from vibecheck.bridge import SessionBridge, VibeRuntime, load_vibe_runtime
+
+
+class FirstEventRecorder:
+    def __init__(self) -> None:
+        self.first_event = asyncio.Event()
+
+    async def broadcast(self, _session_id: str, _event) -> None:
+        self.first_event.set()
+
+
+class UserMessageEvent:
+    def __init__(self, content: str) -> None:
+        self.content = content
+        self.message_id = None
+
+
+def _fake_runtime(import_ms: float, config_ms: float, build_ms: float) -> VibeRuntime:
+    time.sleep(import_ms / 1000)
+
+    class FakeConfig:
+        @classmethod
+        def load(cls):
+            time.sleep(config_ms / 1000)
+            return cls()
+
+    class FakeAgentLoop:
+        def __init__(self, _config, message_observer=None, enable_streaming: bool = False) -> None:
+            _ = (message_observer, enable_streaming)
+            time.sleep(build_ms / 1000)
+
+        def set_approval_callback(self, _callback) -> None:
+            return None
+
+        def set_user_input_callback(self, _callback) -> None:
+            return None
+
+        async def act(self, message: str):
+            yield UserMessageEvent(message)
+
+    return VibeRuntime(
+        agent_loop_cls=FakeAgentLoop,
+        vibe_config_cls=FakeConfig,
+        approval_yes="y",
+        approval_no="n",
+        ask_result_cls=None,
+        answer_cls=None,
+    )
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark first-message latency with the AgentLoop pool.")
+    parser.add_argument("--runtime", choices=("fake", "vibe"), default="fake")
+    parser.add_argument("--sessions", type=int, default=10, help="New sessions per scenario (default: 10)")
+    parser.add_argument("--import-ms", type=float, default=120.0, help="Fake runtime import cost (default: 120)")
+    parser.add_argument("--config-ms", type=float, default=40.0, help="Fake VibeConfig.load cost (default: 40)")
+    parser.add_argument("--build-ms", type=float, default=25.0, help="Fake AgentLoop build cost (default: 25)")
+    return parser.parse_args()
+
+
+async def _first_event_latency(pool: AgentLoopPool | None, index: int) -> float:
+    recorder = FirstEventRecorder()
+    bridge = SessionBridge(f"bench-{index}", connection_manager=recorder, agent_pool=pool)
+    started = time.perf_counter()
+    bridge.inject_message("hello")
+    await recorder.first_event.wait()
+    elapsed = (time.perf_counter() - started) * 1000
+    bridge.stop()
+    return elapsed
+
+
+async def _run_scenario(pool: AgentLoopPool | None, sessions: int) -> list[float]:
+    samples = []
+    for index in range(sessions):
+        if pool is not None:
+            # Model the idle gap between new sessions during which the pool refills.
+            await pool.warm()
+        samples.append(await _first_event_latency(pool, index))
+    return samples
+
+
+async def _main() -> None:
+    args = _parse_args()
+    if args.runtime == "fake":
+        def loader() -> VibeRuntime:
+            return _fake_runtime(args.import_ms, args.config_ms, args.build_ms)
+    else:
+        loader = load_vibe_runtime
+    bridge_module.load_vibe_runtime = loader
+
+    cold = await _run_scenario(None, args.sessions)
+    pool = AgentLoopPool(2, runtime_loader=loader)
+    pooled = await _run_scenario(pool, args.sessions)
+    await pool.close()
+
+    print(f"{'scenario':<10} {'median ms':>10} {'p95 ms':>8} {'max ms':>8}")
+    for label, samples in (("no pool", cold), ("pool", pooled)):
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        print(f"{label:<10} {statistics.median(samples):>10.1f} {p95:>8.1f} {ordered[-1]:>8.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Measure approval-request delivery latency while clients are saturated with bulk output.
+
+Usage:
+    PYTHONPATH=. python scripts/bench_approval_latency.py [--clients 10] [--chunks 400] [--chunk-kb 64]
+
+Each simulated client drains its socket at --bandwidth-mbps. The agent floods
+the session with --chunks tool results, then raises an approval request. Latency
+is the time from the request until each client has received it. "fifo" forces
+every event into one lane (the behaviour without priority classes); "lanes"
+uses the normal priority classes.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from vibecheck import ws as ws_module
+from vibecheck.bridge import SessionBridge
+from vibecheck.events import ToolResultEvent
+from vibecheck.priority import Priority
+
+SESSION_ID = "approval-bench"
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark approval delivery latency under output load.")
+    parser.add_argument("--clients", type=int, default=10, help="Connected clients (default: 10)")
+    parser.add_argument("--chunks", type=int, default=400, help="Bulk tool results before the approval (default: 400)")
+    parser.add_argument("--chunk-kb", type=int, default=64, help="Size of each tool result in KiB (default: 64)")
+    parser.add_argument(
+        "--bandwidth-mbps",
+        type=float,
+        default=200.0,
+        help="Per-client drain rate in megabits/s (default: 200)",
+    )
+    return parser.parse_args()
+
+
+class ThrottledSocket:
+    def __init__(self, bytes_per_second: float) -> None:
+        self.bytes_per_second = bytes_per_second
+        self.approval_received_at: float | None = None
+        self.frames = 0
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_json(self, payload: dict) -> None:
+        await asyncio.sleep(len(json.dumps(payload)) / self.bytes_per_second)
+        self.frames += 1
+        if payload.get("type") == "approval_request":
+            self.approval_received_at = time.perf_counter()
+
+
+async def _run(args: argparse.Namespace, *, lanes: bool) -> tuple[list[float], float]:
+    if not lanes:
+        ws_module.event_priority = lambda _event: Priority.BULK
+    manager = ws_module.ConnectionManager()
+    manager._expected_psk = "bench"
+    sockets = [ThrottledSocket(args.bandwidth_mbps * 1_000_000 / 8) for _ in range(args.clients)]
+    for socket in sockets:
+        await manager.connect(socket, SESSION_ID, "bench")
+
+    bridge = SessionBridge(SESSION_ID, connection_manager=manager)
+    output = "x" * (args.chunk_kb * 1024)
+    for index in range(args.chunks):
+        await bridge._broadcast(ToolResultEvent(call_id=f"tc-{index}", output=output))
+
+    requested_at = time.perf_counter()
+    approval = asyncio.create_task(bridge.request_approval("approve-me", "bash", {"command": "make deploy"}))
+    while any(socket.approval_received_at is None for socket in sockets):
+        await asyncio.sleep(0.001)
+    latencies = [(socket.approval_received_at - requested_at) * 1000 for socket in sockets]
+    bulk_left = sum(len(queue) for queue in manager.send_queues.values())
+
+    bridge.resolve_approval("approve-me", approved=False)
+    await approval
+    for socket in sockets:
+        await manager.disconnect(socket)
+    bridge.stop()
+    return latencies, bulk_left / len(sockets)
+
+
+def _summary(samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50 {statistics.median(ordered):9.2f} ms  p95 {p95:9.2f} ms  max {ordered[-1]:9.2f} ms"
+
+
+def main() -> None:
+    args = _parse_args()
+    backlog_mb = args.chunks * args.chunk_kb / 1024
+    print(f"{args.clients} clients, {backlog_mb:.1f} MiB queued per client at {args.bandwidth_mbps:g} Mbit/s")
+    real_priority = ws_module.event_priority
+    for name, lanes in (("fifo", False), ("lanes", True)):
+        try:
+            latencies, bulk_left = asyncio.run(_run(args, lanes=lanes))
+        finally:
+            ws_module.event_priority = real_priority
+        print(f"{name:>5}: {_summary(latencies)}  (frames still queued per client: {bulk_left:.0f})")
+
+
+if __name__ == "__main__":
+    main()
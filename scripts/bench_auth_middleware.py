@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Compare request throughput of the PSK auth middleware implementations.
+
+Usage:
+    PYTHONPATH=. python scripts/bench_auth_middleware.py [--requests 20000]
+
+Requests are driven straight through the ASGI callable (no sockets) so the
+numbers isolate middleware overhead. "legacy" is the previous
+BaseHTTPMiddleware-based implementation, reproduced here for comparison.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+from pathlib import Path
+import tempfile
+import time
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Mount, Route
+from starlette.staticfiles import StaticFiles
+
+from vibecheck.auth import PSKAuthMiddleware, is_exempt_path, is_psk_valid, load_psk
+
+
+class LegacyPSKAuthMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app) -> None:
+        super().__init__(app)
+        self._expected_psk = load_psk()
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        if is_exempt_path(request.url.path):
+            return await call_next(request)
+        provided_psk = request.headers.get("X-PSK") or request.query_params.get("psk")
+        if not is_psk_valid(provided_psk, self._expected_psk):
+            return JSONResponse(status_code=401, content={"detail": "Unauthorized"})
+        return await call_next(request)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark PSK auth middleware throughput.")
+    parser.add_argument("--requests", type=int, default=20000, help="Requests per scenario (default: 20000)")
+    return parser.parse_args()
+
+
+async def _state(_request: Request) -> JSONResponse:
+    return JSONResponse({"total": 0, "running": 0, "waiting": 0, "idle": 0})
+
+
+def _build_app(middleware_cls: type, static_dir: Path) -> object:
+    app = Starlette(
+        routes=[
+            Route("/api/state", _state),
+            Mount("/assets", StaticFiles(directory=static_dir), name="assets"),
+        ]
+    )
+    return middleware_cls(app)
+
+
+def _scope(path: str, headers: list[tuple[bytes, bytes]]) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers,
+        "client": ("127.0.0.1", 1234),
+        "server": ("127.0.0.1", 8780),
+    }
+
+
+def _receiver():
+    delivered = False
+
+    async def receive() -> dict:
+        nonlocal delivered
+        if not delivered:
+            delivered = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Streaming responses listen for a disconnect; the benchmark client never leaves.
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    return receive
+
+
+async def _run(app, path: str, headers: list[tuple[bytes, bytes]], count: int) -> float:
+    async def send(_message: dict) -> None:
+        return None
+
+    scope = _scope(path, headers)
+    started = time.perf_counter()
+    for _ in range(count):
+        await app(dict(scope), _receiver(), send)
+    return count / (time.perf_counter() - started)
+
+
+async def _main() -> None:
+    args = _parse_args()
+    psk = load_psk()
+    with tempfile.TemporaryDirectory() as tmp:
+        static_dir = Path(tmp)
+        (static_dir / "app.js").write_text("console.log('vibecheck')\n" * 200)
+        scenarios = [
+            ("/api/state", [(b"x-psk", psk.encode())]),
+            ("/assets/app.js", []),
+        ]
+        print(f"{'scenario':<18} {'legacy req/s':>14} {'asgi req/s':>14} {'speedup':>9}")
+        for path, headers in scenarios:
+            legacy = await _run(_build_app(LegacyPSKAuthMiddleware, static_dir), path, headers, args.requests)
+            current = await _run(_build_app(PSKAuthMiddleware, static_dir), path, headers, args.requests)
+            print(f"{path:<18} {legacy:>14.0f} {current:>14.0f} {current / legacy:>8.2f}x")
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("VIBECHECK_PSK", "bench-psk")
+    asyncio.run(_main())
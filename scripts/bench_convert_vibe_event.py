@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Measure per-event cost of SessionBridge._convert_vibe_event over a realistic mix.
+
+Usage:
+    PYTHONPATH=. python scripts/bench_convert_vibe_event.py [--events 200000]
+
+The mix approximates an AgentLoop turn: mostly assistant chunks, with tool
+calls, tool results (pydantic models) and the occasional user message.
+"cold" clears the per-class converter cache before every event to show the
+cost of resolving converters by class-name suffix each time.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+from pydantic import BaseModel
+
+from vibecheck import bridge as bridge_module
+from vibecheck.bridge import SessionBridge
+
+
+class BashArgs(BaseModel):
+    command: str
+
+
+class BashResult(BaseModel):
+    command: str
+    stdout: str
+    stderr: str
+    returncode: int
+
+
+class AssistantEvent:
+    def __init__(self, index: int) -> None:
+        self.content = f"chunk {index} of the assistant reply"
+        self.message_id = None
+
+
+class UserMessageEvent:
+    def __init__(self, index: int) -> None:
+        self.content = f"user message {index}"
+        self.message_id = f"user-{index}"
+
+
+class ToolCallEvent:
+    def __init__(self, index: int) -> None:
+        self.tool_name = "bash"
+        self.args = BashArgs(command=f"ls -la /tmp/{index}")
+        self.tool_call_id = f"tc-{index}"
+
+
+class ToolResultEvent:
+    def __init__(self, index: int) -> None:
+        self.tool_call_id = f"tc-{index}"
+        self.error = None
+        self.result = BashResult(command="ls -la", stdout="a.txt\nb.txt\n" * 40, stderr="", returncode=0)
+
+
+class ToolStreamEvent:
+    def __init__(self, index: int) -> None:
+        self.tool_call_id = f"tc-{index}"
+
+
+MIX = (
+    (AssistantEvent, 60),
+    (ToolCallEvent, 12),
+    (ToolResultEvent, 12),
+    (ToolStreamEvent, 12),
+    (UserMessageEvent, 4),
+)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark Vibe event conversion.")
+    parser.add_argument("--events", type=int, default=200_000, help="Events per run (default: 200000)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for the event mix (default: 7)")
+    return parser.parse_args()
+
+
+def _build_events(count: int, seed: int) -> list[object]:
+    rng = random.Random(seed)
+    kinds = [kind for kind, _ in MIX]
+    weights = [weight for _, weight in MIX]
+    return [rng.choices(kinds, weights)[0](index) for index in range(count)]
+
+
+def _measure(events: list[object], *, cold: bool) -> float:
+    bridge = SessionBridge("bench")
+    convert = bridge._convert_vibe_event
+    cache = bridge_module._VIBE_EVENT_CONVERTERS
+    started = time.perf_counter()
+    for raw_event in events:
+        if cold:
+            cache.clear()
+        convert(raw_event)
+    return (time.perf_counter() - started) / len(events) * 1e6
+
+
+def _measure_tool_result_serialization(count: int) -> tuple[float, float]:
+    result = ToolResultEvent(0).result
+    started = time.perf_counter()
+    for _ in range(count):
+        json.dumps(result.model_dump(mode="json"), ensure_ascii=True)
+    legacy = (time.perf_counter() - started) / count * 1e6
+    started = time.perf_counter()
+    for _ in range(count):
+        result.model_dump_json()
+    current = (time.perf_counter() - started) / count * 1e6
+    return legacy, current
+
+
+def main() -> None:
+    args = _parse_args()
+    events = _build_events(args.events, args.seed)
+    cold = _measure(events, cold=True)
+    warm = _measure(events, cold=False)
+    print(f"events: {len(events)}")
+    print(f"{'convert, cold dispatch':<30} {cold:8.2f} us/event")
+    print(f"{'convert, cached dispatch':<30} {warm:8.2f} us/event")
+    legacy, current = _measure_tool_result_serialization(max(1, args.events // 10))
+    print(f"{'tool result json.dumps':<30} {legacy:8.2f} us/result")
+    print(f"{'tool result model_dump_json':<30} {current:8.2f} us/result")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Compare terminal and phone latency with the API/WS server on the TUI loop vs its own thread.
+
+Usage:
+    PYTHONPATH=. python scripts/bench_live_attach_latency.py [--seconds 5] [--clients 20]
+
+The main thread plays the Textual app: it runs frames every --frame-ms that
+block for --redraw-ms (a stand-in for heavy redraws) and emits bridge events
+every --event-ms. "terminal" latency is how late each frame starts; "phone"
+latency is the time from when the agent was due to emit an event until a
+WebSocket client (running on its own thread) receives it.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import threading
+import time
+
+import uvicorn
+import websockets
+
+from vibecheck import ws as ws_module
+from vibecheck.app import create_app
+from vibecheck.bridge import SessionBridge, session_manager
+from vibecheck.events import AssistantEvent
+from vibecheck.server_thread import CrossLoopConnectionManager, ServerThread
+
+SESSION_ID = "latency-bench"
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark live-attach latency for both server placements.")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Duration per mode (default: 5)")
+    parser.add_argument("--clients", type=int, default=20, help="WebSocket clients (default: 20)")
+    parser.add_argument("--frame-ms", type=float, default=16.0, help="TUI frame interval (default: 16)")
+    parser.add_argument("--redraw-ms", type=float, default=6.0, help="Blocking redraw cost (default: 6)")
+    parser.add_argument("--event-ms", type=float, default=10.0, help="Bridge event interval (default: 10)")
+    parser.add_argument("--payload-bytes", type=int, default=2048, help="Event payload padding (default: 2048)")
+    parser.add_argument("--port", type=int, default=7991, help="Server port (default: 7991)")
+    return parser.parse_args()
+
+
+def _summary(samples: list[float]) -> str:
+    if not samples:
+        return "no samples"
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50 {statistics.median(ordered):7.2f} ms  p95 {p95:7.2f} ms  max {ordered[-1]:7.2f} ms  n={len(ordered)}"
+
+
+class PhoneClients:
+    def __init__(self, url: str, count: int) -> None:
+        self.url = url
+        self.count = count
+        self.samples: list[float] = []
+        self.connected = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=lambda: asyncio.run(self._run()), daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join(5)
+
+    async def _client(self, ready: list[int]) -> None:
+        async with websockets.connect(self.url, max_size=None) as socket:
+            ready.append(1)
+            if len(ready) == self.count:
+                self.connected.set()
+            while not self._stop.is_set():
+                try:
+                    raw = await asyncio.wait_for(socket.recv(), 0.2)
+                except asyncio.TimeoutError:
+                    continue
+                payload = json.loads(raw)
+                if payload.get("type") == "assistant":
+                    sent_at = float(payload["content"].split("|", 1)[0])
+                    self.samples.append((time.perf_counter() - sent_at) * 1000)
+
+    async def _run(self) -> None:
+        ready: list[int] = []
+        await asyncio.gather(*(self._client(ready) for _ in range(self.count)), return_exceptions=True)
+
+
+async def _drive_tui(args: argparse.Namespace, bridge: SessionBridge) -> list[float]:
+    lateness: list[float] = []
+    padding = "x" * args.payload_bytes
+    frame_interval = args.frame_ms / 1000
+    deadline = time.perf_counter() + args.seconds
+
+    async def frames() -> None:
+        next_frame = time.perf_counter()
+        while time.perf_counter() < deadline:
+            next_frame += frame_interval
+            await asyncio.sleep(max(0.0, next_frame - time.perf_counter()))
+            lateness.append(max(0.0, time.perf_counter() - next_frame) * 1000)
+            busy_until = time.perf_counter() + args.redraw_ms / 1000
+            while time.perf_counter() < busy_until:
+                pass
+
+    async def events() -> None:
+        # Events are stamped with their scheduled time, so a blocked loop shows up as latency.
+        event_interval = args.event_ms / 1000
+        scheduled = time.perf_counter()
+        while scheduled < deadline:
+            await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+            await bridge._broadcast(AssistantEvent(content=f"{scheduled}|{padding}"))
+            scheduled += event_interval
+
+    await asyncio.gather(frames(), events())
+    return lateness
+
+
+async def _run_mode(args: argparse.Namespace, threaded: bool) -> tuple[list[float], list[float]]:
+    app = create_app()
+    bridge = SessionBridge(SESSION_ID, connection_manager=ws_module.manager, attach_mode="live")
+    session_manager.sessions[SESSION_ID] = bridge
+    config = uvicorn.Config(app, host="127.0.0.1", port=args.port, log_level="warning", ws="websockets")
+
+    server_thread: ServerThread | None = None
+    server_task: asyncio.Task[None] | None = None
+    if threaded:
+        server_thread = ServerThread(config)
+        server_loop = server_thread.start()
+        bridge.bind_home_loop(asyncio.get_running_loop())
+        bridge.connection_manager = CrossLoopConnectionManager(ws_module.manager, server_loop)
+        server = server_thread.server
+    else:
+        server = uvicorn.Server(config)
+        server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    phones = PhoneClients(f"ws://127.0.0.1:{args.port}/ws/events/{SESSION_ID}?psk={os.environ['VIBECHECK_PSK']}", args.clients)
+    phones.start()
+    while not phones.connected.wait(0):
+        await asyncio.sleep(0.01)
+
+    lateness = await _drive_tui(args, bridge)
+    await asyncio.sleep(0.2)
+    phones.stop()
+
+    if server_thread is not None:
+        await asyncio.to_thread(server_thread.stop)
+    else:
+        server.should_exit = True
+        await server_task
+    session_manager.sessions.pop(SESSION_ID, None)
+    return lateness, phones.samples
+
+
+async def _main() -> None:
+    args = _parse_args()
+    for label, threaded in (("shared loop", False), ("server thread", True)):
+        terminal, phone = await _run_mode(args, threaded)
+        print(f"[{label}]")
+        print(f"  terminal frame lateness: {_summary(terminal)}")
+        print(f"  phone event latency:     {_summary(phone)}")
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("VIBECHECK_PSK", "bench-psk")
+    asyncio.run(_main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Measure event-loop lag and slow callbacks while the server does routine work.
+
+Usage:
+    PYTHONPATH=. python scripts/bench_loop_lag.py [--sessions 500] [--clients 20] [--seconds 5]
+
+Runs repeated session discovery over --sessions on-disk sessions alongside a
+steady stream of broadcasts to --clients sockets, with the loop monitor
+attached. Reports scheduling lag percentiles and the code sites behind any
+callback that blocked the loop past --slow-ms.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+import json
+from pathlib import Path
+import statistics
+import tempfile
+import time
+
+from vibecheck import ws as ws_module
+from vibecheck.bridge import SessionManager
+from vibecheck.events import AssistantEvent
+from vibecheck.loop_monitor import LoopMonitor, attributed
+
+SESSION_ID = "loop-bench"
+
+
+class _SampledMonitor(LoopMonitor):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.samples: list[float] = []
+
+    def observe(self, lag_seconds: float) -> None:
+        super().observe(lag_seconds)
+        self.samples.append(lag_seconds)
+
+
+class _NullWebSocket:
+    async def accept(self) -> None:
+        return None
+
+    async def send_json(self, payload: dict) -> None:
+        await asyncio.sleep(0)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark event-loop lag under discovery and broadcast load.")
+    parser.add_argument("--sessions", type=int, default=500, help="Sessions on disk to discover (default: 500)")
+    parser.add_argument("--clients", type=int, default=20, help="Connected clients (default: 20)")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Run time (default: 5)")
+    parser.add_argument("--slow-ms", type=float, default=50.0, help="Slow-callback threshold in ms (default: 50)")
+    return parser.parse_args()
+
+
+def _write_sessions(logs_root: Path, count: int) -> None:
+    for index in range(count):
+        session_dir = logs_root / f"session_{index:05d}"
+        session_dir.mkdir(parents=True)
+        (session_dir / "meta.json").write_text(
+            json.dumps({"session_id": f"bench-{index}", "start_time": "2026-01-01T00:00:00Z"}),
+            encoding="utf-8",
+        )
+        (session_dir / "messages.jsonl").write_text('{"role": "user"}\n' * 200, encoding="utf-8")
+
+
+async def _discover_forever(manager: SessionManager) -> None:
+    with attributed(route="GET /api/sessions"):
+        while True:
+            manager.list()
+            await asyncio.sleep(0.2)
+
+
+async def _broadcast_forever(connections: ws_module.ConnectionManager) -> None:
+    with attributed(session_id=SESSION_ID):
+        index = 0
+        while True:
+            await connections.broadcast(SESSION_ID, AssistantEvent(content=f"chunk {index} " + "x" * 512))
+            index += 1
+            await asyncio.sleep(0.001)
+
+
+async def _run(args: argparse.Namespace, logs_root: Path) -> _SampledMonitor:
+    monitor = _SampledMonitor(interval=0.01, slow_threshold=args.slow_ms / 1000)
+    connections = ws_module.ConnectionManager()
+    connections._expected_psk = "bench"
+    for _ in range(args.clients):
+        await connections.connect(_NullWebSocket(), SESSION_ID, "bench")
+    manager = SessionManager(logs_root=logs_root)
+
+    monitor.start()
+    workers = [
+        asyncio.create_task(_discover_forever(manager), name="discovery"),
+        asyncio.create_task(_broadcast_forever(connections), name="broadcast"),
+    ]
+    await asyncio.sleep(args.seconds)
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    await monitor.stop()
+    for websocket in list(connections.send_queues):
+        await connections.disconnect(websocket)
+    return monitor
+
+
+def main() -> None:
+    args = _parse_args()
+    with tempfile.TemporaryDirectory() as scratch:
+        logs_root = Path(scratch)
+        _write_sessions(logs_root, args.sessions)
+        started = time.perf_counter()
+        monitor = asyncio.run(_run(args, logs_root))
+        elapsed = time.perf_counter() - started
+
+    samples = sorted(monitor.samples) or [0.0]
+    print(f"ran {elapsed:.1f}s, {len(monitor.samples)} lag samples")
+    print(
+        f"lag p50 {statistics.median(samples) * 1000:.2f} ms  "
+        f"p99 {samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000:.2f} ms  "
+        f"max {samples[-1] * 1000:.2f} ms"
+    )
+    print(f"slow callbacks (>{args.slow_ms:.0f} ms): {monitor.slow_callbacks}")
+    sites = Counter(
+        (stall["route"] or stall["session_id"] or stall["task"], stall["stack"][-1] if stall["stack"] else "?")
+        for stall in monitor.stalls
+    )
+    for (owner, site), count in sites.most_common(5):
+        print(f"  {count:4d}  {owner}  {site}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Measure the per-event cost of metrics instrumentation on the bridge hot path.
+
+Usage:
+    PYTHONPATH=. python scripts/bench_metrics_overhead.py [--events 50000] [--repeat 5]
+
+Times SessionBridge.add_event with the real metric children and with no-op
+stand-ins, then reports the primitive costs and a full /metrics render.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from vibecheck import bridge as bridge_module
+from vibecheck.bridge import SessionBridge, session_manager
+from vibecheck.events import AssistantEvent, ToolResultEvent
+from vibecheck.metrics import MetricsRegistry, registry
+
+
+class _NullChild:
+    def inc(self, amount: float = 1.0) -> None:
+        return None
+
+    def observe(self, value: float) -> None:
+        return None
+
+    def labels(self, *values: str) -> _NullChild:
+        return self
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark metrics overhead per bridge event.")
+    parser.add_argument("--events", type=int, default=50_000, help="Events per run (default: 50000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant; best is reported (default: 5)")
+    return parser.parse_args()
+
+
+def _events(count: int) -> list:
+    return [
+        AssistantEvent(content=f"message {index}") if index % 2 else ToolResultEvent(call_id=f"tc-{index}", output="ok")
+        for index in range(count)
+    ]
+
+
+def _time_add_event(events: list) -> float:
+    bridge = SessionBridge("metrics-bench")
+    started = time.perf_counter()
+    for event in events:
+        bridge.add_event(event)
+    return (time.perf_counter() - started) / len(events) * 1e9
+
+
+def _time_bare_add_event(events: list) -> float:
+    saved = (bridge_module.EVENTS_TOTAL, bridge_module._BACKLOG_ENCODE_SECONDS, bridge_module._EVENTS_BY_TYPE)
+    bridge_module.EVENTS_TOTAL = _NullChild()
+    bridge_module._BACKLOG_ENCODE_SECONDS = _NullChild()
+    bridge_module._EVENTS_BY_TYPE = {}
+    try:
+        return _time_add_event(events)
+    finally:
+        bridge_module.EVENTS_TOTAL, bridge_module._BACKLOG_ENCODE_SECONDS, bridge_module._EVENTS_BY_TYPE = saved
+
+
+def _instrumentation(counter, histogram):
+    """The metric work add_event does per event, without the encode it wraps."""
+    children: dict[str, object] = {}
+    seq = iter(range(1 << 62))
+
+    def record() -> None:
+        if next(seq) % bridge_module.BACKLOG_ENCODE_SAMPLE_EVERY == 0:
+            started = time.perf_counter()
+            histogram.observe(time.perf_counter() - started)
+        child = children.get("assistant")
+        if child is None:
+            child = children["assistant"] = counter.labels("assistant")
+        child.inc()
+
+    return record
+
+
+def _time_primitive(label: str, operation, count: int) -> None:
+    started = time.perf_counter()
+    for _ in range(count):
+        operation()
+    print(f"  {label:<28} {(time.perf_counter() - started) / count * 1e9:8.1f} ns/op")
+
+
+def main() -> None:
+    args = _parse_args()
+    events = _events(args.events)
+
+    # Interleave the variants so warm-up, GC and frequency drift hit both alike; keep the best of each.
+    instrumented = bare = float("inf")
+    for _ in range(args.repeat):
+        instrumented = min(instrumented, _time_add_event(events))
+        bare = min(bare, _time_bare_add_event(events))
+
+    print(f"add_event without metrics: {bare:8.1f} ns/event")
+    print(f"add_event with metrics:    {instrumented:8.1f} ns/event")
+    print(f"overhead:                  {instrumented - bare:8.1f} ns/event ({(instrumented / bare - 1) * 100:.1f}%)")
+
+    scratch = MetricsRegistry()
+    counter = scratch.counter("bench", "Bench.", ("type",))
+    histogram = scratch.histogram("bench_seconds", "Bench.")
+    child = counter.labels("assistant")
+    print("primitives:")
+    _time_primitive("counter.labels(x).inc()", lambda: counter.labels("assistant").inc(), args.events)
+    _time_primitive("cached child.inc()", child.inc, args.events)
+    _time_primitive("histogram.observe()", lambda: histogram.observe(0.003), args.events)
+    _time_primitive("add_event metrics, per event", _instrumentation(counter, histogram), args.events)
+
+    for index in range(100):
+        session_manager.sessions[f"bench-{index}"] = SessionBridge(f"bench-{index}")
+    renders = [0.0] * 20
+    for attempt in range(len(renders)):
+        started = time.perf_counter()
+        body = registry.render()
+        renders[attempt] = time.perf_counter() - started
+    print(f"/metrics render with 100 sessions: {statistics.median(renders) * 1000:.2f} ms ({len(body)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
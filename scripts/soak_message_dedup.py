@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Soak SessionBridge message de-duplication and report memory over time.
+
+Usage:
+    PYTHONPATH=. python scripts/soak_message_dedup.py [--messages 1000000] [--report-every 250000]
+
+Every message id is delivered twice, once through the message observer and
+once through the event stream, to mirror a live session. Traced memory should
+stay flat once the dedup window is full.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+from vibecheck.bridge import SessionBridge
+
+
+class AssistantEvent:
+    def __init__(self, message_id: str) -> None:
+        self.message_id = message_id
+        self.content = "ok"
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Soak-test message id de-duplication memory.")
+    parser.add_argument("--messages", type=int, default=1_000_000, help="Distinct message ids (default: 1000000)")
+    parser.add_argument("--report-every", type=int, default=250_000, help="Report interval (default: 250000)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    bridge = SessionBridge("soak")
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    baseline = tracemalloc.get_traced_memory()[0]
+    print(f"{'messages':>10} {'traced KiB':>12} {'ids kept':>9} {'dupes':>6} {'elapsed s':>10}")
+    duplicates = 0
+    for index in range(1, args.messages + 1):
+        raw = AssistantEvent(f"msg-{index}")
+        if bridge._convert_vibe_event(raw) is None:
+            duplicates += 1
+        bridge._on_message_observed(raw)
+        if index % args.report_every == 0:
+            current = tracemalloc.get_traced_memory()[0] - baseline
+            print(
+                f"{index:>10} {current / 1024:>12.1f} {len(bridge._observed_message_ids):>9} "
+                f"{duplicates:>6} {time.perf_counter() - started:>10.1f}"
+            )
+    tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
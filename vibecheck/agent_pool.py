@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import logging
+import os
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from vibecheck.bridge import VibeRuntime
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_agent_pool_size() -> int:
+    configured = os.environ.get("VIBECHECK_AGENT_POOL_SIZE", "")
+    try:
+        return max(0, int(configured))
+    except ValueError:
+        return 0
+
+
+def build_agent_loop(runtime: VibeRuntime, config: object, message_observer: Callable[[object], None]) -> object:
+    try:
+        return runtime.agent_loop_cls(
+            config,
+            message_observer=message_observer,
+            enable_streaming=False,
+        )
+    except TypeError:
+        return runtime.agent_loop_cls(
+            config,
+            message_observer=message_observer,
+        )
+
+
+class ForwardingObserver:
+    """Message observer handed to pooled loops before the owning bridge is known."""
+
+    def __init__(self) -> None:
+        self.target: Callable[[object], None] | None = None
+
+    def __call__(self, message: object) -> None:
+        if self.target is not None:
+            self.target(message)
+
+
+@dataclass(slots=True)
+class PooledAgentLoop:
+    agent_loop: object
+    runtime: VibeRuntime
+    observer: ForwardingObserver
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class AgentLoopPool:
+    def __init__(
+        self,
+        size: int,
+        *,
+        runtime_loader: Callable[[], VibeRuntime],
+        max_age_seconds: float | None = None,
+    ) -> None:
+        self.size = size
+        self.runtime_loader = runtime_loader
+        self.max_age_seconds = max_age_seconds
+        self.hits = 0
+        self.misses = 0
+        self.last_error: str | None = None
+        self._idle: deque[PooledAgentLoop] = deque()
+        self._refill_task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    def acquire(self) -> PooledAgentLoop | None:
+        now = time.monotonic()
+        while self._idle:
+            pooled = self._idle.popleft()
+            if self.max_age_seconds is not None and now - pooled.created_at > self.max_age_seconds:
+                continue
+            self.hits += 1
+            self.start()
+            return pooled
+        self.misses += 1
+        self.start()
+        return None
+
+    def start(self) -> None:
+        if self.size <= 0 or len(self._idle) >= self.size:
+            return
+        if self._refill_task is not None and not self._refill_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._refill_task = loop.create_task(self._refill())
+
+    async def warm(self) -> None:
+        self.start()
+        if self._refill_task is not None:
+            await self._refill_task
+
+    async def _refill(self) -> None:
+        while len(self._idle) < self.size:
+            try:
+                # Imports and config parsing are the slow, blocking parts; keep them off the loop.
+                runtime = await asyncio.to_thread(self.runtime_loader)
+                config = await asyncio.to_thread(runtime.vibe_config_cls.load)
+                observer = ForwardingObserver()
+                agent_loop = build_agent_loop(runtime, config, observer)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.last_error = str(exc)
+                logger.warning("Failed to pre-warm AgentLoop: %s", exc)
+                return
+            self.last_error = None
+            self._idle.append(PooledAgentLoop(agent_loop=agent_loop, runtime=runtime, observer=observer))
+
+    async def close(self) -> None:
+        task = self._refill_task
+        self._refill_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._idle.clear()
+
+    def stats(self) -> dict[str, int | str | None]:
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "hits": self.hits,
+            "misses": self.misses,
+            "last_error": self.last_error,
+        }
@@ -7,19 +7,36 @@ from typing import AsyncIterator
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 
 from vibecheck.auth import PSKAuthMiddleware, load_psk
+from vibecheck.bridge import session_manager
+from vibecheck.loop_monitor import LoopAttributionMiddleware, loop_monitor
+from vibecheck.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from vibecheck.metrics import registry as metrics_registry
 from vibecheck.routes.api import router as api_router
 from vibecheck.ws import bind_session_manager
+from vibecheck.ws import manager as ws_manager
 from vibecheck.ws import router as ws_router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     app.state.bridge = None
+    if session_manager.agent_pool is not None:
+        session_manager.agent_pool.start()
+    loop_monitor.start()
+    session_manager.start_eviction_sweeps()
+    if ws_manager.overload is not None:
+        ws_manager.overload.start(ws_manager.max_queue_depth)
     yield
+    if ws_manager.overload is not None:
+        await ws_manager.overload.stop()
+    await session_manager.stop_eviction_sweeps()
+    await loop_monitor.stop()
+    if session_manager.agent_pool is not None:
+        await session_manager.agent_pool.close()
     app.state.bridge = None
 
 
@@ -48,6 +65,7 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     app.add_middleware(PSKAuthMiddleware)
+    app.add_middleware(LoopAttributionMiddleware)
 
     app.include_router(api_router)
     app.include_router(ws_router)
@@ -71,6 +89,12 @@ def create_app() -> FastAPI:
             return FileResponse(index_file)
         return JSONResponse({"name": "vibecheck", "status": "ok"})
 
+    # Deliberately behind the PSK: behind a same-host reverse proxy every client looks local.
+    # Scrapers authenticate with "Authorization: Bearer <psk>" (see README, Metrics Scraping).
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return PlainTextResponse(metrics_registry.render(), media_type=METRICS_CONTENT_TYPE)
+
     @app.get("/manifest.json", include_in_schema=False)
     async def manifest():
         return static_file(static_dir / "manifest.json")
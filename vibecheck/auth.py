@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import hmac
 import os
+from urllib.parse import parse_qsl
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 EXACT_EXEMPT_PATHS = {
     "/",
@@ -16,6 +16,46 @@ EXACT_EXEMPT_PATHS = {
 }
 PREFIX_EXEMPT_PATHS = ("/static/", "/assets/", "/icons/")
 
+PSK_HEADER = b"x-psk"
+# Standard clients such as Prometheus scrapers send the PSK as a bearer token instead.
+AUTHORIZATION_HEADER = b"authorization"
+BEARER_PREFIX = "bearer "
+_UNAUTHORIZED = JSONResponse(status_code=401, content={"detail": "Unauthorized"})
+
+
+class PrefixTrie:
+    """Path-segment trie answering "does any registered prefix cover this path?"."""
+
+    _TERMINAL = ""
+
+    def __init__(self, prefixes: tuple[str, ...] = ()) -> None:
+        self._root: dict[str, dict] = {}
+        for prefix in prefixes:
+            self.add(prefix)
+
+    def add(self, prefix: str) -> None:
+        # Prefixes end with "/", so the final split part is empty and marks the terminal node.
+        node = self._root
+        for segment in prefix.split("/")[1:-1]:
+            node = node.setdefault(segment, {})
+        node[self._TERMINAL] = {}
+
+    def matches(self, path: str) -> bool:
+        node = self._root
+        parts = path.split("/")
+        # The last part is whatever follows the final "/", which a prefix never has to match.
+        for segment in parts[1:-1]:
+            if self._TERMINAL in node:
+                return True
+            child = node.get(segment)
+            if child is None:
+                return False
+            node = child
+        return self._TERMINAL in node
+
+
+_EXEMPT_PREFIXES = PrefixTrie(PREFIX_EXEMPT_PATHS)
+
 
 def load_psk() -> str:
     psk = os.environ.get("VIBECHECK_PSK")
@@ -27,7 +67,7 @@ def load_psk() -> str:
 def is_exempt_path(path: str) -> bool:
     if path in EXACT_EXEMPT_PATHS:
         return True
-    return path.startswith(PREFIX_EXEMPT_PATHS)
+    return _EXEMPT_PREFIXES.matches(path)
 
 
 def is_psk_valid(psk: str | None, expected_psk: str) -> bool:
@@ -36,17 +76,41 @@ def is_psk_valid(psk: str | None, expected_psk: str) -> bool:
     return hmac.compare_digest(psk, expected_psk)
 
 
-class PSKAuthMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app) -> None:
-        super().__init__(app)
+def psk_from_scope(scope: Scope) -> str | None:
+    bearer: str | None = None
+    for name, value in scope["headers"]:
+        if name == PSK_HEADER and value:
+            return value.decode("latin-1")
+        if name == AUTHORIZATION_HEADER and bearer is None:
+            authorization = value.decode("latin-1")
+            if authorization[: len(BEARER_PREFIX)].lower() == BEARER_PREFIX:
+                bearer = authorization[len(BEARER_PREFIX) :].strip() or None
+    if bearer is not None:
+        return bearer
+    query_string: bytes = scope.get("query_string", b"")
+    if not query_string:
+        return None
+    provided: str | None = None
+    # Last occurrence wins, matching Starlette's QueryParams.get.
+    for key, value in parse_qsl(query_string.decode("latin-1"), keep_blank_values=True):
+        if key == "psk":
+            provided = value
+    return provided
+
+
+class PSKAuthMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
         self._expected_psk = load_psk()
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        if is_exempt_path(request.url.path):
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # WebSocket routes check the PSK themselves so they can close with a 4401 code.
+        if scope["type"] != "http" or is_exempt_path(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
-        provided_psk = request.headers.get("X-PSK") or request.query_params.get("psk")
-        if not is_psk_valid(provided_psk, self._expected_psk):
-            return JSONResponse(status_code=401, content={"detail": "Unauthorized"})
+        if not is_psk_valid(psk_from_scope(scope), self._expected_psk):
+            await _UNAUTHORIZED(scope, receive, send)
+            return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
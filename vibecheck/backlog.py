@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+import itertools
+import time
+import weakref
+
+from vibecheck.events import Event
+
+DEFAULT_SESSION_BYTES = 4 * 1024 * 1024
+DEFAULT_GLOBAL_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_EVENTS = 2000
+
+# Breaks ties between entries appended within the same monotonic clock tick.
+_append_order = itertools.count()
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    event: Event
+    size: int
+    added_at: float
+    order: int
+
+
+def encoded_size(event: Event) -> int:
+    return len(event.model_dump_json().encode("utf-8"))
+
+
+class BacklogBudget:
+    """Fleet-wide byte budget shared by every registered EventBacklog."""
+
+    def __init__(self, max_bytes: int = DEFAULT_GLOBAL_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self._backlogs: weakref.WeakSet[EventBacklog] = weakref.WeakSet()
+
+    def register(self, backlog: EventBacklog) -> None:
+        if backlog.budget is self:
+            return
+        if backlog.budget is not None:
+            backlog.budget.unregister(backlog)
+        backlog.budget = self
+        self._backlogs.add(backlog)
+        self.used_bytes += backlog.bytes_used
+
+    def unregister(self, backlog: EventBacklog) -> None:
+        if backlog.budget is not self:
+            return
+        self._backlogs.discard(backlog)
+        self.used_bytes -= backlog.bytes_used
+        backlog.budget = None
+
+    def reclaim(self) -> None:
+        if self.used_bytes <= self.max_bytes:
+            return
+        # Backlogs dropped without unregistering leave stale charges behind; recount.
+        self.used_bytes = sum(backlog.bytes_used for backlog in self._backlogs)
+        while self.used_bytes > self.max_bytes:
+            victim: EventBacklog | None = None
+            oldest = (float("inf"), 0)
+            for backlog in self._backlogs:
+                head = backlog._oldest_key()
+                if head is not None and head < oldest and len(backlog) > 1:
+                    victim = backlog
+                    oldest = head
+            if victim is None:
+                return
+            victim.evict_oldest()
+
+
+class EventBacklog:
+    def __init__(
+        self,
+        *,
+        max_bytes: int = DEFAULT_SESSION_BYTES,
+        max_events: int = DEFAULT_MAX_EVENTS,
+        max_age_seconds: float | None = None,
+        budget: BacklogBudget | None = None,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_events = max_events
+        self.max_age_seconds = max_age_seconds
+        self.bytes_used = 0
+        self.evicted_events = 0
+        self.budget: BacklogBudget | None = None
+        self._entries: deque[_Entry] = deque()
+        if budget is not None:
+            budget.register(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Event]:
+        return (entry.event for entry in self._entries)
+
+    def __reversed__(self) -> Iterator[Event]:
+        return (entry.event for entry in reversed(self._entries))
+
+    def oldest_added_at(self) -> float | None:
+        if not self._entries:
+            return None
+        return self._entries[0].added_at
+
+    def _oldest_key(self) -> tuple[float, int] | None:
+        if not self._entries:
+            return None
+        head = self._entries[0]
+        return head.added_at, head.order
+
+    def append(self, event: Event, size: int | None = None) -> None:
+        entry = _Entry(
+            event=event,
+            size=encoded_size(event) if size is None else size,
+            added_at=time.monotonic(),
+            order=next(_append_order),
+        )
+        self._entries.append(entry)
+        self._charge(entry.size)
+        self.prune(now=entry.added_at)
+        if self.budget is not None:
+            self.budget.reclaim()
+
+    def evict_oldest(self) -> None:
+        entry = self._entries.popleft()
+        self._charge(-entry.size)
+        self.evicted_events += 1
+
+    def _charge(self, size: int) -> None:
+        self.bytes_used += size
+        if self.budget is not None:
+            self.budget.used_bytes += size
+
+    def prune(self, now: float | None = None) -> None:
+        # The newest event is always retained so reconnecting clients see the latest activity.
+        while len(self._entries) > 1 and (
+            self.bytes_used > self.max_bytes or len(self._entries) > self.max_events
+        ):
+            self.evict_oldest()
+        if self.max_age_seconds is None:
+            return
+        cutoff = (time.monotonic() if now is None else now) - self.max_age_seconds
+        while len(self._entries) > 1 and self._entries[0].added_at < cutoff:
+            self.evict_oldest()
+
+    def clear(self) -> None:
+        self._charge(-self.bytes_used)
+        self._entries.clear()
+
+    def usage(self) -> dict[str, int]:
+        self.prune()
+        return {
+            "events": len(self._entries),
+            "bytes": self.bytes_used,
+            "max_bytes": self.max_bytes,
+            "max_events": self.max_events,
+            "evicted_events": self.evicted_events,
+        }
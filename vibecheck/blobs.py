@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import functools
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from typing import Any
+
+from vibecheck.events import BlobRef
+from vibecheck.projection import truncate_value
+
+DEFAULT_INLINE_THRESHOLD = 4 * 1024
+DEFAULT_PREVIEW_CHARS = 512
+DEFAULT_MEMORY_BUDGET = 32 * 1024 * 1024
+DEFAULT_DISK_BUDGET = 512 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class BlobInfo:
+    size: int
+    media_type: str
+
+
+def _write_spill(path: Path, data: bytes) -> bool:
+    try:
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+    except OSError:
+        logger.exception("Failed to spill blob %s to disk; dropping it", path.name)
+        return False
+    return True
+
+
+def _unlink_quietly(path: Path) -> None:
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+class BlobStore:
+    """Content-addressed payloads kept in an LRU memory tier that spills to disk.
+
+    Inside an event loop, spill writes, unlinks and disk reads (``aget``) run on a
+    single I/O thread so they stay ordered; a temporary spill directory is removed
+    by ``close()`` or at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        *,
+        inline_threshold: int = DEFAULT_INLINE_THRESHOLD,
+        preview_chars: int = DEFAULT_PREVIEW_CHARS,
+        memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET,
+        disk_budget_bytes: int = DEFAULT_DISK_BUDGET,
+        spill_dir: Path | None = None,
+    ) -> None:
+        self.inline_threshold = inline_threshold
+        self.preview_chars = preview_chars
+        self.memory_budget_bytes = memory_budget_bytes
+        self.disk_budget_bytes = disk_budget_bytes
+        self._spill_dir = spill_dir
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: OrderedDict[str, int] = OrderedDict()
+        self._disk_bytes = 0
+        # Spilled payloads whose background write has not finished yet.
+        self._spilling: dict[str, bytes] = {}
+        self._info: dict[str, BlobInfo] = {}
+        self._owns_spill_dir = False
+        self._io: ThreadPoolExecutor | None = None
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._memory_bytes
+
+    @property
+    def disk_bytes(self) -> int:
+        return self._disk_bytes
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self._info
+
+    def __len__(self) -> int:
+        return len(self._info)
+
+    def _resolve_spill_dir(self) -> Path:
+        if self._spill_dir is None:
+            configured = os.environ.get("VIBECHECK_BLOB_DIR")
+            if configured:
+                self._spill_dir = Path(configured).expanduser()
+            else:
+                self._spill_dir = Path(tempfile.mkdtemp(prefix="vibecheck-blobs-"))
+                self._owns_spill_dir = True
+                atexit.register(self.close)
+        return self._spill_dir
+
+    def _blob_path(self, digest: str) -> Path:
+        return self._resolve_spill_dir() / digest[:2] / digest
+
+    def info(self, digest: str) -> BlobInfo | None:
+        return self._info.get(digest)
+
+    def put(self, data: bytes, media_type: str = "application/octet-stream") -> BlobRef:
+        digest = hashlib.sha256(data).hexdigest()
+        if digest in self._memory:
+            self._memory.move_to_end(digest)
+        elif digest in self._disk:
+            self._disk.move_to_end(digest)
+        else:
+            self._info[digest] = BlobInfo(size=len(data), media_type=media_type)
+            self._remember(digest, data)
+        return BlobRef(hash=digest, size=len(data), media_type=self._info[digest].media_type)
+
+    def _cached(self, digest: str) -> bytes | None:
+        data = self._memory.get(digest)
+        if data is not None:
+            self._memory.move_to_end(digest)
+            return data
+        return self._spilling.get(digest)
+
+    def get(self, digest: str) -> bytes | None:
+        data = self._cached(digest)
+        if data is not None or digest not in self._disk:
+            return data
+        try:
+            data = self._blob_path(digest).read_bytes()
+        except OSError:
+            data = None
+        return self._reloaded(digest, data)
+
+    async def aget(self, digest: str) -> bytes | None:
+        """``get`` with disk reads moved to the store's I/O thread."""
+        data = self._cached(digest)
+        if data is not None or digest not in self._disk:
+            return data
+        path = self._blob_path(digest)
+        try:
+            data = await asyncio.get_running_loop().run_in_executor(self._io_executor(), path.read_bytes)
+        except OSError:
+            data = None
+        return self._reloaded(digest, data)
+
+    def _reloaded(self, digest: str, data: bytes | None) -> bytes | None:
+        if data is None:
+            if digest in self._disk:
+                logger.warning("Spilled blob %s is missing from disk", digest)
+                self._forget_disk(digest)
+                self._info.pop(digest, None)
+            return None
+        if digest in self._info and digest not in self._memory:
+            self._remember(digest, data)
+        return data
+
+    def _remember(self, digest: str, data: bytes) -> None:
+        self._memory[digest] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.memory_budget_bytes and self._memory:
+            evicted, payload = self._memory.popitem(last=False)
+            self._memory_bytes -= len(payload)
+            self._spill(evicted, payload)
+
+    def _io_executor(self) -> ThreadPoolExecutor:
+        if self._io is None:
+            self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vibecheck-blobs")
+        return self._io
+
+    def _spill(self, digest: str, data: bytes) -> None:
+        if digest in self._disk:
+            self._disk.move_to_end(digest)
+            return
+        path = self._blob_path(digest)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None:
+            if not _write_spill(path, data):
+                self._info.pop(digest, None)
+                return
+        else:
+            self._spilling[digest] = data
+            written = loop.run_in_executor(self._io_executor(), _write_spill, path, data)
+            written.add_done_callback(functools.partial(self._spill_written, digest))
+        self._disk[digest] = len(data)
+        self._disk_bytes += len(data)
+        while self._disk_bytes > self.disk_budget_bytes and self._disk:
+            oldest = next(iter(self._disk))
+            self._forget_disk(oldest, unlink=True)
+            if oldest not in self._memory:
+                self._info.pop(oldest, None)
+
+    def _spill_written(self, digest: str, written: asyncio.Future[bool]) -> None:
+        if self._spilling.pop(digest, None) is None:
+            return
+        if written.cancelled() or written.exception() is not None or not written.result():
+            self._forget_disk(digest)
+            if digest not in self._memory:
+                self._info.pop(digest, None)
+
+    def _forget_disk(self, digest: str, *, unlink: bool = False) -> None:
+        self._spilling.pop(digest, None)
+        size = self._disk.pop(digest, None)
+        if size is None:
+            return
+        self._disk_bytes -= size
+        if not unlink:
+            return
+        path = self._blob_path(digest)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            _unlink_quietly(path)
+            return
+        # Queued behind any pending write of the same blob on the single I/O thread.
+        loop.run_in_executor(self._io_executor(), _unlink_quietly, path)
+
+    def close(self) -> None:
+        """Finish pending disk I/O, forget spilled blobs and remove a temporary spill directory."""
+        if self._io is not None:
+            self._io.shutdown(wait=True)
+            self._io = None
+        for digest in list(self._disk):
+            if digest not in self._memory:
+                self._info.pop(digest, None)
+        self._disk.clear()
+        self._disk_bytes = 0
+        self._spilling.clear()
+        if self._owns_spill_dir and self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+            self._owns_spill_dir = False
+            atexit.unregister(self.close)
+
+    def externalize_text(self, text: str) -> tuple[str, BlobRef | None]:
+        if len(text) <= self.inline_threshold:
+            return text, None
+        encoded = text.encode("utf-8")
+        if len(encoded) <= self.inline_threshold:
+            return text, None
+        ref = self.put(encoded, media_type="text/plain; charset=utf-8")
+        return text[: self.preview_chars], ref
+
+    def externalize_args(self, args: dict[str, Any]) -> tuple[dict[str, Any], BlobRef | None]:
+        encoded = json.dumps(args, ensure_ascii=False, default=str).encode("utf-8")
+        if len(encoded) <= self.inline_threshold:
+            return args, None
+        ref = self.put(encoded, media_type="application/json")
+        preview, _ = truncate_value(args, self.preview_chars)
+        return preview, ref
+
+
+blob_store = BlobStore()
@@ -1,37 +1,94 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 import inspect
 from importlib import import_module
 import json
 import logging
-from collections import deque
+import os
 from pathlib import Path
 import sys
-from typing import Any, Callable, Literal
+import time
+from typing import Any, Callable, Literal, TypeVar
 from uuid import uuid4
-
+import weakref
+
+from vibecheck.agent_pool import AgentLoopPool, build_agent_loop, resolve_agent_pool_size
+from vibecheck.backlog import (
+    DEFAULT_GLOBAL_BYTES,
+    DEFAULT_SESSION_BYTES,
+    BacklogBudget,
+    EventBacklog,
+)
+from vibecheck.blobs import BlobStore, blob_store as default_blob_store
+from vibecheck.dedup import RecentIds
 from vibecheck.events import (
     ApprovalRequestEvent,
     ApprovalResolutionEvent,
     AssistantEvent,
     Event,
+    EventAdapter,
     InputRequestEvent,
     InputResolutionEvent,
+    SnapshotEvent,
     StateChangeEvent,
     ToolCallEvent,
     ToolResultEvent,
     UserMessageEvent,
 )
+from vibecheck.injections import InjectionAudit
+from vibecheck.journal import RetentionPolicy, SessionJournal, read_journal_blob, safe_session_dirname
+from vibecheck.listeners import DEFAULT_LISTENER_TIMEOUT_SECONDS, ListenerMode, ListenerRegistry
+from vibecheck.loop_monitor import attributed
+from vibecheck.memory import SizeWalker
+from vibecheck.message_queue import MessageQueue, QueuedMessage, resolve_message_coalescing
+from vibecheck.metrics import registry as metrics
+from vibecheck.snapshot import DEFAULT_SNAPSHOT_REBUILD_EVENTS, SessionSnapshot, rebuild_snapshot
+from vibecheck.tracing import Trace, Tracer, current_trace, tracer
+from vibecheck.worker import SessionWorker
 
 BridgeState = Literal["idle", "running", "waiting_approval", "waiting_input", "disconnected"]
 AttachMode = Literal["live", "replay", "observe_only", "managed"]
+ExecutionMode = Literal["inline", "process"]
 EventListener = Callable[[Event], object]
 RawEventListener = Callable[[object], object]
 
+T = TypeVar("T")
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_SESSION_IDLE_TTL_SECONDS = 900.0
+DEFAULT_MAX_RESIDENT_SESSIONS = 128
+DEFAULT_EVICTION_SWEEP_SECONDS = 60.0
+DEFAULT_EVICTED_SUMMARIES = 4096
+# Closed journals of sessions that are not resident, kept so their indexes are not rebuilt.
+DEFAULT_IDLE_JOURNALS = 16
+
+EVENTS_TOTAL = metrics.counter("vibecheck_events_total", "Events recorded by session bridges, by type.", ("type",))
+EVENT_ENCODE_SECONDS = metrics.histogram(
+    "vibecheck_event_encode_seconds",
+    "Time spent JSON-encoding an event, by stage.",
+    ("stage",),
+)
+PROMPT_ROUND_TRIP_SECONDS = metrics.histogram(
+    "vibecheck_prompt_round_trip_seconds",
+    "Time from an approval or input request until it is answered.",
+    ("kind",),
+)
+DISCOVERY_SCAN_SECONDS = metrics.histogram(
+    "vibecheck_discovery_scan_seconds",
+    "Duration of a session log discovery scan.",
+)
+_BACKLOG_ENCODE_SECONDS = EVENT_ENCODE_SECONDS.labels("backlog")
+# Per-type children of EVENTS_TOTAL, filled on first use so add_event skips the label lookup.
+_EVENTS_BY_TYPE: dict[str, Any] = {}
+# add_event times one backlog encode in this many; the histogram is a sample, the counter is exact.
+BACKLOG_ENCODE_SAMPLE_EVERY = 16
+_APPROVAL_ROUND_TRIP_SECONDS = PROMPT_ROUND_TRIP_SECONDS.labels("approval")
+_INPUT_ROUND_TRIP_SECONDS = PROMPT_ROUND_TRIP_SECONDS.labels("input")
+
 
 @dataclass(frozen=True, slots=True)
 class VibeRuntime:
@@ -77,43 +134,161 @@ def load_vibe_runtime() -> VibeRuntime:
     )
 
 
+def _find_callback_owner(callback: object, pending_attr: str) -> object | None:
+    visited: set[int] = set()
+    to_visit: list[object] = [callback]
+    while to_visit:
+        current = to_visit.pop()
+        current_id = id(current)
+        if current_id in visited:
+            continue
+        visited.add(current_id)
+
+        owner = getattr(current, "__self__", None)
+        if owner is not None and hasattr(owner, pending_attr):
+            return owner
+
+        if hasattr(current, pending_attr):
+            return current
+
+        for attr_name in ("__wrapped__", "__func__", "func"):
+            nested = getattr(current, attr_name, None)
+            if nested is not None and nested is not current:
+                to_visit.append(nested)
+
+        partial_args = getattr(current, "args", None)
+        if isinstance(partial_args, tuple):
+            to_visit.extend(item for item in partial_args if item is not current)
+
+        partial_keywords = getattr(current, "keywords", None)
+        if isinstance(partial_keywords, dict):
+            to_visit.extend(
+                item for item in partial_keywords.values() if item is not current
+            )
+
+        closure = getattr(current, "__closure__", None)
+        if isinstance(closure, tuple):
+            for cell in closure:
+                try:
+                    value = cell.cell_contents
+                except ValueError:
+                    continue
+                if value is current:
+                    continue
+                if hasattr(value, pending_attr):
+                    return value
+                if callable(value):
+                    to_visit.append(value)
+
+    return None
+
+
+async def _call_and_await(callback: Callable[..., object], args: tuple[object, ...]) -> Any:
+    result = callback(*args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def _run_on_loop(
+    loop: asyncio.AbstractEventLoop | None, callback: Callable[..., T], args: tuple[object, ...]
+) -> T:
+    """Run ``callback`` on ``loop`` (or here when unbound) and await its result from the running loop."""
+    call = _call_and_await(callback, args)
+    running = asyncio.get_running_loop()
+    if loop is None or loop is running or loop.is_closed():
+        return await call
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(call, loop), loop=running)
+
+
+VibeEventConverter = Callable[["SessionBridge", object], Event | None]
+
+# Resolved once per concrete AgentLoop event class; None marks classes we ignore.
+_VIBE_EVENT_CONVERTERS: dict[type, VibeEventConverter | None] = {}
+
+
+def _resolve_vibe_event_converter(event_cls: type) -> VibeEventConverter | None:
+    kind = event_cls.__name__
+    if kind.endswith("UserMessageEvent"):
+        return SessionBridge._convert_user_message
+    if kind.endswith("AssistantEvent"):
+        return SessionBridge._convert_assistant
+    if kind.endswith("ToolCallEvent"):
+        return SessionBridge._convert_tool_call
+    if kind.endswith("ToolResultEvent"):
+        return SessionBridge._convert_tool_result
+    return None
+
+
 class SessionBridge:
     def __init__(
         self,
         session_id: str,
         connection_manager=None,
         attach_mode: AttachMode = "managed",
+        blob_store: BlobStore | None = None,
+        journal: SessionJournal | None = None,
+        backlog: EventBacklog | None = None,
+        agent_pool: AgentLoopPool | None = None,
+        execution_mode: ExecutionMode = "inline",
+        coalesce_messages: bool | None = None,
+        snapshot: SessionSnapshot | None = None,
     ) -> None:
         self.session_id = session_id
         self.state: BridgeState = "idle"
         self.attach_mode: AttachMode = attach_mode
+        self.last_active = time.monotonic()
         self.pending_approval: dict[str, asyncio.Future] = {}
         self.pending_input: dict[str, asyncio.Future] = {}
         self.pending_approval_context: dict[str, dict[str, object]] = {}
         self.pending_input_context: dict[str, dict[str, object]] = {}
-        self.event_backlog: deque[Event] = deque(maxlen=50)
+        self.event_backlog = backlog if backlog is not None else EventBacklog()
+        self.journal = journal
+        self.event_seq = journal.last_seq if journal is not None else 0
+        self.snapshot = snapshot if snapshot is not None else self._rebuild_snapshot()
         self.connection_manager = connection_manager
-        self.messages_to_inject: list[str] = []
-        self._event_listeners: set[EventListener] = set()
-        self._raw_event_listeners: set[RawEventListener] = set()
+        self.blob_store = blob_store if blob_store is not None else default_blob_store
+        self.agent_pool = agent_pool
+        self.execution_mode: ExecutionMode = execution_mode
+        self.worker: SessionWorker | None = None
+        self._worker_idle = asyncio.Event()
+        self._home_loop: asyncio.AbstractEventLoop | None = None
+        self.injections = InjectionAudit()
+        # Ids sent to the session worker whose turns have not finished, oldest first.
+        self._worker_injections: deque[str] = deque()
+        self._event_listeners = ListenerRegistry("Bridge event")
+        self._raw_event_listeners = ListenerRegistry("Bridge raw event")
 
         self._background_tasks: set[asyncio.Task[object]] = set()
-        self._message_queue: asyncio.Queue[str] = asyncio.Queue()
+        self._message_queue = MessageQueue(
+            coalesce=resolve_message_coalescing() if coalesce_messages is None else coalesce_messages
+        )
         self._message_worker_task: asyncio.Task[None] | None = None
+        self._current_turn: asyncio.Task[bool] | None = None
+        self.interrupts = 0
         self._run_lock = asyncio.Lock()
         self._agent_loop: object | None = None
         self._vibe_runtime: VibeRuntime | None = None
-        self._observed_message_ids: set[str] = set()
+        # Both the message observer and the event stream report the same ids moments apart,
+        # so a bounded window is enough to de-duplicate them.
+        self._observed_message_ids = RecentIds()
         self._message_observer_hooked = False
         self._local_approval_callback: Callable[[str, object, str], object] | None = None
         self._local_input_callback: Callable[[object], object] | None = None
         self._local_approval_owner: object | None = None
         self._local_input_owner: object | None = None
+        # pending_attr -> (callback ref, owner ref); weak so closed TUI apps can be collected.
+        self._callback_owner_cache: dict[str, tuple[weakref.ref, weakref.ref]] = {}
 
     @property
     def controllable(self) -> bool:
         return self.attach_mode != "observe_only"
 
+    @property
+    def messages_to_inject(self) -> list[str]:
+        """Recently injected prompts, oldest first (possibly truncated); see ``injections``."""
+        return [entry.content for entry in self.injections]
+
     @property
     def local_approval_callback(self) -> Callable[[str, object, str], object] | None:
         return self._local_approval_callback
@@ -122,24 +297,77 @@ class SessionBridge:
     def local_input_callback(self) -> Callable[[object], object] | None:
         return self._local_input_callback
 
-    def add_event_listener(self, listener: EventListener) -> None:
-        self._event_listeners.add(listener)
+    def add_event_listener(
+        self,
+        listener: EventListener,
+        *,
+        mode: ListenerMode | None = None,
+        timeout: float | None = DEFAULT_LISTENER_TIMEOUT_SECONDS,
+    ) -> None:
+        """Register ``listener``; coroutine functions default to the queued "slow" mode."""
+        self._event_listeners.add(listener, mode=mode, timeout=timeout)
 
     def remove_event_listener(self, listener: EventListener) -> None:
         self._event_listeners.discard(listener)
 
-    def add_raw_event_listener(self, listener: RawEventListener) -> None:
-        self._raw_event_listeners.add(listener)
+    def add_raw_event_listener(
+        self,
+        listener: RawEventListener,
+        *,
+        mode: ListenerMode | None = None,
+        timeout: float | None = DEFAULT_LISTENER_TIMEOUT_SECONDS,
+    ) -> None:
+        self._raw_event_listeners.add(listener, mode=mode, timeout=timeout)
 
     def remove_raw_event_listener(self, listener: RawEventListener) -> None:
         self._raw_event_listeners.discard(listener)
 
+    def memory_usage(self) -> dict[str, object]:
+        """Approximate retained bytes per bridge structure; objects shared between them count once.
+
+        Queued messages reach the process-wide tracer through their traces, so traces are
+        left out rather than charging every session for the tracer's shared buffers.
+        """
+        walker = SizeWalker(skip_types=(Trace, Tracer))
+        structures = {
+            "backlog": sum(walker.sizeof(event) for event in self.event_backlog),
+            "pending_approval_context": walker.sizeof(self.pending_approval_context),
+            "pending_input_context": walker.sizeof(self.pending_input_context),
+            "pending_futures": walker.sizeof(self.pending_approval) + walker.sizeof(self.pending_input),
+            "injections": walker.sizeof(self.injections),
+            "message_queue": walker.sizeof(list(self._message_queue)),
+            "observed_message_ids": walker.sizeof(self._observed_message_ids),
+            "snapshot": walker.sizeof(self.snapshot),
+            "listener_queues": walker.sizeof(self._event_listeners) + walker.sizeof(self._raw_event_listeners),
+        }
+        return {
+            "total_bytes": sum(structures.values()),
+            "structures": structures,
+            "truncated": walker.truncated,
+        }
+
+    def bind_home_loop(self, loop: asyncio.AbstractEventLoop | None) -> None:
+        self._home_loop = loop
+
+    async def on_home_loop(self, callback: Callable[..., T], *args: object) -> T:
+        """Run ``callback`` (awaiting its result if needed) on the bridge's loop and return the result.
+
+        The API and WebSocket handlers read bridge state and resolve approvals, inputs,
+        messages and interrupts through this so that, with the server on its own thread,
+        they never touch structures the TUI loop is mutating and see the real outcome.
+        """
+        return await _run_on_loop(self._home_loop, callback, args)
+
     def configure_local_callbacks(
         self,
         *,
         approval_callback: Callable[[str, object, str], object] | None,
         input_callback: Callable[[object], object] | None,
     ) -> None:
+        if approval_callback is not self._local_approval_callback:
+            self._callback_owner_cache.pop("_pending_approval", None)
+        if input_callback is not self._local_input_callback:
+            self._callback_owner_cache.pop("_pending_question", None)
         self._local_approval_callback = approval_callback
         self._local_input_callback = input_callback
         self._local_approval_owner = self._resolve_callback_owner(
@@ -163,52 +391,23 @@ class SessionBridge:
         if not callable(callback):
             return None
 
-        visited: set[int] = set()
-        to_visit: list[object] = [callback]
-        while to_visit:
-            current = to_visit.pop()
-            current_id = id(current)
-            if current_id in visited:
-                continue
-            visited.add(current_id)
-
-            owner = getattr(current, "__self__", None)
-            if owner is not None and hasattr(owner, pending_attr):
+        cached = self._callback_owner_cache.get(pending_attr)
+        if cached is not None:
+            callback_ref, owner_ref = cached
+            owner = owner_ref()
+            if callback_ref() is callback and owner is not None:
                 return owner
+            del self._callback_owner_cache[pending_attr]
 
-            if hasattr(current, pending_attr):
-                return current
-
-            for attr_name in ("__wrapped__", "__func__", "func"):
-                nested = getattr(current, attr_name, None)
-                if nested is not None and nested is not current:
-                    to_visit.append(nested)
-
-            partial_args = getattr(current, "args", None)
-            if isinstance(partial_args, tuple):
-                to_visit.extend(item for item in partial_args if item is not current)
-
-            partial_keywords = getattr(current, "keywords", None)
-            if isinstance(partial_keywords, dict):
-                to_visit.extend(
-                    item for item in partial_keywords.values() if item is not current
-                )
-
-            closure = getattr(current, "__closure__", None)
-            if isinstance(closure, tuple):
-                for cell in closure:
-                    try:
-                        value = cell.cell_contents
-                    except ValueError:
-                        continue
-                    if value is current:
-                        continue
-                    if hasattr(value, pending_attr):
-                        return value
-                    if callable(value):
-                        to_visit.append(value)
-
-        return fallback_owner
+        owner = _find_callback_owner(callback, pending_attr)
+        if owner is None:
+            return fallback_owner
+        try:
+            self._callback_owner_cache[pending_attr] = (weakref.ref(callback), weakref.ref(owner))
+        except TypeError:
+            # Some builtins and slotted objects cannot be weakly referenced; resolve them each time.
+            pass
+        return owner
 
     def _local_owner_for_settle(
         self,
@@ -232,14 +431,15 @@ class SessionBridge:
             )
         return owner
 
+    def listener_stats(self) -> dict[str, list[dict[str, object]]]:
+        return {
+            "event": self._event_listeners.stats(),
+            "raw_event": self._raw_event_listeners.stats(),
+        }
+
     async def _notify_event_listeners(self, event: Event) -> None:
-        for listener in list(self._event_listeners):
-            try:
-                result = listener(event)
-                if inspect.isawaitable(result):
-                    await result
-            except Exception:
-                logger.exception("Bridge event listener failed for session %s", self.session_id)
+        if self._event_listeners:
+            await self._event_listeners.dispatch(event)
 
     def _notify_event_listeners_background(self, event: Event) -> None:
         if not self._event_listeners:
@@ -248,36 +448,35 @@ class SessionBridge:
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
-            for listener in list(self._event_listeners):
-                try:
-                    result = listener(event)
-                    if inspect.isawaitable(result):
-                        continue
-                except Exception:
-                    logger.exception(
-                        "Bridge event listener failed outside running loop for session %s",
-                        self.session_id,
-                    )
+            self._event_listeners.dispatch_without_loop(event)
             return
 
         task = loop.create_task(self._notify_event_listeners(event))
         self._track_task(task)
 
     async def _notify_raw_event_listeners(self, event: object) -> None:
-        for listener in list(self._raw_event_listeners):
-            try:
-                result = listener(event)
-                if inspect.isawaitable(result):
-                    await result
-            except Exception:
-                logger.exception("Bridge raw event listener failed for session %s", self.session_id)
+        if self._raw_event_listeners:
+            await self._raw_event_listeners.dispatch(event)
 
     async def _broadcast(self, event: Event) -> None:
+        trace = current_trace.get()
+        if trace is not None:
+            await self._broadcast_traced(event, trace)
+            return
         self.add_event(event)
         await self._notify_event_listeners(event)
         if self.connection_manager:
             await self.connection_manager.broadcast(self.session_id, event)
 
+    async def _broadcast_traced(self, event: Event, trace: Trace) -> None:
+        with trace.span("record"):
+            self.add_event(event)
+        with trace.span("listeners"):
+            await self._notify_event_listeners(event)
+        if self.connection_manager:
+            with trace.span("fanout"):
+                await self.connection_manager.broadcast(self.session_id, event)
+
     def _track_task(self, task: asyncio.Task[object]) -> None:
         self._background_tasks.add(task)
         task.add_done_callback(self._background_tasks.discard)
@@ -294,12 +493,108 @@ class SessionBridge:
         task = loop.create_task(self.connection_manager.broadcast(self.session_id, event))
         self._track_task(task)
 
+    def set_journal(self, journal: SessionJournal | None) -> None:
+        if self.journal is not None and self.journal is not journal:
+            self.journal.close()
+        self.journal = journal
+        if journal is not None and journal.last_seq > self.event_seq:
+            self.event_seq = journal.last_seq
+            self.snapshot = self._rebuild_snapshot()
+
+    def _rebuild_snapshot(self) -> SessionSnapshot:
+        records = self.history(after_seq=max(0, self.event_seq - DEFAULT_SNAPSHOT_REBUILD_EVENTS))
+        return rebuild_snapshot(records, self.event_seq)
+
     def add_event(self, event: Event) -> None:
-        self.event_backlog.append(event)
+        self.last_active = time.monotonic()
+        if self.event_seq % BACKLOG_ENCODE_SAMPLE_EVERY:
+            encoded = event.model_dump_json().encode("utf-8")
+        else:
+            started = time.perf_counter()
+            encoded = event.model_dump_json().encode("utf-8")
+            _BACKLOG_ENCODE_SECONDS.observe(time.perf_counter() - started)
+        counter = _EVENTS_BY_TYPE.get(event.type)
+        if counter is None:
+            counter = _EVENTS_BY_TYPE[event.type] = EVENTS_TOTAL.labels(event.type)
+        counter.inc()
+        self.event_backlog.append(event, size=len(encoded))
+        if self.journal is None:
+            self.event_seq += 1
+        else:
+            try:
+                self.event_seq = self.journal.append(event, encoded=encoded)
+            except OSError:
+                logger.exception("Failed to journal event for session %s", self.session_id)
+                self.event_seq += 1
+            self._journal_blobs(event)
+        self.snapshot.apply(event, self.event_seq)
+
+    def _journal_blobs(self, event: Event) -> None:
+        # The shared blob store forgets everything on restart; the journal keeps what its records reference.
+        for ref in (getattr(event, "args_ref", None), getattr(event, "output_ref", None)):
+            if ref is None:
+                continue
+            data = self.blob_store.get(ref.hash)
+            if data is not None:
+                self.journal.keep_blob(ref, data)
+
+    def snapshot_event(self) -> SnapshotEvent:
+        return self.snapshot.to_event(
+            session_id=self.session_id,
+            state=self.state,
+            attach_mode=self.attach_mode,
+            controllable=self.controllable,
+            open_approvals=self.pending_approval,
+            open_inputs=self.pending_input,
+        )
+
+    def _backlog_needs_journal(self, limit: int) -> bool:
+        # The in-memory tail is short (e.g. after a restart); fill from the journal.
+        return (
+            self.journal is not None
+            and len(self.event_backlog) < limit
+            and self.journal.last_seq > len(self.event_backlog)
+        )
 
     def backlog(self, limit: int = 50) -> list[Event]:
+        if self._backlog_needs_journal(limit):
+            return [event for _seq, event in self.journal.tail(limit)]
+        return list(self.event_backlog)[-limit:]
+
+    async def abacklog(self, limit: int = 50) -> list[Event]:
+        """``backlog`` with any journal read done on a worker thread."""
+        if self._backlog_needs_journal(limit):
+            return [event for _seq, event in await self.journal.atail(limit)]
         return list(self.event_backlog)[-limit:]
 
+    def history(self, after_seq: int = 0, limit: int | None = None) -> list[tuple[int, Event]]:
+        if self.journal is not None:
+            return self.journal.read(after_seq=after_seq, limit=limit)
+        return self._backlog_history(after_seq, limit)
+
+    async def ahistory(self, after_seq: int = 0, limit: int | None = None) -> list[tuple[int, Event]]:
+        """``history`` with any journal read done on a worker thread."""
+        if self.journal is not None:
+            return await self.journal.aread(after_seq=after_seq, limit=limit)
+        return self._backlog_history(after_seq, limit)
+
+    def _backlog_history(self, after_seq: int, limit: int | None) -> list[tuple[int, Event]]:
+        first_seq = self.event_seq - len(self.event_backlog) + 1
+        records = [
+            (first_seq + index, event)
+            for index, event in enumerate(self.event_backlog)
+            if first_seq + index > after_seq
+        ]
+        return records if limit is None else records[:limit]
+
+    async def find_event(self, event_id: str) -> Event | None:
+        for event in reversed(self.event_backlog):
+            if event.id == event_id:
+                return event
+        if self.journal is not None:
+            return await self.journal.afind(event_id)
+        return None
+
     def _set_state(self, state: BridgeState) -> None:
         if self.state == state:
             return
@@ -320,9 +615,14 @@ class SessionBridge:
         *,
         local_args: object | None = None,
     ) -> dict:
+        requested_at = time.perf_counter()
         future: asyncio.Future = asyncio.get_running_loop().create_future()
         self.pending_approval[call_id] = future
-        self.pending_approval_context[call_id] = {"tool_name": tool_name, "args": args}
+        preview_args, args_ref = self.blob_store.externalize_args(args)
+        context: dict[str, object] = {"tool_name": tool_name, "args": preview_args}
+        if args_ref is not None:
+            context["args_ref"] = args_ref.model_dump(mode="json")
+        self.pending_approval_context[call_id] = context
         if self._local_approval_callback is not None:
             self._track_task(
                 asyncio.create_task(
@@ -334,8 +634,20 @@ class SessionBridge:
                 )
             )
         self._set_state("waiting_approval")
-        await self._broadcast(ApprovalRequestEvent(call_id=call_id, tool_name=tool_name, args=args))
+        await self._broadcast(
+            ApprovalRequestEvent(
+                call_id=call_id,
+                tool_name=tool_name,
+                args=preview_args,
+                args_ref=args_ref,
+            )
+        )
+        waiting_since = time.perf_counter()
         result = await future
+        _APPROVAL_ROUND_TRIP_SECONDS.observe(time.perf_counter() - requested_at)
+        trace = current_trace.get()
+        if trace is not None:
+            trace.record("approval_wait", waiting_since)
         return result
 
     def resolve_approval(self, call_id: str, approved: bool, edited_args: dict | None = None) -> bool:
@@ -360,6 +672,7 @@ class SessionBridge:
         *,
         local_args: object | None = None,
     ) -> str:
+        requested_at = time.perf_counter()
         future: asyncio.Future = asyncio.get_running_loop().create_future()
         self.pending_input[request_id] = future
         self.pending_input_context[request_id] = {
@@ -379,7 +692,12 @@ class SessionBridge:
         await self._broadcast(
             InputRequestEvent(request_id=request_id, question=question, options=options or [])
         )
+        waiting_since = time.perf_counter()
         result = await future
+        _INPUT_ROUND_TRIP_SECONDS.observe(time.perf_counter() - requested_at)
+        trace = current_trace.get()
+        if trace is not None:
+            trace.record("input_wait", waiting_since)
         return result
 
     def resolve_input(self, request_id: str, response: str) -> bool:
@@ -666,10 +984,8 @@ class SessionBridge:
 
     def _on_message_observed(self, message: object) -> None:
         message_id = getattr(message, "message_id", None)
-        if isinstance(message_id, str):
-            if message_id in self._observed_message_ids:
-                return
-            self._observed_message_ids.add(message_id)
+        if isinstance(message_id, str) and not self._observed_message_ids.add(message_id):
+            return
 
         role = getattr(message, "role", None)
         role_value = getattr(role, "value", role)
@@ -683,49 +999,70 @@ class SessionBridge:
             self._broadcast_background(UserMessageEvent(content=content))
 
     def _convert_vibe_event(self, raw_event: object) -> Event | None:
-        kind = raw_event.__class__.__name__
-
-        if kind.endswith("UserMessageEvent"):
-            message_id = getattr(raw_event, "message_id", None)
-            if isinstance(message_id, str):
-                if message_id in self._observed_message_ids:
-                    return None
-                self._observed_message_ids.add(message_id)
-            content = getattr(raw_event, "content", "")
-            return UserMessageEvent(content=str(content))
-
-        if kind.endswith("AssistantEvent"):
-            message_id = getattr(raw_event, "message_id", None)
-            if isinstance(message_id, str):
-                if message_id in self._observed_message_ids:
-                    return None
-                self._observed_message_ids.add(message_id)
-            content = getattr(raw_event, "content", "")
-            return AssistantEvent(content=str(content))
-
-        if kind.endswith("ToolCallEvent"):
-            return ToolCallEvent(
-                tool_name=str(getattr(raw_event, "tool_name", "tool")),
-                args=self._message_to_dict(getattr(raw_event, "args", {})),
-                call_id=str(getattr(raw_event, "tool_call_id", "")),
-            )
+        event_cls = raw_event.__class__
+        try:
+            converter = _VIBE_EVENT_CONVERTERS[event_cls]
+        except KeyError:
+            converter = _resolve_vibe_event_converter(event_cls)
+            _VIBE_EVENT_CONVERTERS[event_cls] = converter
+        if converter is None:
+            return None
+        return converter(self, raw_event)
 
-        if kind.endswith("ToolResultEvent"):
-            call_id = str(getattr(raw_event, "tool_call_id", ""))
-            error = getattr(raw_event, "error", None)
-            if isinstance(error, str) and error:
-                return ToolResultEvent(call_id=call_id, output=error, is_error=True)
-
-            result = getattr(raw_event, "result", None)
-            if hasattr(result, "model_dump"):
-                output = json.dumps(result.model_dump(mode="json"), ensure_ascii=True)
-            elif result is None:
-                output = ""
-            else:
-                output = str(result)
-            return ToolResultEvent(call_id=call_id, output=output, is_error=False)
+    def _convert_user_message(self, raw_event: object) -> Event | None:
+        message_id = getattr(raw_event, "message_id", None)
+        if isinstance(message_id, str) and not self._observed_message_ids.add(message_id):
+            return None
+        content = getattr(raw_event, "content", "")
+        return UserMessageEvent(content=str(content))
 
-        return None
+    def _convert_assistant(self, raw_event: object) -> Event | None:
+        message_id = getattr(raw_event, "message_id", None)
+        if isinstance(message_id, str) and not self._observed_message_ids.add(message_id):
+            return None
+        content = getattr(raw_event, "content", "")
+        return AssistantEvent(content=str(content))
+
+    def _convert_tool_call(self, raw_event: object) -> Event | None:
+        args, args_ref = self.blob_store.externalize_args(
+            self._message_to_dict(getattr(raw_event, "args", {}))
+        )
+        return ToolCallEvent(
+            tool_name=str(getattr(raw_event, "tool_name", "tool")),
+            args=args,
+            call_id=str(getattr(raw_event, "tool_call_id", "")),
+            args_ref=args_ref,
+        )
+
+    def _convert_tool_result(self, raw_event: object) -> Event | None:
+        call_id = str(getattr(raw_event, "tool_call_id", ""))
+        error = getattr(raw_event, "error", None)
+        if isinstance(error, str) and error:
+            output, output_ref = self.blob_store.externalize_text(error)
+            return ToolResultEvent(
+                call_id=call_id,
+                output=output,
+                is_error=True,
+                output_ref=output_ref,
+            )
+
+        result = getattr(raw_event, "result", None)
+        if hasattr(result, "model_dump_json"):
+            # pydantic-core writes JSON directly, skipping the dict round-trip through json.dumps.
+            output = result.model_dump_json()
+        elif hasattr(result, "model_dump"):
+            output = json.dumps(result.model_dump(mode="json"), ensure_ascii=True)
+        elif result is None:
+            output = ""
+        else:
+            output = str(result)
+        output, output_ref = self.blob_store.externalize_text(output)
+        return ToolResultEvent(
+            call_id=call_id,
+            output=output,
+            is_error=False,
+            output_ref=output_ref,
+        )
 
     def _wire_callbacks(self, agent_loop: object) -> None:
         if hasattr(agent_loop, "set_approval_callback"):
@@ -786,35 +1123,40 @@ class SessionBridge:
         if self._agent_loop is not None:
             return
 
-        runtime = load_vibe_runtime()
-        config = runtime.vibe_config_cls.load()
-        try:
-            agent_loop = runtime.agent_loop_cls(
-                config,
-                message_observer=self._on_message_observed,
-                enable_streaming=False,
-            )
-        except TypeError:
-            agent_loop = runtime.agent_loop_cls(
-                config,
-                message_observer=self._on_message_observed,
-            )
+        pooled = self.agent_pool.acquire() if self.agent_pool is not None else None
+        if pooled is not None:
+            runtime = pooled.runtime
+            agent_loop = pooled.agent_loop
+        else:
+            runtime = load_vibe_runtime()
+            config = runtime.vibe_config_cls.load()
+            agent_loop = build_agent_loop(runtime, config, self._on_message_observed)
 
         self.attach_mode = "managed"
         self.configure_local_callbacks(approval_callback=None, input_callback=None)
         self._message_observer_hooked = False
         self._wire_callbacks(agent_loop)
         self._wire_message_observer(agent_loop)
+        if pooled is not None and not self._message_observer_hooked:
+            pooled.observer.target = self._on_message_observed
         self._agent_loop = agent_loop
         self._vibe_runtime = runtime
 
-    async def _run_agent_turn(self, content: str) -> None:
+    async def _run_agent_turn(self, content: str) -> bool:
+        """Run one prompt through the agent; False when there was no agent or the turn failed."""
         if self._agent_loop is None:
-            return
+            return False
 
         self._set_state("running")
+        trace = current_trace.get()
+        lock_requested = time.perf_counter()
         async with self._run_lock:
+            if trace is not None:
+                trace.record("run_lock_wait", lock_requested)
             try:
+                if trace is not None:
+                    await self._run_traced_agent_turn(content, trace)
+                    return True
                 async for raw_event in self._agent_loop.act(content):
                     await self._notify_raw_event_listeners(raw_event)
                     event = self._convert_vibe_event(raw_event)
@@ -826,14 +1168,52 @@ class SessionBridge:
                 await self._broadcast(
                     AssistantEvent(content=f"Bridge failed to process agent event: {exc}")
                 )
+                return False
+        return True
 
-    async def _message_worker(self) -> None:
+    async def _run_traced_agent_turn(self, content: str, trace: Trace) -> None:
+        # Same loop as _run_agent_turn, timing each stage; agent_act includes approval waits.
+        events = self._agent_loop.act(content).__aiter__()
         while True:
-            content = await self._message_queue.get()
+            started = time.perf_counter()
             try:
-                await self._run_agent_turn(content)
-            finally:
-                self._message_queue.task_done()
+                raw_event = await events.__anext__()
+            except StopAsyncIteration:
+                trace.record("agent_act", started)
+                return
+            trace.record("agent_act", started)
+            with trace.span("raw_listeners"):
+                await self._notify_raw_event_listeners(raw_event)
+            with trace.span("convert"):
+                event = self._convert_vibe_event(raw_event)
+            if event is not None:
+                await self._broadcast(event)
+
+    async def _message_worker(self) -> None:
+        with attributed(session_id=self.session_id):
+            while True:
+                queued = await self._message_queue.get()
+                trace = queued.trace
+                token = None
+                if trace is not None:
+                    trace.record("queue_wait", trace.origin)
+                    token = current_trace.set(trace)
+                for injection_id in queued.injection_ids:
+                    self.injections.mark_started(injection_id)
+                completed: bool | None = False
+                try:
+                    completed = await self._run_interruptible_turn(queued.content)
+                finally:
+                    if token is not None:
+                        current_trace.reset(token)
+                        trace.release()
+                    for injection_id in queued.injection_ids:
+                        if completed:
+                            self.injections.mark_finished(injection_id)
+                        else:
+                            error = "interrupted" if completed is None else "agent turn did not complete"
+                            self.injections.mark_failed(injection_id, error)
+                    self._message_queue.task_done()
                 if (
                     self.state == "running"
                     and not self.pending_approval
@@ -842,6 +1222,46 @@ class SessionBridge:
                 ):
                     self._set_state("idle")
 
+    async def _run_interruptible_turn(self, content: str) -> bool | None:
+        """Run one turn in its own task so interrupt() can cancel it; None when interrupted."""
+
+        async def turn() -> bool:
+            with attributed(session_id=self.session_id):
+                return await self._run_agent_turn(content)
+
+        task = asyncio.get_running_loop().create_task(turn())
+        self._current_turn = task
+        try:
+            return await task
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if current is not None and current.cancelling():
+                # The worker itself is being stopped, not just this turn.
+                raise
+            return None
+        finally:
+            self._current_turn = None
+
+    def interrupt(self) -> bool:
+        """Cancel the agent turn in progress, denying anything it is waiting on.
+
+        Queued messages are served next as usual; returns False when no turn was running.
+        """
+        if self._uses_worker():
+            if self.worker is None or self._worker_idle.is_set():
+                return False
+            self.worker.send({"op": "interrupt"})
+        elif self._current_turn is None or self._current_turn.done():
+            return False
+        for call_id in list(self.pending_approval):
+            self.resolve_approval(call_id, approved=False)
+        for request_id in list(self.pending_input):
+            self.resolve_input(request_id, "")
+        if self._current_turn is not None:
+            self._current_turn.cancel()
+        self.interrupts += 1
+        return True
+
     def _ensure_message_worker(self) -> None:
         if self._message_worker_task is not None and not self._message_worker_task.done():
             return
@@ -852,27 +1272,57 @@ class SessionBridge:
 
     async def start_session(self, message: str, working_dir: Path | None = None) -> None:
         _ = working_dir
+        if self._uses_worker():
+            self._send_to_worker(message)
+            await self._worker_idle.wait()
+            return
         self._ensure_agent_loop()
-        self._message_queue.put_nowait(message)
+        self._message_queue.put(QueuedMessage(message))
         self._ensure_message_worker()
         await self._message_queue.join()
 
-    def inject_message(self, content: str) -> bool:
-        self.messages_to_inject.append(content)
+    def inject_message(self, content: str, *, urgent: bool = False, interrupt: bool = False) -> bool:
+        """Queue ``content`` for the agent; ``urgent`` jumps the queue and ``interrupt`` also cancels the running turn."""
+        urgent = urgent or interrupt
+        injection_id = self.injections.record(content).injection_id
         if not self.controllable:
+            self.injections.mark_failed(injection_id, "session is observe-only")
             self._set_state("idle")
             return False
 
+        if self._uses_worker():
+            try:
+                if interrupt:
+                    self.interrupt()
+                self._send_to_worker(content, urgent=urgent)
+            except RuntimeError as exc:
+                self.injections.mark_failed(injection_id, str(exc))
+                self._broadcast_background(UserMessageEvent(content=content))
+                self._set_state("idle")
+                return False
+            self._worker_injections.append(injection_id)
+            return True
+
         if self._agent_loop is None:
             try:
                 self._ensure_agent_loop()
-            except RuntimeError:
+            except RuntimeError as exc:
+                self.injections.mark_failed(injection_id, str(exc))
                 self._broadcast_background(UserMessageEvent(content=content))
                 self._set_state("idle")
                 return False
 
         self._set_state("running")
-        self._message_queue.put_nowait(content)
+        self._message_queue.put(
+            QueuedMessage(
+                content,
+                trace=tracer.start("inject_message", self.session_id, chars=len(content)),
+                injection_ids=(injection_id,),
+            ),
+            urgent=urgent,
+        )
+        if interrupt:
+            self.interrupt()
         try:
             self._ensure_message_worker()
         except RuntimeError:
@@ -883,7 +1333,131 @@ class SessionBridge:
             return False
         return True
 
-    def stop(self) -> None:
+    def _uses_worker(self) -> bool:
+        return self.execution_mode == "process" and self._agent_loop is None
+
+    def _send_to_worker(self, content: str, *, urgent: bool = False) -> None:
+        if self.worker is None:
+            self.worker = SessionWorker(
+                self.session_id,
+                on_frame=self._on_worker_frame,
+                on_exit=self._on_worker_exit,
+            )
+        self.worker.start()
+        self._worker_idle.clear()
+        self._set_state("running")
+        self.worker.send({"op": "message", "content": content, "urgent": urgent})
+
+    def _forward_to_worker(self, payload: dict[str, object]) -> Callable[[asyncio.Future], None]:
+        def forward(future: asyncio.Future) -> None:
+            if future.cancelled() or self.worker is None:
+                return
+            result = future.result()
+            if isinstance(result, dict):
+                self.worker.send({**payload, **result})
+            else:
+                self.worker.send({**payload, "response": result})
+
+        return forward
+
+    async def _on_worker_frame(self, frame: dict[str, Any]) -> None:
+        op = frame.get("op")
+        if op == "error":
+            logger.warning("Session worker %s: %s", self.session_id, frame.get("error"))
+            if self._worker_injections:
+                self.injections.mark_failed(self._worker_injections.popleft(), str(frame.get("error")))
+            return
+        if op != "event":
+            return
+        event = EventAdapter.validate_python(frame.get("event"))
+        if isinstance(event, StateChangeEvent):
+            if event.state == "running" and self._worker_injections:
+                self.injections.mark_started(self._worker_injections[0])
+            if event.state == "idle":
+                # The worker only reports idle once its own message queue is empty.
+                while self._worker_injections:
+                    self.injections.mark_finished(self._worker_injections.popleft())
+                self._worker_idle.set()
+            # The worker's own view of pending requests lags ours; keep our waiting states.
+            if event.state == "running" and (self.pending_approval or self.pending_input):
+                return
+            self._set_state(event.state)
+            return
+        if isinstance(event, (ApprovalResolutionEvent, InputResolutionEvent)):
+            # Resolutions originate here and were already broadcast by resolve_*.
+            return
+        if isinstance(event, ApprovalRequestEvent):
+            future: asyncio.Future = asyncio.get_running_loop().create_future()
+            future.add_done_callback(self._forward_to_worker({"op": "approval", "call_id": event.call_id}))
+            preview_args, args_ref = self.blob_store.externalize_args(event.args)
+            context: dict[str, object] = {"tool_name": event.tool_name, "args": preview_args}
+            if args_ref is not None:
+                context["args_ref"] = args_ref.model_dump(mode="json")
+            self.pending_approval[event.call_id] = future
+            self.pending_approval_context[event.call_id] = context
+            self._set_state("waiting_approval")
+            event = event.model_copy(update={"args": preview_args, "args_ref": args_ref})
+        elif isinstance(event, InputRequestEvent):
+            future = asyncio.get_running_loop().create_future()
+            future.add_done_callback(self._forward_to_worker({"op": "input", "request_id": event.request_id}))
+            self.pending_input[event.request_id] = future
+            self.pending_input_context[event.request_id] = {
+                "question": event.question,
+                "options": list(event.options),
+            }
+            self._set_state("waiting_input")
+        elif isinstance(event, ToolCallEvent):
+            args, args_ref = self.blob_store.externalize_args(event.args)
+            event = event.model_copy(update={"args": args, "args_ref": args_ref})
+        elif isinstance(event, ToolResultEvent):
+            output, output_ref = self.blob_store.externalize_text(event.output)
+            event = event.model_copy(update={"output": output, "output_ref": output_ref})
+        await self._broadcast(event)
+
+    async def _on_worker_exit(self, returncode: int | None, gave_up: bool) -> None:
+        while self._worker_injections:
+            self.injections.mark_failed(self._worker_injections.popleft(), f"session worker exited (code {returncode})")
+        for future in [*self.pending_approval.values(), *self.pending_input.values()]:
+            future.cancel()
+        self.pending_approval.clear()
+        self.pending_input.clear()
+        self.pending_approval_context.clear()
+        self.pending_input_context.clear()
+        self.snapshot.clear_pending()
+        self._worker_idle.set()
+        if gave_up:
+            await self._broadcast(
+                AssistantEvent(content=f"Session worker exited (code {returncode}) too often; not restarting")
+            )
+            self.worker = None
+            self._set_state("disconnected")
+            return
+        await self._broadcast(AssistantEvent(content=f"Session worker exited (code {returncode}); restarting"))
+        self._set_state("idle")
+
+    @property
+    def evictable(self) -> bool:
+        """True when nothing in-flight depends on this bridge staying resident."""
+        if self.attach_mode == "live" or self.pending_approval or self.pending_input:
+            return False
+        if self._event_listeners or self._raw_event_listeners:
+            return False
+        if self.attach_mode == "observe_only":
+            return self.state in {"idle", "disconnected"}
+        if self.state == "disconnected":
+            return True
+        # A managed bridge that never ran holds no conversation state worth keeping.
+        return (
+            self.state == "idle"
+            and self._agent_loop is None
+            and self.worker is None
+            and self._message_queue.empty()
+        )
+
+    def _cancel_tasks(self) -> None:
+        if self.worker is not None:
+            self.worker.terminate()
+            self.worker = None
         if self._message_worker_task and not self._message_worker_task.done():
             self._message_worker_task.cancel()
         self._message_worker_task = None
@@ -891,12 +1465,26 @@ class SessionBridge:
         for task in list(self._background_tasks):
             task.cancel()
         self._background_tasks.clear()
+        self._event_listeners.cancel()
+        self._raw_event_listeners.cancel()
+
+    def release(self) -> None:
+        """Tear down without announcing a disconnect; used when evicting idle bridges."""
+        self._cancel_tasks()
+        if self.journal is not None:
+            self.journal.close()
+
+    def stop(self) -> None:
+        self._cancel_tasks()
 
         self.pending_approval.clear()
         self.pending_input.clear()
         self.pending_approval_context.clear()
         self.pending_input_context.clear()
+        self.snapshot.clear_pending()
         self._set_state("disconnected")
+        if self.journal is not None:
+            self.journal.close()
 
     def state_payload(self) -> dict:
         payload: dict[str, object] = {
@@ -912,6 +1500,8 @@ class SessionBridge:
                 pending["tool_name"] = context["tool_name"]
             if "args" in context:
                 pending["args"] = context["args"]
+            if "args_ref" in context:
+                pending["args_ref"] = context["args_ref"]
             payload["pending_approval"] = pending
         if self.pending_input:
             request_id = next(iter(self.pending_input.keys()))
@@ -922,14 +1512,176 @@ class SessionBridge:
             if "options" in context:
                 pending["options"] = context["options"]
             payload["pending_input"] = pending
+        queue = self._message_queue
+        if queue.qsize() or queue.last_wait_seconds is not None:
+            oldest_wait = queue.oldest_wait()
+            payload["queue"] = {
+                "depth": queue.qsize(),
+                "oldest_wait_ms": None if oldest_wait is None else round(oldest_wait * 1000, 3),
+                "last_wait_ms": None if queue.last_wait_seconds is None else round(queue.last_wait_seconds * 1000, 3),
+                "coalesce": queue.coalesce,
+                "coalesced": queue.coalesced,
+                "interrupts": self.interrupts,
+            }
         return payload
 
 
+def resolve_execution_mode() -> ExecutionMode:
+    if os.environ.get("VIBECHECK_EXECUTION_MODE", "").strip().lower() == "process":
+        return "process"
+    return "inline"
+
+
+def resolve_session_idle_ttl() -> float | None:
+    configured = os.environ.get("VIBECHECK_SESSION_IDLE_TTL", "")
+    try:
+        ttl = float(configured) if configured else DEFAULT_SESSION_IDLE_TTL_SECONDS
+    except ValueError:
+        ttl = DEFAULT_SESSION_IDLE_TTL_SECONDS
+    return ttl if ttl > 0 else None
+
+
+def resolve_max_resident_sessions() -> int | None:
+    configured = os.environ.get("VIBECHECK_MAX_RESIDENT_SESSIONS", "")
+    try:
+        limit = int(configured) if configured else DEFAULT_MAX_RESIDENT_SESSIONS
+    except ValueError:
+        limit = DEFAULT_MAX_RESIDENT_SESSIONS
+    return limit if limit > 0 else None
+
+
+def resolve_journal_root() -> Path | None:
+    configured = os.environ.get("VIBECHECK_JOURNAL_DIR")
+    if configured:
+        return Path(configured).expanduser().resolve()
+    return None
+
+
 class SessionManager:
-    def __init__(self, logs_root: Path | None = None, connection_manager=None) -> None:
+    def __init__(
+        self,
+        logs_root: Path | None = None,
+        connection_manager=None,
+        *,
+        journal_root: Path | None = None,
+        journal_retention: RetentionPolicy | None = None,
+        backlog_session_bytes: int = DEFAULT_SESSION_BYTES,
+        backlog_global_bytes: int = DEFAULT_GLOBAL_BYTES,
+        backlog_max_age_seconds: float | None = None,
+        agent_pool_size: int | None = None,
+        execution_mode: ExecutionMode | None = None,
+        idle_ttl_seconds: float | None = None,
+        max_resident: int | None = None,
+        eviction_sweep_seconds: float = DEFAULT_EVICTION_SWEEP_SECONDS,
+    ) -> None:
         self.logs_root = logs_root or (Path.home() / ".vibe" / "logs" / "session")
         self.connection_manager = connection_manager
-        self.sessions: dict[str, SessionBridge] = {}
+        # Least recently used first; attach() moves a session to the end.
+        self.sessions: OrderedDict[str, SessionBridge] = OrderedDict()
+        # None reads the environment; zero disables the limit.
+        ttl = resolve_session_idle_ttl() if idle_ttl_seconds is None else idle_ttl_seconds
+        self.idle_ttl_seconds = ttl if ttl and ttl > 0 else None
+        limit = resolve_max_resident_sessions() if max_resident is None else max_resident
+        self.max_resident = limit if limit and limit > 0 else None
+        # Summaries of evicted bridges so list() and has_known_session() still see them.
+        self.evicted: OrderedDict[str, dict] = OrderedDict()
+        self.evictions = 0
+        self.eviction_sweep_seconds = eviction_sweep_seconds
+        self._sweep_task: asyncio.Task[None] | None = None
+        # Least recently used first; attach() takes a session's journal back out.
+        self._idle_journals: OrderedDict[str, SessionJournal] = OrderedDict()
+        # The loop that owns the bridges when the server runs on its own thread.
+        self._home_loop: asyncio.AbstractEventLoop | None = None
+        self.journal_root = journal_root
+        self.journal_retention = journal_retention
+        self.backlog_budget = BacklogBudget(max_bytes=backlog_global_bytes)
+        self.backlog_session_bytes = backlog_session_bytes
+        self.backlog_max_age_seconds = backlog_max_age_seconds
+        self.execution_mode: ExecutionMode = execution_mode or resolve_execution_mode()
+        pool_size = resolve_agent_pool_size() if agent_pool_size is None else agent_pool_size
+        # Process-mode sessions build their loops inside the worker, so the parent keeps no pool.
+        self.agent_pool = (
+            AgentLoopPool(pool_size, runtime_loader=load_vibe_runtime)
+            if pool_size > 0 and self.execution_mode == "inline"
+            else None
+        )
+
+    def _journal_dir(self, session_id: str) -> Path | None:
+        root = self.journal_root or resolve_journal_root()
+        if root is None:
+            return None
+        return root / safe_session_dirname(session_id)
+
+    def open_journal(self, session_id: str) -> SessionJournal | None:
+        directory = self._journal_dir(session_id)
+        if directory is None:
+            return None
+        try:
+            return SessionJournal(directory, retention=self.journal_retention)
+        except OSError:
+            logger.exception("Failed to open event journal for session %s", session_id)
+            return None
+
+    def _take_journal(self, session_id: str) -> SessionJournal | None:
+        journal = self._idle_journals.pop(session_id, None)
+        return journal if journal is not None else self.open_journal(session_id)
+
+    def _keep_idle_journal(self, session_id: str, journal: SessionJournal) -> None:
+        journal.close()
+        self._idle_journals[session_id] = journal
+        self._idle_journals.move_to_end(session_id)
+        while len(self._idle_journals) > DEFAULT_IDLE_JOURNALS:
+            self._idle_journals.popitem(last=False)
+
+    def _load_journal(
+        self, session_id: str, journal: SessionJournal | None
+    ) -> tuple[SessionJournal | None, SessionSnapshot | None]:
+        """Open the session's journal unless given and fold its tail into a snapshot; run on a thread."""
+        if journal is None:
+            journal = self.open_journal(session_id)
+        if journal is None:
+            return None, None
+        records = journal.read(after_seq=max(0, journal.last_seq - DEFAULT_SNAPSHOT_REBUILD_EVENTS))
+        return journal, rebuild_snapshot(records, journal.last_seq)
+
+    async def _journal_tail(self, session_id: str, limit: int = 50) -> list[Event]:
+        """Recent journaled events of a session that is not resident, read on a worker thread."""
+        journal = self._idle_journals.get(session_id)
+        if journal is None:
+            directory = self._journal_dir(session_id)
+            if directory is None or not directory.exists():
+                return []
+            try:
+                journal = await SessionJournal.aopen(directory, retention=self.journal_retention)
+            except OSError:
+                logger.exception("Failed to open event journal for session %s", session_id)
+                return []
+            if session_id in self.sessions:
+                # Attached while the journal was loading; the resident bridge owns the writable copy.
+                return await self.sessions[session_id].abacklog(limit)
+            self._keep_idle_journal(session_id, journal)
+        else:
+            self._idle_journals.move_to_end(session_id)
+        return [event for _seq, event in await journal.atail(limit)]
+
+    async def ajournal_blob(self, session_id: str, digest: str) -> tuple[bytes, str] | None:
+        """A blob the session's journal persisted, read on a worker thread."""
+        directory = self._journal_dir(session_id)
+        if directory is None:
+            return None
+        return await asyncio.to_thread(read_journal_blob, directory, digest)
+
+    def bind_home_loop(self, loop: asyncio.AbstractEventLoop | None) -> None:
+        self._home_loop = loop
+        for bridge in self.sessions.values():
+            bridge.bind_home_loop(loop)
+
+    async def on_home_loop(self, callback: Callable[..., T], *args: object) -> T:
+        """Run ``callback`` on the loop that owns the sessions, like ``SessionBridge.on_home_loop``.
+
+        Lookups, attaches and sweeps mutate ``sessions``, so server-thread handlers go through here.
+        """
+        return await _run_on_loop(self._home_loop, callback, args)
 
     def set_connection_manager(self, connection_manager) -> None:
         self.connection_manager = connection_manager
@@ -937,6 +1689,10 @@ class SessionManager:
             bridge.connection_manager = connection_manager
 
     def discover(self) -> list[dict]:
+        with DISCOVERY_SCAN_SECONDS.time():
+            return self._scan_logs()
+
+    def _scan_logs(self) -> list[dict]:
         discovered: list[dict] = []
         if not self.logs_root.exists():
             return discovered
@@ -983,29 +1739,159 @@ class SessionManager:
         self,
         session_id: str,
         attach_mode: AttachMode | None = None,
+    ) -> SessionBridge:
+        return self._attach(session_id, attach_mode, None)
+
+    async def aattach(
+        self,
+        session_id: str,
+        attach_mode: AttachMode | None = None,
+    ) -> SessionBridge:
+        """``attach`` with the journal opened and the snapshot rebuilt on a worker thread."""
+        if session_id in self.sessions:
+            return self._attach(session_id, attach_mode, None)
+        idle_journal = self._idle_journals.pop(session_id, None)
+        journal, snapshot = await asyncio.to_thread(self._load_journal, session_id, idle_journal)
+        if session_id in self.sessions:
+            # Another request attached the session while the journal was loading.
+            if journal is not None:
+                journal.close()
+            return self._attach(session_id, attach_mode, None)
+        return self._attach(session_id, attach_mode, (journal, snapshot))
+
+    async def aattach_known(self, session_id: str) -> SessionBridge | None:
+        """``aattach`` a session ``has_known_session`` vouches for, run on the home loop; else None."""
+        return await self.on_home_loop(self._attach_known, session_id)
+
+    async def _attach_known(self, session_id: str) -> SessionBridge | None:
+        if not self.has_known_session(session_id):
+            return None
+        return await self.aattach(session_id)
+
+    def _attach(
+        self,
+        session_id: str,
+        attach_mode: AttachMode | None,
+        loaded: tuple[SessionJournal | None, SessionSnapshot | None] | None,
     ) -> SessionBridge:
         if session_id in self.sessions:
             bridge = self.sessions[session_id]
+            self.sessions.move_to_end(session_id)
+            bridge.last_active = time.monotonic()
             if attach_mode is not None:
                 bridge.attach_mode = attach_mode
             return bridge
 
+        self.evict_idle()
         mode = attach_mode
+        summary = self.evicted.pop(session_id, None)
+        if mode is None and summary is not None:
+            mode = summary["attach_mode"]
         if mode is None:
             mode = "observe_only" if any(item["id"] == session_id for item in self.discover()) else "managed"
 
+        journal, snapshot = loaded if loaded is not None else (self._take_journal(session_id), None)
         bridge = SessionBridge(
             session_id=session_id,
             connection_manager=self.connection_manager,
             attach_mode=mode,
+            journal=journal,
+            backlog=self.new_backlog(),
+            agent_pool=self.agent_pool,
+            execution_mode=self.execution_mode,
+            snapshot=snapshot,
         )
+        bridge.bind_home_loop(self._home_loop)
         self.sessions[session_id] = bridge
         return bridge
 
+    def new_backlog(self) -> EventBacklog:
+        return EventBacklog(
+            max_bytes=self.backlog_session_bytes,
+            max_age_seconds=self.backlog_max_age_seconds,
+            budget=self.backlog_budget,
+        )
+
     def detach(self, session_id: str) -> None:
+        self._idle_journals.pop(session_id, None)
         bridge = self.sessions.pop(session_id, None)
         if bridge is not None:
             bridge.stop()
+            self.backlog_budget.unregister(bridge.event_backlog)
+
+    def _has_clients(self, session_id: str) -> bool:
+        session_clients = getattr(self.connection_manager, "session_clients", None)
+        return callable(session_clients) and session_clients(session_id) > 0
+
+    def _can_evict(self, session_id: str, bridge: SessionBridge) -> bool:
+        return bridge.evictable and not self._has_clients(session_id)
+
+    def evict(self, session_id: str) -> bool:
+        bridge = self.sessions.get(session_id)
+        if bridge is None or not self._can_evict(session_id, bridge):
+            return False
+        del self.sessions[session_id]
+        bridge.release()
+        self.backlog_budget.unregister(bridge.event_backlog)
+        if bridge.journal is not None:
+            self._keep_idle_journal(session_id, bridge.journal)
+        self.evicted[session_id] = {
+            "id": session_id,
+            "started_at": None,
+            "last_activity": None,
+            "message_count": len(bridge.event_backlog),
+            "status": "disconnected",
+            "attach_mode": bridge.attach_mode,
+            "controllable": False,
+        }
+        self.evicted.move_to_end(session_id)
+        while len(self.evicted) > DEFAULT_EVICTED_SUMMARIES:
+            self.evicted.popitem(last=False)
+        self.evictions += 1
+        return True
+
+    def evict_idle(self, now: float | None = None) -> list[str]:
+        """Release idle bridges past the TTL, then least recently used ones over the cap."""
+        evicted: list[str] = []
+        if self.idle_ttl_seconds is not None:
+            cutoff = (time.monotonic() if now is None else now) - self.idle_ttl_seconds
+            for session_id, bridge in list(self.sessions.items()):
+                if bridge.last_active <= cutoff and self.evict(session_id):
+                    evicted.append(session_id)
+        if self.max_resident is not None and len(self.sessions) > self.max_resident:
+            for session_id in list(self.sessions):
+                if len(self.sessions) <= self.max_resident:
+                    break
+                if self.evict(session_id):
+                    evicted.append(session_id)
+        return evicted
+
+    def start_eviction_sweeps(self) -> None:
+        """Sweep on a timer so an idle server still evicts; attach() and list() also sweep."""
+        if self.idle_ttl_seconds is None and self.max_resident is None:
+            return
+        if self._sweep_task is not None and not self._sweep_task.done():
+            return
+        self._sweep_task = asyncio.get_running_loop().create_task(self._sweep_evictions())
+
+    async def stop_eviction_sweeps(self) -> None:
+        task = self._sweep_task
+        self._sweep_task = None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _sweep_evictions(self) -> None:
+        while True:
+            await asyncio.sleep(self.eviction_sweep_seconds)
+            try:
+                await self.on_home_loop(self.evict_idle)
+            except Exception:
+                logger.exception("Idle session sweep failed")
 
     async def start_session(
         self,
@@ -1024,12 +1910,15 @@ class SessionManager:
         return bridge
 
     def has_known_session(self, session_id: str) -> bool:
-        if session_id in self.sessions:
+        if session_id in self.sessions or session_id in self.evicted:
             return True
         return any(item["id"] == session_id for item in self.discover())
 
     def list(self) -> list[dict]:
+        self.evict_idle()
         discovered = {item["id"]: item for item in self.discover()}
+        for session_id, summary in self.evicted.items():
+            discovered.setdefault(session_id, dict(summary))
         for session_id, bridge in self.sessions.items():
             if session_id not in discovered:
                 discovered[session_id] = {
@@ -1040,11 +1929,13 @@ class SessionManager:
                     "status": bridge.state,
                     "attach_mode": bridge.attach_mode,
                     "controllable": bridge.controllable,
+                    "backlog_bytes": bridge.event_backlog.bytes_used,
                 }
             else:
                 discovered[session_id]["status"] = bridge.state
                 discovered[session_id]["attach_mode"] = bridge.attach_mode
                 discovered[session_id]["controllable"] = bridge.controllable
+                discovered[session_id]["backlog_bytes"] = bridge.event_backlog.bytes_used
         return list(discovered.values())
 
     def fleet_status(self) -> dict[str, int]:
@@ -1062,20 +1953,29 @@ class SessionManager:
                 idle += 1
         return {"total": len(listed), "running": running, "waiting": waiting, "idle": idle}
 
-    def session_detail(self, session_id: str) -> dict:
+    async def session_detail(self, session_id: str, *, include_memory: bool = False) -> dict:
+        """Describe a session; ``include_memory`` adds a full (and slow) per-structure size walk."""
         bridge = self.sessions.get(session_id)
         if bridge is not None:
-            return {
+            detail = {
                 "id": bridge.session_id,
                 "state": bridge.state,
                 "attach_mode": bridge.attach_mode,
                 "controllable": bridge.controllable,
                 "pending_approval": list(bridge.pending_approval.keys()),
                 "pending_input": list(bridge.pending_input.keys()),
-                "backlog": [event.model_dump(mode="json") for event in bridge.backlog()],
+                "backlog": [event.model_dump(mode="json") for event in await bridge.abacklog()],
+                "backlog_usage": bridge.event_backlog.usage(),
+                "listeners": bridge.listener_stats(),
+                "injections": bridge.injections.usage(),
             }
+            if include_memory:
+                detail["memory"] = bridge.memory_usage()
+            return detail
 
         discovered = next((item for item in self.discover() if item["id"] == session_id), None)
+        if discovered is None:
+            discovered = self.evicted.get(session_id)
         if discovered is None:
             raise KeyError(session_id)
 
@@ -1086,7 +1986,7 @@ class SessionManager:
             "controllable": False,
             "pending_approval": [],
             "pending_input": [],
-            "backlog": [],
+            "backlog": [event.model_dump(mode="json") for event in await self._journal_tail(session_id)],
             "started_at": discovered["started_at"],
             "last_activity": discovered["last_activity"],
             "message_count": discovered["message_count"],
@@ -1094,3 +1994,24 @@ class SessionManager:
 
 
 session_manager = SessionManager()
+
+
+def _session_gauge(name: str, documentation: str, value: Callable[[SessionBridge], float]) -> None:
+    def collect():
+        for session_id, bridge in list(session_manager.sessions.items()):
+            yield name, {"session": session_id}, value(bridge)
+
+    metrics.collector(name, documentation, collect)
+
+
+_session_gauge("vibecheck_backlog_bytes", "Encoded bytes held in each session backlog.", lambda b: b.event_backlog.bytes_used)
+_session_gauge("vibecheck_backlog_events", "Events held in each session backlog.", lambda b: len(b.event_backlog))
+_session_gauge("vibecheck_pending_approvals", "Approval requests awaiting an answer.", lambda b: len(b.pending_approval))
+_session_gauge("vibecheck_pending_inputs", "Input requests awaiting an answer.", lambda b: len(b.pending_input))
+_session_gauge("vibecheck_message_queue_depth", "Messages waiting for the agent.", lambda b: b._message_queue.qsize())
+_session_gauge("vibecheck_background_tasks", "Background tasks owned by each bridge.", lambda b: len(b._background_tasks))
+metrics.collector(
+    "vibecheck_resident_sessions",
+    "Session bridges currently held in memory.",
+    lambda: [("vibecheck_resident_sessions", {}, len(session_manager.sessions))],
+)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from vibecheck.bridge import SessionBridge
+from vibecheck.events import CommandAckEvent
+
+
+class CommandBase(BaseModel):
+    type: str
+    correlation_id: str | None = None
+
+
+class ApproveCommand(CommandBase):
+    type: Literal["approve"] = "approve"
+    call_id: str
+    approved: bool
+    edited_args: dict | None = None
+
+
+class InputCommand(CommandBase):
+    type: Literal["input"] = "input"
+    request_id: str
+    response: str
+
+
+class MessageCommand(CommandBase):
+    type: Literal["message"] = "message"
+    content: str
+    urgent: bool = False
+    interrupt: bool = False
+
+
+class InterruptCommand(CommandBase):
+    type: Literal["interrupt"] = "interrupt"
+
+
+class PingCommand(CommandBase):
+    type: Literal["ping"] = "ping"
+
+
+Command = Annotated[
+    ApproveCommand | InputCommand | MessageCommand | InterruptCommand | PingCommand,
+    Field(discriminator="type"),
+]
+
+CommandAdapter = TypeAdapter(Command)
+
+
+def _correlation_id_from(raw: str) -> str | None:
+    try:
+        payload = CommandBase.model_validate_json(raw)
+    except ValidationError:
+        return None
+    return payload.correlation_id
+
+
+def parse_command(raw: str) -> Command | CommandAckEvent:
+    try:
+        return CommandAdapter.validate_json(raw)
+    except ValidationError as exc:
+        first_error = exc.errors()[0]["msg"] if exc.errors() else "invalid command"
+        return CommandAckEvent(
+            correlation_id=_correlation_id_from(raw),
+            ok=False,
+            error=f"Invalid command: {first_error}",
+        )
+
+
+def execute_command(bridge: SessionBridge, command: Command) -> CommandAckEvent:
+    correlation_id = command.correlation_id
+    if isinstance(command, ApproveCommand):
+        if not bridge.resolve_approval(
+            call_id=command.call_id,
+            approved=command.approved,
+            edited_args=command.edited_args,
+        ):
+            return CommandAckEvent(
+                correlation_id=correlation_id,
+                ok=False,
+                error=f"No pending approval for call_id={command.call_id}",
+            )
+        return CommandAckEvent(correlation_id=correlation_id, ok=True, status="ok")
+
+    if isinstance(command, InputCommand):
+        if not bridge.resolve_input(request_id=command.request_id, response=command.response):
+            return CommandAckEvent(
+                correlation_id=correlation_id,
+                ok=False,
+                error=f"No pending input for request_id={command.request_id}",
+            )
+        return CommandAckEvent(correlation_id=correlation_id, ok=True, status="ok")
+
+    if isinstance(command, MessageCommand):
+        if not bridge.inject_message(command.content, urgent=command.urgent, interrupt=command.interrupt):
+            return CommandAckEvent(
+                correlation_id=correlation_id,
+                ok=False,
+                error="Vibe runtime unavailable; message was not forwarded to AgentLoop",
+            )
+        return CommandAckEvent(correlation_id=correlation_id, ok=True, status="queued")
+
+    if isinstance(command, InterruptCommand):
+        if not bridge.interrupt():
+            return CommandAckEvent(correlation_id=correlation_id, ok=False, error="No agent turn is running")
+        return CommandAckEvent(correlation_id=correlation_id, ok=True, status="interrupted")
+
+    return CommandAckEvent(correlation_id=correlation_id, ok=True, status="pong")
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+DEFAULT_RECENT_IDS = 4096
+
+
+class RecentIds:
+    """Bounded LRU of recently seen ids for de-duplicating observer paths."""
+
+    def __init__(self, max_size: int = DEFAULT_RECENT_IDS) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._ids: OrderedDict[str, None] = OrderedDict()
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, item: str) -> bool:
+        """Record ``item``; return False when it was already within the window."""
+        if item in self._ids:
+            self._ids.move_to_end(item)
+            return False
+        self._ids[item] = None
+        if len(self._ids) > self.max_size:
+            self._ids.popitem(last=False)
+        return True
+
+    def clear(self) -> None:
+        self._ids.clear()
@@ -11,6 +11,12 @@ def _event_id() -> str:
     return uuid4().hex[:8]
 
 
+class BlobRef(BaseModel):
+    hash: str
+    size: int
+    media_type: str = "application/octet-stream"
+
+
 class EventBase(BaseModel):
     type: str
     id: str = Field(default_factory=_event_id)
@@ -27,6 +33,7 @@ class ToolCallEvent(EventBase):
     tool_name: str
     args: dict
     call_id: str
+    args_ref: BlobRef | None = None
 
 
 class ToolResultEvent(EventBase):
@@ -34,6 +41,7 @@ class ToolResultEvent(EventBase):
     call_id: str
     output: str
     is_error: bool = False
+    output_ref: BlobRef | None = None
 
 
 class ApprovalRequestEvent(EventBase):
@@ -41,6 +49,7 @@ class ApprovalRequestEvent(EventBase):
     call_id: str
     tool_name: str
     args: dict
+    args_ref: BlobRef | None = None
 
 
 class ApprovalResolutionEvent(EventBase):
@@ -84,6 +93,27 @@ class HeartbeatEvent(EventBase):
     type: Literal["heartbeat"] = "heartbeat"
 
 
+class CommandAckEvent(EventBase):
+    type: Literal["ack"] = "ack"
+    correlation_id: str | None = None
+    ok: bool
+    status: str | None = None
+    error: str | None = None
+
+
+class SnapshotEvent(EventBase):
+    type: Literal["snapshot"] = "snapshot"
+    session_id: str
+    state: Literal["idle", "running", "waiting_approval", "waiting_input", "disconnected"]
+    attach_mode: Literal["live", "replay", "observe_only", "managed"] | None = None
+    controllable: bool | None = None
+    last_seq: int = 0
+    pending_approvals: list[dict] = Field(default_factory=list)
+    pending_inputs: list[dict] = Field(default_factory=list)
+    messages: list[dict] = Field(default_factory=list)
+    tool_calls: list[dict] = Field(default_factory=list)
+
+
 Event = Annotated[
     AssistantEvent
     | ToolCallEvent
@@ -95,7 +125,9 @@ Event = Annotated[
     | StateChangeEvent
     | UserMessageEvent
     | ConnectedEvent
-    | HeartbeatEvent,
+    | HeartbeatEvent
+    | CommandAckEvent
+    | SnapshotEvent,
     Field(discriminator="type"),
 ]
 
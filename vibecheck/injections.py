@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+import time
+from typing import Any, Literal
+from uuid import uuid4
+
+InjectionStatus = Literal["queued", "started", "finished", "failed"]
+
+DEFAULT_MAX_INJECTIONS = 256
+DEFAULT_MAX_INJECTION_BYTES = 256 * 1024
+DEFAULT_MAX_CONTENT_CHARS = 4096
+
+
+@dataclass(slots=True)
+class InjectionRecord:
+    injection_id: str
+    content: str
+    chars: int
+    queued_at: float
+    status: InjectionStatus = "queued"
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
+
+    @property
+    def size(self) -> int:
+        return len(self.content.encode("utf-8"))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.injection_id,
+            "content": self.content,
+            "chars": self.chars,
+            "truncated": len(self.content) < self.chars,
+            "status": self.status,
+            "queued_at": self.queued_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+        }
+
+
+class InjectionAudit:
+    """Ring of recently injected prompts and their delivery status.
+
+    Bounded by entry count and by the UTF-8 size of the kept content; prompts longer
+    than ``max_content_chars`` are kept truncated. Status updates for records that
+    have already been evicted are ignored.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_INJECTIONS,
+        max_bytes: int = DEFAULT_MAX_INJECTION_BYTES,
+        max_content_chars: int = DEFAULT_MAX_CONTENT_CHARS,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_content_chars = max_content_chars
+        self.bytes_used = 0
+        self.total = 0
+        self.evicted = 0
+        self._records: OrderedDict[str, InjectionRecord] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[InjectionRecord]:
+        return iter(list(self._records.values()))
+
+    def get(self, injection_id: str) -> InjectionRecord | None:
+        return self._records.get(injection_id)
+
+    def record(self, content: str) -> InjectionRecord:
+        entry = InjectionRecord(
+            injection_id=uuid4().hex[:12],
+            content=content[: self.max_content_chars],
+            chars=len(content),
+            queued_at=time.time(),
+        )
+        self._records[entry.injection_id] = entry
+        self.bytes_used += entry.size
+        self.total += 1
+        while len(self._records) > 1 and (
+            len(self._records) > self.max_entries or self.bytes_used > self.max_bytes
+        ):
+            _, oldest = self._records.popitem(last=False)
+            self.bytes_used -= oldest.size
+            self.evicted += 1
+        return entry
+
+    def mark_started(self, injection_id: str) -> None:
+        entry = self._records.get(injection_id)
+        if entry is not None and entry.status == "queued":
+            entry.status = "started"
+            entry.started_at = time.time()
+
+    def mark_finished(self, injection_id: str) -> None:
+        self._finish(injection_id, "finished", None)
+
+    def mark_failed(self, injection_id: str, error: str) -> None:
+        self._finish(injection_id, "failed", error)
+
+    def _finish(self, injection_id: str, status: InjectionStatus, error: str | None) -> None:
+        entry = self._records.get(injection_id)
+        if entry is None or entry.status in {"finished", "failed"}:
+            return
+        entry.status = status
+        entry.error = error
+        entry.finished_at = time.time()
+
+    def recent(self, *, limit: int = 50, status: InjectionStatus | None = None) -> list[dict[str, Any]]:
+        matching = [entry for entry in self._records.values() if status is None or entry.status == status]
+        return [entry.to_dict() for entry in reversed(matching[-limit:])]
+
+    def usage(self) -> dict[str, int]:
+        counts = {"queued": 0, "started": 0, "finished": 0, "failed": 0}
+        for entry in self._records.values():
+            counts[entry.status] += 1
+        return {
+            "entries": len(self._records),
+            "max_entries": self.max_entries,
+            "bytes": self.bytes_used,
+            "max_bytes": self.max_bytes,
+            "total": self.total,
+            "evicted": self.evicted,
+            **counts,
+        }
@@ -0,0 +1,509 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import struct
+import time
+from typing import BinaryIO
+
+from vibecheck.events import BlobRef, Event, EventAdapter
+
+# Each record is a big-endian (body length, seq) header followed by the event JSON.
+RECORD_HEADER = struct.Struct(">IQ")
+SEGMENT_SUFFIX = ".seg"
+# Sealed segments get a sidecar of their id offsets so reopening never re-parses the records.
+INDEX_SUFFIX = ".idx"
+DEFAULT_SEGMENT_BYTES = 4 * 1024 * 1024
+DEFAULT_FSYNC_BATCH = 64
+DEFAULT_FSYNC_INTERVAL = 1.0
+# Every Nth record's offset is indexed so range reads seek close to their first seq.
+SEQ_INDEX_STRIDE = 64
+# Full payloads behind journaled blob refs, so the refs still resolve after a restart.
+BLOB_DIRNAME = "blobs"
+
+logger = logging.getLogger(__name__)
+
+# Event JSON always starts with the type and id fields, so the id can be read without decoding.
+_EVENT_ID_PREFIX = re.compile(rb'\{"type":"[^"\\]*","id":"([^"\\]*)"')
+_BLOB_DIGEST = re.compile(r"[0-9a-f]{64}")
+
+
+@dataclass(frozen=True, slots=True)
+class RetentionPolicy:
+    max_segments: int | None = 16
+    max_bytes: int | None = 64 * 1024 * 1024
+    max_age_seconds: float | None = None
+
+
+@dataclass(slots=True)
+class _Segment:
+    path: Path
+    first_seq: int
+    last_seq: int
+    size: int
+    modified_at: float
+    # (event id, record offset) in append order; persisted to the sidecar and used by retention.
+    event_offsets: list[tuple[str, int]] = field(default_factory=list)
+    # Offset of the record with seq first_seq + i * SEQ_INDEX_STRIDE; seqs in a segment are contiguous.
+    seq_offsets: list[int] = field(default_factory=list)
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_suffix(INDEX_SUFFIX)
+
+    def note_record(self, seq: int, offset: int) -> None:
+        if (seq - self.first_seq) % SEQ_INDEX_STRIDE == 0:
+            self.seq_offsets.append(offset)
+
+    def start_offset(self, after_seq: int) -> int:
+        """Offset of an indexed record at or before ``after_seq + 1``."""
+        if not self.seq_offsets or after_seq < self.first_seq:
+            return 0
+        slot = min((after_seq + 1 - self.first_seq) // SEQ_INDEX_STRIDE, len(self.seq_offsets) - 1)
+        return self.seq_offsets[slot]
+
+
+def _segment_name(first_seq: int) -> str:
+    return f"{first_seq:020d}{SEGMENT_SUFFIX}"
+
+
+def safe_session_dirname(session_id: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]", "_", session_id) or "_"
+
+
+def _fsync_quietly(fileno: int) -> None:
+    try:
+        os.fsync(fileno)
+    except OSError:
+        # The segment may have been rotated and closed before the executor ran.
+        pass
+
+
+def _iter_records(handle: BinaryIO, offset: int = 0) -> Iterator[tuple[int, int, bytes]]:
+    """Yield (offset, seq, body) tuples from ``offset``, stopping at the first torn record."""
+    handle.seek(offset)
+    while True:
+        header = handle.read(RECORD_HEADER.size)
+        if len(header) < RECORD_HEADER.size:
+            return
+        length, seq = RECORD_HEADER.unpack(header)
+        body = handle.read(length)
+        if len(body) < length:
+            return
+        yield offset, seq, body
+        offset += RECORD_HEADER.size + length
+
+
+def _body_event_id(body: bytes) -> str | None:
+    match = _EVENT_ID_PREFIX.match(body)
+    if match is not None:
+        return match.group(1).decode("utf-8")
+    try:
+        event_id = json.loads(body).get("id")
+    except (ValueError, AttributeError):
+        return None
+    return event_id if isinstance(event_id, str) else None
+
+
+def _read_index(segment: _Segment) -> int:
+    """Load the segment's sidecar into it and return the byte offset the sidecar covers."""
+    try:
+        payload = json.loads(segment.index_path.read_bytes())
+        size = int(payload["size"])
+        last_seq = int(payload["last_seq"])
+        offsets = [(str(event_id), int(offset)) for event_id, offset in payload["ids"]]
+        seq_offsets = [int(offset) for offset in payload["seqs"]]
+    except FileNotFoundError:
+        return 0
+    except (OSError, ValueError, KeyError, TypeError):
+        logger.warning("Ignoring unreadable journal index %s", segment.index_path)
+        return 0
+    if size > segment.size:
+        # The segment lost a torn tail after the sidecar was written.
+        return 0
+    segment.last_seq = last_seq
+    segment.event_offsets = offsets
+    segment.seq_offsets = seq_offsets
+    return size
+
+
+def _write_index(path: Path, payload: bytes) -> None:
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+    except OSError:
+        logger.warning("Failed to write journal index %s", path)
+
+
+def _write_blob(path: Path, media_type: str, data: bytes) -> None:
+    try:
+        if path.exists():
+            # Re-referenced content stays as new as its latest record for retention.
+            os.utime(path)
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(media_type.encode("utf-8") + b"\n" + data)
+        os.replace(tmp_path, path)
+    except OSError:
+        logger.warning("Failed to persist journal blob %s", path)
+
+
+def _prune_blobs(directory: Path, cutoff: float) -> None:
+    """Remove blobs last referenced no later than ``cutoff`` (an expired segment's mtime)."""
+    try:
+        paths = list(directory.iterdir())
+    except FileNotFoundError:
+        return
+    for path in paths:
+        try:
+            if path.stat().st_mtime <= cutoff:
+                path.unlink()
+        except OSError:
+            continue
+
+
+def read_journal_blob(directory: Path, digest: str) -> tuple[bytes, str] | None:
+    """Payload and media type of a blob persisted by the journal in ``directory``."""
+    if not _BLOB_DIGEST.fullmatch(digest):
+        return None
+    try:
+        stored = (directory / BLOB_DIRNAME / digest).read_bytes()
+    except OSError:
+        return None
+    media_type, _, data = stored.partition(b"\n")
+    return data, media_type.decode("utf-8")
+
+
+def _read_records(
+    plan: list[tuple[Path, int]], after_seq: int, until_seq: int, limit: int | None
+) -> list[tuple[int, Event]]:
+    """Decode records in ``(after_seq, until_seq]`` from the planned segment offsets."""
+    records: list[tuple[int, Event]] = []
+    for path, offset in plan:
+        try:
+            with path.open("rb") as handle:
+                for _offset, seq, body in _iter_records(handle, offset):
+                    if seq <= after_seq:
+                        continue
+                    if seq > until_seq:
+                        return records
+                    records.append((seq, EventAdapter.validate_json(body)))
+                    if limit is not None and len(records) >= limit:
+                        return records
+        except FileNotFoundError:
+            # Retention removed the segment after the read was planned.
+            continue
+    return records
+
+
+def _read_record_at(path: Path, offset: int) -> Event | None:
+    try:
+        with path.open("rb") as handle:
+            handle.seek(offset)
+            header = handle.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return None
+            length, _seq = RECORD_HEADER.unpack(header)
+            body = handle.read(length)
+    except FileNotFoundError:
+        return None
+    if len(body) < length:
+        return None
+    return EventAdapter.validate_json(body)
+
+
+class SessionJournal:
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        fsync_batch: int = DEFAULT_FSYNC_BATCH,
+        fsync_interval: float = DEFAULT_FSYNC_INTERVAL,
+        retention: RetentionPolicy | None = None,
+    ) -> None:
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.fsync_batch = fsync_batch
+        self.fsync_interval = fsync_interval
+        self.retention = retention or RetentionPolicy()
+        self._segments: list[_Segment] = []
+        self._handle: BinaryIO | None = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._last_seq = 0
+        # Event id -> (segment, record offset); the newest record wins on id reuse.
+        self._index: dict[str, tuple[_Segment, int]] = {}
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load_segments()
+
+    @property
+    def last_seq(self) -> int:
+        return self._last_seq
+
+    @property
+    def first_seq(self) -> int:
+        for segment in self._segments:
+            if segment.last_seq >= segment.first_seq:
+                return segment.first_seq
+        return self._last_seq + 1
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(segment.size for segment in self._segments)
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    @property
+    def blob_dir(self) -> Path:
+        return self.directory / BLOB_DIRNAME
+
+    @classmethod
+    async def aopen(cls, directory: Path, **kwargs: object) -> SessionJournal:
+        """Open a journal with the segment scan and index load on a worker thread."""
+        return await asyncio.to_thread(cls, directory, **kwargs)
+
+    def _load_segments(self) -> None:
+        for path in sorted(self.directory.glob(f"*{SEGMENT_SUFFIX}")):
+            try:
+                first_seq = int(path.stem)
+            except ValueError:
+                continue
+            stat = path.stat()
+            segment = _Segment(
+                path=path,
+                first_seq=first_seq,
+                last_seq=first_seq - 1,
+                size=stat.st_size,
+                modified_at=stat.st_mtime,
+            )
+            # Only records past the sidecar (normally none, or the unsealed tail) are scanned.
+            valid_size = _read_index(segment)
+            with path.open("rb") as handle:
+                for offset, seq, body in _iter_records(handle, valid_size):
+                    segment.last_seq = seq
+                    segment.note_record(seq, offset)
+                    valid_size = offset + RECORD_HEADER.size + len(body)
+                    event_id = _body_event_id(body)
+                    if event_id is not None:
+                        segment.event_offsets.append((event_id, offset))
+            if valid_size < stat.st_size:
+                logger.warning("Truncating torn journal record in %s", path)
+                with path.open("r+b") as handle:
+                    handle.truncate(valid_size)
+                segment.size = valid_size
+            self._segments.append(segment)
+            for event_id, offset in segment.event_offsets:
+                self._index[event_id] = (segment, offset)
+        if self._segments:
+            self._last_seq = max(segment.last_seq for segment in self._segments)
+
+    def _active_handle(self) -> BinaryIO:
+        if self._segments and self._segments[-1].size >= self.segment_bytes:
+            self._rotate()
+        if not self._segments:
+            next_seq = self._last_seq + 1
+            path = self.directory / _segment_name(next_seq)
+            self._segments.append(
+                _Segment(path=path, first_seq=next_seq, last_seq=next_seq - 1, size=0, modified_at=time.time())
+            )
+        if self._handle is None:
+            self._handle = self._segments[-1].path.open("ab")
+        return self._handle
+
+    def _rotate(self) -> None:
+        self.sync()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        if self._segments:
+            self._seal(self._segments[-1])
+        next_seq = self._last_seq + 1
+        self._segments.append(
+            _Segment(
+                path=self.directory / _segment_name(next_seq),
+                first_seq=next_seq,
+                last_seq=next_seq - 1,
+                size=0,
+                modified_at=time.time(),
+            )
+        )
+        self.apply_retention()
+
+    def append(self, event: Event, encoded: bytes | None = None) -> int:
+        body = encoded if encoded is not None else event.model_dump_json().encode("utf-8")
+        handle = self._active_handle()
+        seq = self._last_seq + 1
+        handle.write(RECORD_HEADER.pack(len(body), seq))
+        handle.write(body)
+        segment = self._segments[-1]
+        self._index_record(event.id, segment, segment.size)
+        segment.note_record(seq, segment.size)
+        segment.last_seq = seq
+        segment.size += RECORD_HEADER.size + len(body)
+        segment.modified_at = time.time()
+        self._last_seq = seq
+
+        self._unsynced += 1
+        if (
+            self._unsynced >= self.fsync_batch
+            or time.monotonic() - self._last_sync >= self.fsync_interval
+        ):
+            self._sync_soon()
+        return seq
+
+    def keep_blob(self, ref: BlobRef, data: bytes) -> None:
+        """Persist the payload behind ``ref`` next to the segments, off the event loop if one runs."""
+        path = self.blob_dir / ref.hash
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            _write_blob(path, ref.media_type, data)
+            return
+        loop.run_in_executor(None, _write_blob, path, ref.media_type, data)
+
+    def _index_record(self, event_id: str, segment: _Segment, offset: int) -> None:
+        self._index[event_id] = (segment, offset)
+        segment.event_offsets.append((event_id, offset))
+
+    def _seal(self, segment: _Segment) -> None:
+        """Persist the segment's id offsets so the next open can skip parsing its records."""
+        payload = json.dumps(
+            {
+                "size": segment.size,
+                "last_seq": segment.last_seq,
+                "ids": segment.event_offsets,
+                "seqs": segment.seq_offsets,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            _write_index(segment.index_path, payload)
+            return
+        loop.run_in_executor(None, _write_index, segment.index_path, payload)
+
+    def _sync_soon(self) -> None:
+        handle = self._handle
+        if handle is None:
+            return
+        handle.flush()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            os.fsync(handle.fileno())
+            return
+        # Keep the disk barrier off the event loop; the write itself is already buffered.
+        loop.run_in_executor(None, _fsync_quietly, handle.fileno())
+
+    def sync(self) -> None:
+        if self._handle is None:
+            return
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if self._handle is None:
+            return
+        self.sync()
+        self._handle.close()
+        self._handle = None
+        self._seal(self._segments[-1])
+
+    def apply_retention(self, now: float | None = None) -> None:
+        policy = self.retention
+        current = time.time() if now is None else now
+        expired_at: float | None = None
+        # The newest segment is always kept so appends never lose their target.
+        while len(self._segments) > 1:
+            oldest = self._segments[0]
+            too_many = policy.max_segments is not None and len(self._segments) > policy.max_segments
+            too_big = policy.max_bytes is not None and self.size_bytes > policy.max_bytes
+            too_old = (
+                policy.max_age_seconds is not None
+                and current - oldest.modified_at > policy.max_age_seconds
+            )
+            if not (too_many or too_big or too_old):
+                break
+            self._segments.pop(0)
+            for event_id, _offset in oldest.event_offsets:
+                if self._index.get(event_id, (None, 0))[0] is oldest:
+                    del self._index[event_id]
+            try:
+                oldest.path.unlink()
+            except OSError:
+                logger.warning("Failed to remove expired journal segment %s", oldest.path)
+            oldest.index_path.unlink(missing_ok=True)
+            expired_at = oldest.modified_at
+        if expired_at is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            _prune_blobs(self.blob_dir, expired_at)
+            return
+        loop.run_in_executor(None, _prune_blobs, self.blob_dir, expired_at)
+
+    def _read_plan(self, after_seq: int) -> list[tuple[Path, int]]:
+        """Where each segment holding records past ``after_seq`` should be read from."""
+        if self._handle is not None:
+            self._handle.flush()
+        return [
+            (segment.path, segment.start_offset(after_seq))
+            for segment in self._segments
+            if segment.last_seq > after_seq
+        ]
+
+    def read(self, after_seq: int = 0, limit: int | None = None) -> list[tuple[int, Event]]:
+        return _read_records(self._read_plan(after_seq), after_seq, self._last_seq, limit)
+
+    async def aread(self, after_seq: int = 0, limit: int | None = None) -> list[tuple[int, Event]]:
+        """``read`` with the disk reads and decoding moved off the event loop."""
+        plan = self._read_plan(after_seq)
+        return await asyncio.to_thread(_read_records, plan, after_seq, self._last_seq, limit)
+
+    def tail(self, limit: int) -> list[tuple[int, Event]]:
+        if limit <= 0:
+            return []
+        return self.read(after_seq=max(0, self._last_seq - limit), limit=limit)
+
+    async def atail(self, limit: int) -> list[tuple[int, Event]]:
+        if limit <= 0:
+            return []
+        return await self.aread(after_seq=max(0, self._last_seq - limit), limit=limit)
+
+    def locate(self, event_id: str) -> tuple[Path, int] | None:
+        """Segment path and record offset of ``event_id``, flushing it to disk if still buffered."""
+        entry = self._index.get(event_id)
+        if entry is None:
+            return None
+        segment, offset = entry
+        if self._handle is not None and segment is self._segments[-1]:
+            self._handle.flush()
+        return segment.path, offset
+
+    def find(self, event_id: str) -> Event | None:
+        location = self.locate(event_id)
+        return _read_record_at(*location) if location is not None else None
+
+    async def afind(self, event_id: str) -> Event | None:
+        """``find`` with the disk read moved off the event loop."""
+        location = self.locate(event_id)
+        if location is None:
+            return None
+        return await asyncio.to_thread(_read_record_at, *location)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import inspect
 from pathlib import Path
 import sys
@@ -10,7 +11,9 @@ import uvicorn
 
 from vibecheck.app import create_app
 from vibecheck.bridge import SessionBridge, VibeRuntime, load_vibe_runtime, session_manager
-from vibecheck.tui_bridge import TuiBridge
+from vibecheck.overload import overload_controller
+from vibecheck.server_thread import CrossLoopConnectionManager, ServerThread, resolve_server_thread
+from vibecheck.tui_bridge import DEFAULT_MAX_REDRAWS_PER_SECOND, TuiBridge
 
 try:
     from vibe.core.autocompletion.path_prompt_adapter import (
@@ -123,14 +126,17 @@ class VibeCheckApp(_BaseVibeApp):
         bridge,
         ws_port: int,
         api_app: Any,
+        server_thread: bool = False,
         **kwargs: Any,
     ) -> None:
         super().__init__(agent_loop=agent_loop, **kwargs)
         self._bridge = bridge
         self._ws_port = ws_port
         self._api_app = api_app
+        self._use_server_thread = server_thread
         self._tui_bridge: TuiBridge | None = None
         self._server: uvicorn.Server | None = None
+        self._server_thread: ServerThread | None = None
         self._set_approval_callback_original: Callable[[object], object] | None = None
         self._set_user_input_callback_original: Callable[[object], object] | None = None
 
@@ -202,12 +208,39 @@ class VibeCheckApp(_BaseVibeApp):
                 self.event_handler,
                 loading_state_getter=lambda: getattr(self, "_loading_widget", None) is not None,
                 loading_widget_getter=lambda: getattr(self, "_loading_widget", None),
+                max_redraws_per_second=DEFAULT_MAX_REDRAWS_PER_SECOND,
+                frame_scale_getter=lambda: overload_controller.coalesce_factor,
+                # Vibe's EventHandler appends each AssistantEvent/ReasoningEvent to the streaming message.
+                merge_deltas=True,
             )
-            self._bridge.add_raw_event_listener(self._tui_bridge.on_bridge_raw_event)
+            # Queued TuiBridge.enqueue() returns immediately, so the listener can run inline.
+            self._bridge.add_raw_event_listener(self._tui_bridge.on_bridge_raw_event, mode="fast")
 
-        if hasattr(self, "run_worker"):
+        if self._use_server_thread:
+            self._start_server_thread()
+        elif hasattr(self, "run_worker"):
             self.run_worker(self._run_server(), exclusive=False)
 
+    def _start_server_thread(self) -> None:
+        # The bridge and AgentLoop stay on the TUI loop; the API/WS server gets its own.
+        self._server_thread = ServerThread(build_uvicorn_config(self._api_app, self._ws_port))
+        server_loop = self._server_thread.start()
+        home_loop = asyncio.get_running_loop()
+        # Sessions the server attaches later are created on this loop too, so they share the hop.
+        session_manager.bind_home_loop(home_loop)
+        if session_manager.connection_manager is not None:
+            session_manager.set_connection_manager(
+                CrossLoopConnectionManager(session_manager.connection_manager, server_loop)
+            )
+        self._bridge.bind_home_loop(home_loop)
+        if self._bridge.connection_manager is not None and not isinstance(
+            self._bridge.connection_manager, CrossLoopConnectionManager
+        ):
+            self._bridge.connection_manager = CrossLoopConnectionManager(
+                self._bridge.connection_manager,
+                server_loop,
+            )
+
     async def _run_server(self) -> None:
         config = build_uvicorn_config(self._api_app, self._ws_port)
         self._server = uvicorn.Server(config)
@@ -236,9 +269,19 @@ class VibeCheckApp(_BaseVibeApp):
     async def on_unmount(self) -> None:
         if self._tui_bridge is not None:
             self._bridge.remove_raw_event_listener(self._tui_bridge.on_bridge_raw_event)
+            await self._tui_bridge.aclose()
             self._tui_bridge = None
         if self._server is not None:
             self._server.should_exit = True
+        if self._server_thread is not None:
+            if isinstance(session_manager.connection_manager, CrossLoopConnectionManager):
+                session_manager.set_connection_manager(session_manager.connection_manager.target)
+            session_manager.bind_home_loop(None)
+            if isinstance(self._bridge.connection_manager, CrossLoopConnectionManager):
+                self._bridge.connection_manager = self._bridge.connection_manager.target
+            self._bridge.bind_home_loop(None)
+            await asyncio.to_thread(self._server_thread.stop)
+            self._server_thread = None
 
         if hasattr(super(), "on_unmount"):
             await super().on_unmount()
@@ -283,6 +326,8 @@ def launch(argv: list[str] | None = None) -> None:
 
     session_id = str(getattr(agent_loop, "session_id", "live-session"))
     bridge.session_id = session_id
+    bridge.set_journal(session_manager.open_journal(session_id))
+    session_manager.backlog_budget.register(bridge.event_backlog)
     existing = session_manager.sessions.get(session_id)
     if existing is not None and existing is not bridge:
         existing.stop()
@@ -295,6 +340,7 @@ def launch(argv: list[str] | None = None) -> None:
         bridge=bridge,
         ws_port=ws_port,
         api_app=api_app,
+        server_thread=resolve_server_thread(),
         initial_prompt=getattr(vibe_args, "initial_prompt", None),
         teleport_on_start=getattr(vibe_args, "teleport", False),
     )
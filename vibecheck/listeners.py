@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+import inspect
+import logging
+import time
+from typing import Literal
+
+from vibecheck.priority import PriorityLanes, event_priority
+
+ListenerMode = Literal["fast", "slow"]
+
+DEFAULT_LISTENER_TIMEOUT_SECONDS = 5.0
+DEFAULT_MAX_PENDING = 1024
+
+logger = logging.getLogger(__name__)
+
+
+def listener_name(listener: Callable[..., object]) -> str:
+    owner = getattr(listener, "__self__", None)
+    name = getattr(listener, "__qualname__", None) or type(listener).__qualname__
+    if owner is not None and "." not in name:
+        return f"{type(owner).__qualname__}.{name}"
+    return name
+
+
+@dataclass(slots=True)
+class ListenerStats:
+    calls: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    dropped: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, elapsed: float) -> None:
+        self.calls += 1
+        self.total_seconds += elapsed
+        if elapsed > self.max_seconds:
+            self.max_seconds = elapsed
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "dropped": self.dropped,
+            "mean_ms": round(self.total_seconds / self.calls * 1000, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 3),
+        }
+
+
+@dataclass(slots=True)
+class _Slot:
+    listener: Callable[[object], object]
+    mode: ListenerMode
+    timeout: float | None
+    stats: ListenerStats = field(default_factory=ListenerStats)
+    pending: PriorityLanes[object] = field(default_factory=PriorityLanes)
+    drain_task: asyncio.Task[None] | None = None
+
+
+class ListenerRegistry:
+    """Fan an event out to listeners without letting a slow one hold up the rest.
+
+    Fast listeners run inline in registration order. Slow listeners each get their
+    own priority lanes drained by a background task, so they never block the
+    producer; approval and input requests overtake queued bulk events, and order
+    within a priority class is kept. Every call is bounded by the listener's timeout.
+    """
+
+    def __init__(self, label: str, *, max_pending: int = DEFAULT_MAX_PENDING) -> None:
+        self.label = label
+        self.max_pending = max_pending
+        self._slots: dict[Callable[[object], object], _Slot] = {}
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __bool__(self) -> bool:
+        return bool(self._slots)
+
+    def __iter__(self) -> Iterator[Callable[[object], object]]:
+        return iter(list(self._slots))
+
+    def __contains__(self, listener: object) -> bool:
+        return listener in self._slots
+
+    def add(
+        self,
+        listener: Callable[[object], object],
+        *,
+        mode: ListenerMode | None = None,
+        timeout: float | None = DEFAULT_LISTENER_TIMEOUT_SECONDS,
+    ) -> None:
+        if mode is None:
+            mode = "slow" if inspect.iscoroutinefunction(listener) else "fast"
+        existing = self._slots.get(listener)
+        if existing is not None:
+            existing.mode = mode
+            existing.timeout = timeout
+            return
+        self._slots[listener] = _Slot(listener=listener, mode=mode, timeout=timeout)
+
+    def discard(self, listener: Callable[[object], object]) -> None:
+        slot = self._slots.pop(listener, None)
+        if slot is not None and slot.drain_task is not None:
+            slot.drain_task.cancel()
+
+    def cancel(self) -> None:
+        for slot in self._slots.values():
+            slot.pending.clear()
+            if slot.drain_task is not None:
+                slot.drain_task.cancel()
+                slot.drain_task = None
+
+    def stats(self) -> list[dict[str, object]]:
+        return [
+            {
+                "listener": listener_name(slot.listener),
+                "mode": slot.mode,
+                "pending": len(slot.pending),
+                **slot.stats.as_dict(),
+            }
+            for slot in self._slots.values()
+        ]
+
+    async def dispatch(self, event: object) -> None:
+        loop = asyncio.get_running_loop()
+        for slot in list(self._slots.values()):
+            if slot.mode == "fast":
+                await self._invoke(slot, event)
+                continue
+            slot.pending.append(event, event_priority(event))
+            if len(slot.pending) > self.max_pending and slot.pending.drop_oldest() is not None:
+                slot.stats.dropped += 1
+            if slot.drain_task is None or slot.drain_task.done():
+                slot.drain_task = loop.create_task(self._drain(slot))
+
+    def dispatch_without_loop(self, event: object) -> None:
+        for slot in list(self._slots.values()):
+            started = time.perf_counter()
+            try:
+                result = slot.listener(event)
+                if inspect.iscoroutine(result):
+                    # Nothing can run it without a loop; close it to avoid the never-awaited warning.
+                    result.close()
+            except Exception:
+                slot.stats.failures += 1
+                logger.exception("%s listener %s failed outside running loop", self.label, listener_name(slot.listener))
+            slot.stats.record(time.perf_counter() - started)
+
+    async def _drain(self, slot: _Slot) -> None:
+        while slot.pending:
+            await self._invoke(slot, slot.pending.popleft())
+
+    async def _invoke(self, slot: _Slot, event: object) -> None:
+        started = time.perf_counter()
+        try:
+            result = slot.listener(event)
+            if inspect.isawaitable(result):
+                if slot.timeout is None:
+                    await result
+                else:
+                    await asyncio.wait_for(result, slot.timeout)
+        except asyncio.TimeoutError:
+            slot.stats.timeouts += 1
+            logger.warning(
+                "%s listener %s exceeded %.2fs",
+                self.label,
+                listener_name(slot.listener),
+                slot.timeout,
+            )
+        except Exception:
+            slot.stats.failures += 1
+            logger.exception("%s listener %s failed", self.label, listener_name(slot.listener))
+        slot.stats.record(time.perf_counter() - started)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import traceback
+from typing import Any
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from vibecheck.metrics import registry as metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LAG_INTERVAL_SECONDS = 0.1
+DEFAULT_SLOW_CALLBACK_SECONDS = 0.1
+DEFAULT_STALL_CAPACITY = 64
+MAX_STACK_DEPTH = 32
+LAG_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_SESSION_PATH = re.compile(r"^/(?:api/sessions|ws/events)/([^/]+)")
+
+LOOP_LAG_SECONDS = metrics.histogram(
+    "vibecheck_event_loop_lag_seconds",
+    "How late the event loop woke a fixed-cadence timer.",
+    buckets=LAG_BUCKETS,
+)
+SLOW_CALLBACKS_TOTAL = metrics.counter(
+    "vibecheck_event_loop_slow_callbacks_total",
+    "Times the event loop stayed unresponsive past the slow-callback threshold.",
+)
+
+# Route and session each task is working for; read by the watchdog thread.
+_task_attribution: dict[asyncio.Task[Any], tuple[str | None, str | None]] = {}
+
+
+def resolve_slow_callback_threshold() -> float:
+    configured = os.environ.get("VIBECHECK_SLOW_CALLBACK_MS", "")
+    try:
+        milliseconds = float(configured) if configured else DEFAULT_SLOW_CALLBACK_SECONDS * 1000
+    except ValueError:
+        milliseconds = DEFAULT_SLOW_CALLBACK_SECONDS * 1000
+    return max(0.0, milliseconds / 1000)
+
+
+@contextmanager
+def attributed(*, route: str | None = None, session_id: str | None = None) -> Iterator[None]:
+    """Label the current task so stalls it causes name the route or session."""
+    task = asyncio.current_task()
+    if task is None:
+        yield
+        return
+    previous = _task_attribution.get(task)
+    _task_attribution[task] = (route, session_id)
+    try:
+        yield
+    finally:
+        if previous is None:
+            _task_attribution.pop(task, None)
+        else:
+            _task_attribution[task] = previous
+
+
+def running_attribution(
+    loop: asyncio.AbstractEventLoop,
+) -> tuple[asyncio.Task[Any] | None, str | None, str | None]:
+    """The task ``loop`` is running right now and its route and session; safe from other threads."""
+    task = asyncio.current_task(loop)
+    if task is None:
+        return None, None, None
+    route, session_id = _task_attribution.get(task, (None, None))
+    return task, route, session_id
+
+
+class LoopAttributionMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in {"http", "websocket"}:
+            await self.app(scope, receive, send)
+            return
+        path = scope["path"]
+        match = _SESSION_PATH.match(path)
+        route = f"{scope.get('method', 'WEBSOCKET')} {path}"
+        with attributed(route=route, session_id=match.group(1) if match else None):
+            await self.app(scope, receive, send)
+
+
+class LoopMonitor:
+    """Sample event-loop scheduling lag and catch stalls from a watchdog thread.
+
+    The watchdog posts a probe to the loop every half threshold; when the probe has
+    not run within ``slow_threshold`` seconds it samples the loop thread's stack and
+    the running task's attribution, then records the stall once the loop responds.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float = DEFAULT_LAG_INTERVAL_SECONDS,
+        slow_threshold: float = DEFAULT_SLOW_CALLBACK_SECONDS,
+        capacity: int = DEFAULT_STALL_CAPACITY,
+    ) -> None:
+        self.interval = interval
+        self.slow_threshold = slow_threshold
+        self.stalls: deque[dict[str, Any]] = deque(maxlen=capacity)
+        self.slow_callbacks = 0
+        self.last_lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+        self._peak_lag_seconds = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stopped.clear()
+        self._task = self._loop.create_task(self._run())
+        if self.slow_threshold > 0:
+            self._watchdog = threading.Thread(target=self._watch, name="vibecheck-loop-watchdog", daemon=True)
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        watchdog, self._watchdog = self._watchdog, None
+        if watchdog is not None:
+            await asyncio.to_thread(watchdog.join, 1.0)
+
+    def observe(self, lag_seconds: float) -> None:
+        LOOP_LAG_SECONDS.observe(lag_seconds)
+        self.last_lag_seconds = lag_seconds
+        if lag_seconds > self.max_lag_seconds:
+            self.max_lag_seconds = lag_seconds
+        if lag_seconds > self._peak_lag_seconds:
+            self._peak_lag_seconds = lag_seconds
+
+    def take_peak_lag(self) -> float:
+        """Largest lag sampled since the previous call, so a slower reader misses no spike."""
+        peak, self._peak_lag_seconds = self._peak_lag_seconds, 0.0
+        return peak
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self.observe(max(0.0, time.perf_counter() - expected))
+
+    def _watch(self) -> None:
+        loop = self._loop
+        assert loop is not None
+        responded = threading.Event()
+        while not self._stopped.wait(self.slow_threshold / 2):
+            responded.clear()
+            posted = time.perf_counter()
+            try:
+                loop.call_soon_threadsafe(responded.set)
+            except RuntimeError:
+                return
+            if responded.wait(self.slow_threshold):
+                continue
+            stall = self._sample_stall()
+            while not responded.wait(self.slow_threshold):
+                if self._stopped.is_set() or loop.is_closed():
+                    return
+            stall["duration_ms"] = round((time.perf_counter() - posted) * 1000, 3)
+            self.slow_callbacks += 1
+            SLOW_CALLBACKS_TOTAL.inc()
+            self.stalls.append(stall)
+            logger.warning(
+                "Event loop blocked for %.0f ms (route=%s session=%s) in %s",
+                stall["duration_ms"],
+                stall["route"],
+                stall["session_id"],
+                stall["stack"][-1] if stall["stack"] else "unknown",
+            )
+
+    def _sample_stall(self) -> dict[str, Any]:
+        frame = sys._current_frames().get(self._loop_thread_id) if self._loop_thread_id is not None else None
+        stack = (
+            [f"{entry.filename}:{entry.lineno} {entry.name}" for entry in traceback.extract_stack(frame, limit=MAX_STACK_DEPTH)]
+            if frame is not None
+            else []
+        )
+        task, route, session_id = running_attribution(self._loop) if self._loop is not None else (None, None, None)
+        return {
+            "detected_at": time.time(),
+            "duration_ms": None,
+            "task": task.get_name() if task is not None else None,
+            "route": route,
+            "session_id": session_id,
+            "stack": stack,
+        }
+
+    def stats(self, *, limit: int = 20) -> dict[str, Any]:
+        return {
+            "interval_ms": round(self.interval * 1000, 3),
+            "slow_threshold_ms": round(self.slow_threshold * 1000, 3),
+            "lag_ms": round(self.last_lag_seconds * 1000, 3),
+            "max_lag_ms": round(self.max_lag_seconds * 1000, 3),
+            "slow_callbacks": self.slow_callbacks,
+            "stalls": list(self.stalls)[-limit:][::-1],
+        }
+
+
+loop_monitor = LoopMonitor(slow_threshold=resolve_slow_callback_threshold())
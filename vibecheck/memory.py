@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from collections import deque
+import sys
+import threading
+import tracemalloc
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any
+
+from pydantic import BaseModel
+
+DEFAULT_MAX_OBJECTS = 200_000
+DEFAULT_TRACE_FRAMES = 1
+DEFAULT_TOP = 20
+
+# Shared or code-like objects that belong to nobody's retained size.
+_OPAQUE_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, bool, complex, type(None))
+
+
+class SizeWalker:
+    """Approximate retained size of object graphs, counting each object once per walker.
+
+    Sharing one walker across several structures charges shared objects to the first
+    structure measured. Instances of ``skip_types`` are process-wide state reachable
+    from the graph and count as zero. Walks stop after ``max_objects`` objects and set
+    ``truncated``.
+    """
+
+    def __init__(self, *, max_objects: int = DEFAULT_MAX_OBJECTS, skip_types: tuple[type, ...] = ()) -> None:
+        self.max_objects = max_objects
+        self._skip_types = _OPAQUE_TYPES + skip_types
+        self.truncated = False
+        self._seen: set[int] = set()
+
+    def sizeof(self, root: object) -> int:
+        total = 0
+        stack = [root]
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, self._skip_types) or id(obj) in self._seen:
+                continue
+            if len(self._seen) >= self.max_objects:
+                self.truncated = True
+                break
+            self._seen.add(id(obj))
+            total += sys.getsizeof(obj, 0)
+            if isinstance(obj, _ATOMIC_TYPES):
+                continue
+            if isinstance(obj, dict):
+                stack.extend(obj.keys())
+                stack.extend(obj.values())
+            elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+                stack.extend(obj)
+            elif isinstance(obj, BaseModel):
+                stack.append(obj.__dict__)
+                if obj.__pydantic_extra__:
+                    stack.append(obj.__pydantic_extra__)
+            else:
+                attributes = getattr(obj, "__dict__", None)
+                if isinstance(attributes, dict):
+                    stack.append(attributes)
+                slots = getattr(type(obj), "__slots__", ())
+                for name in (slots,) if isinstance(slots, str) else slots:
+                    value = getattr(obj, name, None)
+                    if value is not None:
+                        stack.append(value)
+        return total
+
+
+class HeapDiffer:
+    """Take tracemalloc snapshots on request and report growth since the previous one.
+
+    The first call starts tracing and records a baseline; tracing stays on until
+    ``stop()`` because tracemalloc only sees allocations made while it runs.
+    """
+
+    def __init__(self, *, frames: int = DEFAULT_TRACE_FRAMES) -> None:
+        self.frames = frames
+        self._previous: tracemalloc.Snapshot | None = None
+        self._started_tracing = False
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def diff(self, *, top: int = DEFAULT_TOP, group_by: str = "lineno") -> dict[str, Any]:
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.frames)
+                self._started_tracing = True
+                self._previous = None
+            snapshot = self._snapshot()
+            previous, self._previous = self._previous, snapshot
+            traced, peak = tracemalloc.get_traced_memory()
+            result: dict[str, Any] = {
+                "baseline": previous is None,
+                "traced_bytes": traced,
+                "peak_bytes": peak,
+                "growth": [],
+            }
+            if previous is None:
+                return result
+            stats = snapshot.compare_to(previous, group_by)
+            result["growth"] = [
+                {
+                    "location": [f"{frame.filename}:{frame.lineno}" for frame in stat.traceback],
+                    "size_diff": stat.size_diff,
+                    "count_diff": stat.count_diff,
+                    "size": stat.size,
+                    "count": stat.count,
+                }
+                for stat in stats[:top]
+            ]
+            return result
+
+    def stop(self) -> None:
+        with self._lock:
+            self._previous = None
+            if self._started_tracing and tracemalloc.is_tracing():
+                tracemalloc.stop()
+            self._started_tracing = False
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+                tracemalloc.Filter(False, "<unknown>"),
+            )
+        )
+
+
+heap_differ = HeapDiffer()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+import os
+import time
+
+from vibecheck.tracing import Trace
+
+DEFAULT_COALESCE_SEPARATOR = "\n\n"
+
+
+def resolve_message_coalescing() -> bool:
+    return os.environ.get("VIBECHECK_COALESCE_MESSAGES", "0").strip().lower() in {"1", "true", "yes", "on"}
+
+
+@dataclass(slots=True)
+class QueuedMessage:
+    content: str
+    trace: Trace | None = None
+    injection_ids: tuple[str, ...] = ()
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class MessageQueue:
+    """Prompts waiting for a session's next agent turn.
+
+    Urgent prompts go ahead of normal ones, first-come among themselves. With
+    ``coalesce`` set, ``get()`` merges everything waiting into a single prompt so a
+    burst of messages costs one turn instead of one turn each.
+    """
+
+    def __init__(self, *, coalesce: bool = False, separator: str = DEFAULT_COALESCE_SEPARATOR) -> None:
+        self.coalesce = coalesce
+        self.separator = separator
+        self.coalesced = 0
+        self.last_wait_seconds: float | None = None
+        self._items: deque[QueuedMessage] = deque()
+        self._urgent = 0
+        self._unfinished = 0
+        self._available = asyncio.Event()
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[QueuedMessage]:
+        return iter(list(self._items))
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def put(self, message: QueuedMessage, *, urgent: bool = False) -> None:
+        if urgent:
+            self._items.insert(self._urgent, message)
+            self._urgent += 1
+        else:
+            self._items.append(message)
+        self._unfinished += 1
+        self._finished.clear()
+        self._available.set()
+
+    async def get(self) -> QueuedMessage:
+        while not self._items:
+            self._available.clear()
+            await self._available.wait()
+        message = self._items.popleft()
+        self._urgent = max(0, self._urgent - 1)
+        if self.coalesce and self._items:
+            message = self._merge([message, *self._items])
+            self._items.clear()
+            self._urgent = 0
+        self.last_wait_seconds = time.monotonic() - message.enqueued_at
+        return message
+
+    def _merge(self, messages: list[QueuedMessage]) -> QueuedMessage:
+        traces = [message.trace for message in messages if message.trace is not None]
+        for trace in traces[1:]:
+            trace.release()
+        # Each merged message was counted by put(); the merged one is finished by one task_done().
+        self._unfinished -= len(messages) - 1
+        self.coalesced += len(messages) - 1
+        return QueuedMessage(
+            content=self.separator.join(message.content for message in messages),
+            trace=traces[0] if traces else None,
+            injection_ids=tuple(injection_id for message in messages for injection_id in message.injection_ids),
+            enqueued_at=min(message.enqueued_at for message in messages),
+        )
+
+    def task_done(self) -> None:
+        self._unfinished -= 1
+        if self._unfinished <= 0:
+            self._unfinished = 0
+            self._finished.set()
+
+    async def join(self) -> None:
+        if self._unfinished:
+            await self._finished.wait()
+
+    def oldest_wait(self, now: float | None = None) -> float | None:
+        if not self._items:
+            return None
+        now = time.monotonic() if now is None else now
+        return now - min(message.enqueued_at for message in self._items)
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from enum import IntEnum
+import logging
+import os
+import time
+from typing import Any
+
+from vibecheck.loop_monitor import loop_monitor
+from vibecheck.metrics import registry as metrics
+from vibecheck.priority import BLOCKING_TYPES, Priority
+from vibecheck.projection import SubscriptionFilter, project_payload
+
+logger = logging.getLogger(__name__)
+
+
+class DegradationLevel(IntEnum):
+    """How hard we shed work; each level keeps the mitigations of the ones below it.
+
+    COALESCE only stretches the TUI redraw window. WebSocket frames are whole
+    events rather than streaming deltas, so there is nothing to coalesce on that
+    path; WebSocket clients first see degradation at TRUNCATE (bulk payloads cut
+    down, heartbeats skipped behind queued frames) and SHED (bulk frames dropped
+    for lagging clients).
+    """
+
+    NORMAL = 0
+    COALESCE = 1
+    TRUNCATE = 2
+    SHED = 3
+
+
+DEFAULT_EVALUATE_INTERVAL_SECONDS = 0.25
+# Event-loop lag (seconds) and deepest client send queue (frames) that push us into
+# COALESCE, TRUNCATE and SHED respectively.
+DEFAULT_LAG_THRESHOLDS = (0.05, 0.15, 0.5)
+DEFAULT_DEPTH_THRESHOLDS = (64, 256, 1024)
+DEFAULT_COOLDOWN_SECONDS = 2.0
+DEFAULT_TRUNCATE_LIMIT = 2048
+DEFAULT_LAGGING_CLIENT_DEPTH = 32
+# Multiplier applied to the TUI redraw window at each level.
+COALESCE_FACTORS = (1, 2, 4, 8)
+# Frames that are never shed, whatever the level.
+CRITICAL_TYPES = BLOCKING_TYPES | frozenset(
+    {"state", "approval_resolution", "input_resolution", "ack", "snapshot", "connected"}
+)
+
+
+def resolve_overload_control() -> bool:
+    return os.environ.get("VIBECHECK_OVERLOAD_CONTROL", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+class OverloadController:
+    """Step through degradation levels as event-loop lag and send-queue depth grow.
+
+    Escalation moves one level per evaluation while pressure is above the current
+    level's threshold; relief moves one level down per ``cooldown_seconds`` of calm.
+    Lag is read from the shared ``loop_monitor`` rather than sampled here.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float = DEFAULT_EVALUATE_INTERVAL_SECONDS,
+        lag_thresholds: tuple[float, float, float] = DEFAULT_LAG_THRESHOLDS,
+        depth_thresholds: tuple[int, int, int] = DEFAULT_DEPTH_THRESHOLDS,
+        cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS,
+        truncate_limit: int = DEFAULT_TRUNCATE_LIMIT,
+        lagging_client_depth: int = DEFAULT_LAGGING_CLIENT_DEPTH,
+    ) -> None:
+        self.interval = interval
+        self.lag_thresholds = lag_thresholds
+        self.depth_thresholds = depth_thresholds
+        self.cooldown_seconds = cooldown_seconds
+        self.truncate_limit = truncate_limit
+        self.lagging_client_depth = lagging_client_depth
+        self.level = DegradationLevel.NORMAL
+        self.lag_seconds = 0.0
+        self.queue_depth = 0
+        self.transitions: dict[tuple[str, str], int] = {}
+        self.shed: dict[str, int] = {}
+        self.truncated = 0
+        self._calm_since: float | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def coalesce_factor(self) -> int:
+        """Stretch factor for the TUI redraw window; the WebSocket path does not read it."""
+        return COALESCE_FACTORS[self.level]
+
+    def pressure_level(self, lag_seconds: float, queue_depth: int) -> DegradationLevel:
+        level = DegradationLevel.NORMAL
+        for candidate, lag_limit, depth_limit in zip(
+            (DegradationLevel.COALESCE, DegradationLevel.TRUNCATE, DegradationLevel.SHED),
+            self.lag_thresholds,
+            self.depth_thresholds,
+        ):
+            if lag_seconds >= lag_limit or queue_depth >= depth_limit:
+                level = candidate
+        return level
+
+    def observe(self, lag_seconds: float, queue_depth: int, *, now: float | None = None) -> DegradationLevel:
+        now = time.monotonic() if now is None else now
+        self.lag_seconds = lag_seconds
+        self.queue_depth = queue_depth
+        target = self.pressure_level(lag_seconds, queue_depth)
+        if target > self.level:
+            self._calm_since = None
+            self._move(DegradationLevel(self.level + 1))
+        elif target < self.level:
+            if self._calm_since is None:
+                self._calm_since = now
+            elif now - self._calm_since >= self.cooldown_seconds:
+                self._calm_since = now
+                self._move(DegradationLevel(self.level - 1))
+        else:
+            self._calm_since = None
+        return self.level
+
+    def _move(self, level: DegradationLevel) -> None:
+        key = (self.level.name.lower(), level.name.lower())
+        self.transitions[key] = self.transitions.get(key, 0) + 1
+        logger.warning(
+            "Overload level %s -> %s (loop lag %.0f ms, deepest send queue %d)",
+            key[0],
+            key[1],
+            self.lag_seconds * 1000,
+            self.queue_depth,
+        )
+        self.level = level
+
+    def degrade(self, payload: dict[str, Any], priority: Priority, *, session_id: str | None = None) -> dict[str, Any]:
+        if self.level < DegradationLevel.TRUNCATE or priority is not Priority.BULK:
+            return payload
+        projected = project_payload(
+            payload,
+            SubscriptionFilter(max_field_length=self.truncate_limit),
+            session_id=session_id,
+        )
+        if projected is None or "truncated" not in projected:
+            return payload
+        self.truncated += 1
+        return projected
+
+    def should_shed(self, payload: dict[str, Any], client_depth: int) -> bool:
+        kind = str(payload.get("type", ""))
+        if kind in CRITICAL_TYPES or self.level < DegradationLevel.TRUNCATE:
+            return False
+        if kind == "heartbeat":
+            # Any queued frame already proves the connection is alive.
+            shed = client_depth > 0
+        else:
+            shed = self.level >= DegradationLevel.SHED and client_depth >= self.lagging_client_depth
+        if shed:
+            self.shed[kind] = self.shed.get(kind, 0) + 1
+        return shed
+
+    def start(
+        self,
+        queue_depth: Callable[[], int],
+        loop_lag: Callable[[], float] = loop_monitor.take_peak_lag,
+    ) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run(queue_depth, loop_lag))
+
+    async def stop(self) -> None:
+        task = self._task
+        self._task = None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self, queue_depth: Callable[[], int], loop_lag: Callable[[], float]) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.observe(loop_lag(), queue_depth())
+            except Exception:
+                logger.exception("Overload controller evaluation failed")
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "level": self.level.name.lower(),
+            "lag_ms": round(self.lag_seconds * 1000, 3),
+            "queue_depth": self.queue_depth,
+            "transitions": [
+                {"from": source, "to": target, "count": count}
+                for (source, target), count in sorted(self.transitions.items())
+            ],
+            "shed": dict(self.shed),
+            "truncated": self.truncated,
+        }
+
+
+overload_controller = OverloadController()
+
+metrics.collector(
+    "vibecheck_overload_level",
+    "Current degradation level (0 normal, 1 coalesce TUI redraws, 2 truncate, 3 shed).",
+    lambda: [("vibecheck_overload_level", {}, int(overload_controller.level))],
+)
+metrics.collector(
+    "vibecheck_overload_transitions_total",
+    "Degradation level changes.",
+    lambda: [
+        ("vibecheck_overload_transitions_total", {"from": source, "to": target}, count)
+        for (source, target), count in list(overload_controller.transitions.items())
+    ],
+    kind="counter",
+)
+metrics.collector(
+    "vibecheck_overload_shed_total",
+    "Frames skipped for lagging clients, by type.",
+    lambda: [
+        ("vibecheck_overload_shed_total", {"type": kind}, count)
+        for kind, count in list(overload_controller.shed.items())
+    ],
+    kind="counter",
+)
+metrics.collector(
+    "vibecheck_overload_truncated_total",
+    "Bulk frames truncated under load.",
+    lambda: [("vibecheck_overload_truncated_total", {}, overload_controller.truncated)],
+    kind="counter",
+)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from enum import IntEnum
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class Priority(IntEnum):
+    """Delivery classes; lower values are sent first, order within a class is kept."""
+
+    BLOCKING = 0
+    CONTROL = 1
+    BULK = 2
+
+
+# Events the agent is parked on until a human answers.
+BLOCKING_TYPES = frozenset({"approval_request", "input_request"})
+CONTROL_TYPES = frozenset(
+    {
+        "state",
+        "approval_resolution",
+        "input_resolution",
+        "ack",
+        "connected",
+        "snapshot",
+        "heartbeat",
+    }
+)
+
+
+def event_priority(event: object) -> Priority:
+    kind = event.get("type") if isinstance(event, dict) else getattr(event, "type", None)
+    if kind in BLOCKING_TYPES:
+        return Priority.BLOCKING
+    if kind in CONTROL_TYPES:
+        return Priority.CONTROL
+    return Priority.BULK
+
+
+class PriorityLanes(Generic[T]):
+    """One FIFO per Priority; popleft() always serves the most urgent non-empty lane."""
+
+    __slots__ = ("_lanes", "_size")
+
+    def __init__(self) -> None:
+        self._lanes: tuple[deque[T], ...] = tuple(deque() for _ in Priority)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __iter__(self) -> Iterator[T]:
+        for lane in self._lanes:
+            yield from lane
+
+    def append(self, item: T, priority: Priority = Priority.BULK) -> None:
+        self._lanes[priority].append(item)
+        self._size += 1
+
+    def popleft(self) -> T:
+        for lane in self._lanes:
+            if lane:
+                self._size -= 1
+                return lane.popleft()
+        raise IndexError("pop from empty PriorityLanes")
+
+    def drop_oldest(self) -> T | None:
+        """Discard the oldest item from the least urgent non-empty lane; BLOCKING items are never dropped."""
+        for lane in reversed(self._lanes[Priority.BLOCKING + 1 :]):
+            if lane:
+                self._size -= 1
+                return lane.popleft()
+        return None
+
+    def lane_size(self, priority: Priority) -> int:
+        return len(self._lanes[priority])
+
+    def clear(self) -> None:
+        for lane in self._lanes:
+            lane.clear()
+        self._size = 0
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+import os
+import sys
+import threading
+import time
+from types import CodeType, FrameType
+from typing import Any
+
+from vibecheck.loop_monitor import running_attribution
+
+DEFAULT_SAMPLE_INTERVAL_SECONDS = 0.01
+DEFAULT_MAX_DEPTH = 64
+MAX_PROFILE_SECONDS = 60.0
+
+
+@dataclass(slots=True)
+class Profile:
+    seconds: float
+    interval: float
+    session_id: str | None = None
+    samples: int = 0
+    stacks: Counter[str] = field(default_factory=Counter)
+
+    def collapsed(self) -> str:
+        """One ``root;caller;callee count`` line per distinct stack, as flamegraph tools expect."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "seconds": round(self.seconds, 3),
+            "interval_ms": round(self.interval * 1000, 3),
+            "session_id": self.session_id,
+            "samples": self.samples,
+            "stacks": dict(self.stacks.most_common()),
+        }
+
+
+class SamplingProfiler:
+    """Sample every thread's stack from a background thread via ``sys._current_frames``.
+
+    Scoping to a session keeps only samples of the loop the sessions run on, taken
+    while a task attributed to that session was running; pass ``session_loop`` when
+    that is not the caller's loop (the server-thread mode). One profile runs at a time.
+    """
+
+    def __init__(self, *, interval: float = DEFAULT_SAMPLE_INTERVAL_SECONDS, max_depth: int = DEFAULT_MAX_DEPTH) -> None:
+        self.interval = interval
+        self.max_depth = max_depth
+        self._lock = threading.Lock()
+        self._labels: dict[CodeType, str] = {}
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    async def profile(
+        self,
+        seconds: float,
+        *,
+        session_id: str | None = None,
+        session_loop: tuple[asyncio.AbstractEventLoop, int] | None = None,
+    ) -> Profile | None:
+        """Sample for ``seconds``; ``session_loop`` is the (loop, thread id) pair from ``loop_thread``."""
+        if not self._lock.acquire(blocking=False):
+            return None
+        loop = asyncio.get_running_loop()
+        sampled_loop, sampled_thread_id = session_loop or (loop, threading.get_ident())
+        result: asyncio.Future[Profile] = loop.create_future()
+        # A dedicated thread owns the lock until sampling ends, even if the caller is cancelled.
+        try:
+            threading.Thread(
+                target=self._run,
+                args=(result, min(seconds, MAX_PROFILE_SECONDS), loop, sampled_loop, sampled_thread_id, session_id),
+                name="vibecheck-profiler",
+                daemon=True,
+            ).start()
+        except BaseException:
+            self._lock.release()
+            raise
+        return await result
+
+    def _run(
+        self,
+        result: asyncio.Future[Profile],
+        seconds: float,
+        loop: asyncio.AbstractEventLoop,
+        sampled_loop: asyncio.AbstractEventLoop,
+        sampled_thread_id: int,
+        session_id: str | None,
+    ) -> None:
+        profile: Profile | None = None
+        error: BaseException | None = None
+        try:
+            profile = self._sample(seconds, sampled_loop, sampled_thread_id, session_id)
+        except BaseException as exc:
+            error = exc
+        finally:
+            self._lock.release()
+        try:
+            loop.call_soon_threadsafe(_settle, result, profile, error)
+        except RuntimeError:
+            # The loop closed while sampling; nobody is waiting for the result.
+            pass
+
+    def _sample(
+        self,
+        seconds: float,
+        loop: asyncio.AbstractEventLoop,
+        loop_thread_id: int,
+        session_id: str | None,
+    ) -> Profile:
+        profile = Profile(seconds=seconds, interval=self.interval, session_id=session_id)
+        own_thread_id = threading.get_ident()
+        deadline = time.perf_counter() + seconds
+        while True:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread_id:
+                    continue
+                if session_id is not None:
+                    if thread_id != loop_thread_id:
+                        continue
+                    task, _, running_session_id = running_attribution(loop)
+                    # The frames were captured first, so the task may have started after them.
+                    if running_session_id != session_id or not _runs_task(frame, task):
+                        continue
+                root = "event-loop" if thread_id == loop_thread_id else names.get(thread_id, f"thread-{thread_id}")
+                profile.stacks[self._collapse(root, frame)] += 1
+            profile.samples += 1
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            time.sleep(min(self.interval, remaining))
+        return profile
+
+    def _collapse(self, root: str, frame: FrameType | None) -> str:
+        labels: list[str] = []
+        while frame is not None and len(labels) < self.max_depth:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                self._labels[code] = label
+            labels.append(label)
+            frame = frame.f_back
+        labels.append(root)
+        return ";".join(reversed(labels))
+
+
+def _runs_task(frame: FrameType | None, task: asyncio.Task[Any] | None) -> bool:
+    coro_frame = getattr(task.get_coro(), "cr_frame", None) if task is not None else None
+    while frame is not None:
+        if frame is coro_frame:
+            return True
+        frame = frame.f_back
+    return False
+
+
+def loop_thread() -> tuple[asyncio.AbstractEventLoop, int]:
+    """The running loop and its thread id; run it on the sessions' loop to build ``session_loop``."""
+    return asyncio.get_running_loop(), threading.get_ident()
+
+
+def _settle(result: asyncio.Future[Profile], profile: Profile | None, error: BaseException | None) -> None:
+    if result.done():
+        return
+    if error is not None:
+        result.set_exception(error)
+    else:
+        result.set_result(profile)
+
+
+profiler = SamplingProfiler()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+# Control frames every subscriber needs regardless of its allowlist.
+ALWAYS_DELIVERED_TYPES = frozenset({"connected", "state", "heartbeat", "snapshot", "ack"})
+# Payload fields that carry bulk content and are eligible for truncation/omission.
+BULK_FIELDS = ("content", "output", "args", "edited_args", "response")
+TRUNCATION_MARKER = "…"
+# Snapshot frames embed whole events; these fields are projected element by element.
+SNAPSHOT_EVENT_FIELDS = ("pending_approvals", "pending_inputs", "messages", "tool_calls")
+
+
+@dataclass(frozen=True, slots=True)
+class SubscriptionFilter:
+    event_types: frozenset[str] | None = None
+    max_field_length: int | None = None
+    headers_only: bool = False
+
+    @classmethod
+    def from_query(cls, params: Mapping[str, str]) -> SubscriptionFilter:
+        event_types: frozenset[str] | None = None
+        raw_types = params.get("types")
+        if raw_types:
+            event_types = frozenset(item.strip() for item in raw_types.split(",") if item.strip())
+
+        max_field_length: int | None = None
+        raw_max = params.get("max_field")
+        if raw_max:
+            try:
+                max_field_length = max(0, int(raw_max))
+            except ValueError:
+                max_field_length = None
+
+        headers_only = params.get("headers_only", "").lower() in {"1", "true", "yes"}
+        return cls(
+            event_types=event_types or None,
+            max_field_length=max_field_length,
+            headers_only=headers_only,
+        )
+
+    @property
+    def is_passthrough(self) -> bool:
+        return self.event_types is None and self.max_field_length is None and not self.headers_only
+
+    def allows(self, event_type: str) -> bool:
+        if self.event_types is None or event_type in ALWAYS_DELIVERED_TYPES:
+            return True
+        return event_type in self.event_types
+
+
+PASSTHROUGH = SubscriptionFilter()
+
+
+def event_ref(session_id: str, event_id: str) -> str:
+    return f"/api/sessions/{session_id}/events/{event_id}"
+
+
+def truncate_value(value: Any, limit: int) -> tuple[Any, bool]:
+    if isinstance(value, str):
+        if len(value) <= limit:
+            return value, False
+        return value[:limit] + TRUNCATION_MARKER, True
+    if isinstance(value, dict):
+        truncated = False
+        result: dict[str, Any] = {}
+        for key, item in value.items():
+            result[key], item_truncated = truncate_value(item, limit)
+            truncated = truncated or item_truncated
+        return result, truncated
+    if isinstance(value, list):
+        truncated = False
+        items: list[Any] = []
+        for item in value:
+            projected, item_truncated = truncate_value(item, limit)
+            items.append(projected)
+            truncated = truncated or item_truncated
+        return items, truncated
+    return value, False
+
+
+def _project_nested(value: Any, subscription: SubscriptionFilter, session_id: str | None) -> Any:
+    if isinstance(value, list):
+        items = [_project_nested(item, subscription, session_id) for item in value]
+        return [item for item in items if item is not None]
+    if isinstance(value, dict):
+        if "type" in value:
+            return project_payload(value, subscription, session_id=session_id)
+        return {key: _project_nested(item, subscription, session_id) for key, item in value.items()}
+    return value
+
+
+def project_payload(
+    payload: dict[str, Any],
+    subscription: SubscriptionFilter,
+    *,
+    session_id: str | None = None,
+) -> dict[str, Any] | None:
+    """Return the frame a subscriber with ``subscription`` should receive, or None to skip it."""
+    if subscription.is_passthrough:
+        return payload
+    if not subscription.allows(str(payload.get("type", ""))):
+        return None
+
+    projected = dict(payload)
+    if projected.get("type") == "snapshot":
+        for field in SNAPSHOT_EVENT_FIELDS:
+            if isinstance(projected.get(field), list):
+                projected[field] = _project_nested(projected[field], subscription, session_id)
+        return projected
+
+    altered: list[str] = []
+    for field in BULK_FIELDS:
+        if field not in projected or projected[field] is None:
+            continue
+        if subscription.headers_only:
+            projected.pop(field)
+            altered.append(field)
+            continue
+        if subscription.max_field_length is not None:
+            value, truncated = truncate_value(projected[field], subscription.max_field_length)
+            if truncated:
+                projected[field] = value
+                altered.append(field)
+
+    if not altered:
+        return projected
+    if subscription.headers_only:
+        projected["omitted"] = altered
+    else:
+        projected["truncated"] = altered
+    event_id = projected.get("id")
+    if session_id is not None and isinstance(event_id, str):
+        projected["full_ref"] = event_ref(session_id, event_id)
+    return projected
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+import functools
+import re
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
 from pydantic import BaseModel
 
+from vibecheck.blobs import blob_store
 from vibecheck.bridge import SessionBridge, session_manager
+from vibecheck.loop_monitor import loop_monitor
+from vibecheck.memory import heap_differ
+from vibecheck.overload import overload_controller
+from vibecheck.profiler import MAX_PROFILE_SECONDS, loop_thread, profiler
+from vibecheck.tracing import tracer
 
 router = APIRouter()
 
@@ -21,12 +32,40 @@ class InputResponseRequest(BaseModel):
 
 class MessageRequest(BaseModel):
     content: str
+    urgent: bool = False
+    interrupt: bool = False
+
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    if not header:
+        return None
+    match = _RANGE_PATTERN.match(header.strip())
+    if match is None:
+        # Multi-range and non-byte units are not supported; serve the full body instead.
+        return None
+    start_text, end_text = match.groups()
+    if not start_text and not end_text:
+        return None
+    if not start_text:
+        suffix = int(end_text)
+        if suffix == 0:
+            raise HTTPException(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+        return max(0, size - suffix), size - 1
+    start = int(start_text)
+    end = int(end_text) if end_text else size - 1
+    if start >= size or end < start:
+        raise HTTPException(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+    return start, min(end, size - 1)
 
 
-def _session_or_404(session_id: str) -> SessionBridge:
-    if session_manager.has_known_session(session_id):
-        return session_manager.attach(session_id)
-    raise HTTPException(status_code=404, detail=f"Unknown session: {session_id}")
+async def _session_or_404(session_id: str) -> SessionBridge:
+    bridge = await session_manager.aattach_known(session_id)
+    if bridge is None:
+        raise HTTPException(status_code=404, detail=f"Unknown session: {session_id}")
+    return bridge
 
 
 @router.get("/api/health")
@@ -34,56 +73,204 @@ async def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@router.get("/api/debug/overload")
+async def overload_state() -> dict:
+    return overload_controller.stats()
+
+
+@router.get("/api/debug/loop")
+async def loop_state(limit: int = 20) -> dict:
+    return loop_monitor.stats(limit=max(1, min(limit, 64)))
+
+
+@router.get("/api/debug/profile")
+async def sample_profile(
+    seconds: float = 5.0,
+    session_id: str | None = None,
+    output_format: str = Query("collapsed", alias="format"),
+) -> Response:
+    if not 0 < seconds <= MAX_PROFILE_SECONDS:
+        raise HTTPException(status_code=400, detail=f"seconds must be in (0, {MAX_PROFILE_SECONDS:g}]")
+    if output_format not in {"collapsed", "json"}:
+        raise HTTPException(status_code=400, detail="format must be 'collapsed' or 'json'")
+    # Sessions run on the manager's home loop, which is not this one in server-thread mode.
+    session_loop = await session_manager.on_home_loop(loop_thread) if session_id is not None else None
+    result = await profiler.profile(seconds, session_id=session_id, session_loop=session_loop)
+    if result is None:
+        raise HTTPException(status_code=409, detail="A profile is already running")
+    if output_format == "json":
+        return JSONResponse(result.to_dict())
+    return PlainTextResponse(result.collapsed())
+
+
+@router.get("/api/debug/heap")
+async def heap_growth(top: int = 20, group_by: str = "lineno") -> dict:
+    if group_by not in {"lineno", "filename", "traceback"}:
+        raise HTTPException(status_code=400, detail="group_by must be 'lineno', 'filename' or 'traceback'")
+    return await asyncio.to_thread(heap_differ.diff, top=max(1, min(top, 200)), group_by=group_by)
+
+
+@router.delete("/api/debug/heap")
+async def stop_heap_tracing() -> dict[str, bool]:
+    heap_differ.stop()
+    return {"tracing": heap_differ.tracing}
+
+
+@router.get("/api/debug/traces")
+async def recent_traces(limit: int = 50, session_id: str | None = None) -> dict:
+    traces = tracer.recent(limit=max(1, min(limit, 1000)), session_id=session_id)
+    return {
+        "sample_rate": tracer.sample_rate,
+        "started": tracer.started,
+        "stages": tracer.stage_summary(traces),
+        "traces": traces,
+    }
+
+
 @router.get("/api/state")
 async def fleet_state() -> dict[str, int]:
-    return session_manager.fleet_status()
+    return await session_manager.on_home_loop(session_manager.fleet_status)
 
 
 @router.get("/api/sessions")
 async def list_sessions() -> list[dict]:
-    return session_manager.list()
+    return await session_manager.on_home_loop(session_manager.list)
 
 
 @router.get("/api/sessions/{session_id}/state")
 async def session_state(session_id: str) -> dict:
-    bridge = _session_or_404(session_id)
-    return bridge.state_payload()
+    bridge = await _session_or_404(session_id)
+    return await bridge.on_home_loop(bridge.state_payload)
 
 
 @router.get("/api/sessions/{session_id}")
-async def session_detail(session_id: str) -> dict:
+async def session_detail(session_id: str, memory: bool = False) -> dict:
+    detail = functools.partial(session_manager.session_detail, session_id, include_memory=memory)
     try:
-        return session_manager.session_detail(session_id)
+        return await session_manager.on_home_loop(detail)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail=f"Unknown session: {session_id}") from exc
 
 
+@router.get("/api/sessions/{session_id}/history")
+async def session_history(session_id: str, after_seq: int = 0, limit: int = 100) -> dict:
+    bridge = await _session_or_404(session_id)
+
+    async def page() -> dict:
+        records = await bridge.ahistory(after_seq=max(0, after_seq), limit=max(1, min(limit, 1000)))
+        return {
+            "events": [{"seq": seq, "event": event.model_dump(mode="json")} for seq, event in records],
+            "last_seq": bridge.event_seq,
+        }
+
+    return await bridge.on_home_loop(page)
+
+
+@router.get("/api/sessions/{session_id}/events/{event_id}")
+async def session_event(session_id: str, event_id: str) -> dict:
+    bridge = await _session_or_404(session_id)
+    event = await bridge.on_home_loop(bridge.find_event, event_id)
+    if event is None:
+        raise HTTPException(status_code=404, detail=f"Event no longer retained: {event_id}")
+    return event.model_dump(mode="json")
+
+
+@router.get("/api/blobs/{digest}")
+async def blob(digest: str, request: Request) -> Response:
+    info = blob_store.info(digest)
+    data = await blob_store.aget(digest) if info is not None else None
+    if info is None or data is None:
+        raise HTTPException(status_code=404, detail=f"Unknown blob: {digest}")
+    return _blob_response(digest, data, info.media_type, request)
+
+
+@router.get("/api/sessions/{session_id}/blobs/{digest}")
+async def session_blob(session_id: str, digest: str, request: Request) -> Response:
+    """A blob ref from the session's events, falling back to its journal once the store forgot it."""
+    info = blob_store.info(digest)
+    data = await blob_store.aget(digest) if info is not None else None
+    if info is not None and data is not None:
+        return _blob_response(digest, data, info.media_type, request)
+    stored = await session_manager.ajournal_blob(session_id, digest)
+    if stored is None:
+        raise HTTPException(status_code=404, detail=f"Unknown blob: {digest}")
+    data, media_type = stored
+    return _blob_response(digest, data, media_type, request)
+
+
+def _blob_response(digest: str, data: bytes, media_type: str, request: Request) -> Response:
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": f'"{digest}"',
+        "Cache-Control": "private, max-age=31536000, immutable",
+    }
+    byte_range = _parse_range(request.headers.get("range"), len(data))
+    if byte_range is None:
+        return Response(content=data, media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+    return Response(
+        content=data[start : end + 1],
+        status_code=206,
+        media_type=media_type,
+        headers=headers,
+    )
+
+
 @router.post("/api/sessions/{session_id}/approve")
 async def approve(session_id: str, body: ApproveRequest) -> dict[str, str]:
-    bridge = _session_or_404(session_id)
-    if not bridge.resolve_approval(
+    bridge = await _session_or_404(session_id)
+    resolve = functools.partial(
+        bridge.resolve_approval,
         call_id=body.call_id,
         approved=body.approved,
         edited_args=body.edited_args,
-    ):
+    )
+    if not await bridge.on_home_loop(resolve):
         raise HTTPException(status_code=404, detail=f"No pending approval for call_id={body.call_id}")
     return {"status": "ok"}
 
 
 @router.post("/api/sessions/{session_id}/input")
 async def input_response(session_id: str, body: InputResponseRequest) -> dict[str, str]:
-    bridge = _session_or_404(session_id)
-    if not bridge.resolve_input(request_id=body.request_id, response=body.response):
+    bridge = await _session_or_404(session_id)
+    resolve = functools.partial(bridge.resolve_input, request_id=body.request_id, response=body.response)
+    if not await bridge.on_home_loop(resolve):
         raise HTTPException(status_code=404, detail=f"No pending input for request_id={body.request_id}")
     return {"status": "ok"}
 
 
+@router.get("/api/sessions/{session_id}/injections")
+async def session_injections(session_id: str, limit: int = 50, status: str | None = None) -> dict:
+    bridge = await _session_or_404(session_id)
+    if status is not None and status not in {"queued", "started", "finished", "failed"}:
+        raise HTTPException(status_code=400, detail=f"Unknown injection status: {status}")
+
+    def listing() -> dict:
+        return {
+            "injections": bridge.injections.recent(limit=max(1, min(limit, 1000)), status=status),
+            "usage": bridge.injections.usage(),
+        }
+
+    return await bridge.on_home_loop(listing)
+
+
 @router.post("/api/sessions/{session_id}/message")
 async def message(session_id: str, body: MessageRequest) -> dict[str, str]:
-    bridge = _session_or_404(session_id)
-    if not bridge.inject_message(body.content):
+    bridge = await _session_or_404(session_id)
+    inject = functools.partial(bridge.inject_message, urgent=body.urgent, interrupt=body.interrupt)
+    if not await bridge.on_home_loop(inject, body.content):
         raise HTTPException(
             status_code=503,
             detail="Vibe runtime unavailable; message was not forwarded to AgentLoop",
         )
     return {"status": "queued"}
+
+
+@router.post("/api/sessions/{session_id}/interrupt")
+async def interrupt(session_id: str) -> dict[str, str]:
+    bridge = await _session_or_404(session_id)
+    if not await bridge.on_home_loop(bridge.interrupt):
+        raise HTTPException(status_code=409, detail="No agent turn is running")
+    return {"status": "interrupted"}
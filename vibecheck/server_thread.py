@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Coroutine
+from concurrent.futures import Future
+import logging
+import os
+import threading
+from typing import Any
+
+import uvicorn
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_server_thread() -> bool:
+    return os.environ.get("VIBECHECK_SERVER_THREAD", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+class ServerThread:
+    """Runs a uvicorn server on a dedicated thread with its own event loop."""
+
+    def __init__(self, config: uvicorn.Config) -> None:
+        self.server = uvicorn.Server(config)
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._loop_ready = threading.Event()
+
+    @property
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, timeout: float = 5.0) -> asyncio.AbstractEventLoop:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="vibecheck-server", daemon=True)
+            self._thread.start()
+        if not self._loop_ready.wait(timeout) or self.loop is None:
+            raise RuntimeError("vibecheck server thread failed to start")
+        return self.loop
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.loop = loop
+        self._loop_ready.set()
+        try:
+            # uvicorn skips installing signal handlers off the main thread, leaving Ctrl+C to the TUI.
+            loop.run_until_complete(self.server.serve())
+        except Exception:
+            logger.exception("vibecheck server thread crashed")
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> Future:
+        if self.loop is None:
+            coro.close()
+            raise RuntimeError("vibecheck server thread is not running")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self.server.should_exit = True
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+
+class CrossLoopConnectionManager:
+    """Forwards broadcasts from the bridge's loop onto the loop that owns the WebSockets."""
+
+    def __init__(self, target: Any, loop: asyncio.AbstractEventLoop, *, max_in_flight: int = 64) -> None:
+        self.target = target
+        self.loop = loop
+        self.max_in_flight = max_in_flight
+        self._in_flight: deque[Future] = deque()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.target, name)
+
+    async def broadcast(self, session_id: str, event: Any) -> None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            await self.target.broadcast(session_id, event)
+            return
+        if self.loop.is_closed():
+            return
+        # Broadcasts are normally fire-and-forget; the bridge only waits once the server falls
+        # max_in_flight events behind, so a slow server cannot queue events without bound.
+        future = asyncio.run_coroutine_threadsafe(self.target.broadcast(session_id, event), self.loop)
+        future.add_done_callback(_log_broadcast_failure)
+        self._in_flight.append(future)
+        while self._in_flight and self._in_flight[0].done():
+            self._in_flight.popleft()
+        if len(self._in_flight) > self.max_in_flight:
+            oldest = self._in_flight.popleft()
+            await asyncio.wrap_future(oldest, loop=running)
+
+
+def _log_broadcast_failure(future: Future) -> None:
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.warning("Cross-loop broadcast failed: %s", exc)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from collections.abc import Container, Iterable
+from dataclasses import dataclass, field
+
+from vibecheck.events import (
+    ApprovalRequestEvent,
+    ApprovalResolutionEvent,
+    AssistantEvent,
+    Event,
+    InputRequestEvent,
+    InputResolutionEvent,
+    SnapshotEvent,
+    ToolCallEvent,
+    ToolResultEvent,
+    UserMessageEvent,
+)
+
+DEFAULT_SNAPSHOT_MESSAGES = 20
+DEFAULT_SNAPSHOT_TOOL_CALLS = 20
+# Recorded events folded into a snapshot rebuilt from the journal or backlog.
+DEFAULT_SNAPSHOT_REBUILD_EVENTS = 500
+
+
+@dataclass(slots=True)
+class _ToolCallPair:
+    call: ToolCallEvent | None = None
+    result: ToolResultEvent | None = None
+
+
+@dataclass(slots=True)
+class SessionSnapshot:
+    """Incrementally maintained view of a session for single-frame reconnects."""
+
+    max_messages: int = DEFAULT_SNAPSHOT_MESSAGES
+    max_tool_calls: int = DEFAULT_SNAPSHOT_TOOL_CALLS
+    last_seq: int = 0
+    approvals: dict[str, ApprovalRequestEvent] = field(default_factory=dict)
+    inputs: dict[str, InputRequestEvent] = field(default_factory=dict)
+    messages: deque[Event] = field(init=False)
+    tool_calls: OrderedDict[str, _ToolCallPair] = field(default_factory=OrderedDict)
+
+    def __post_init__(self) -> None:
+        self.messages = deque(maxlen=self.max_messages)
+
+    def apply(self, event: Event, seq: int) -> None:
+        self.last_seq = seq
+        if isinstance(event, (AssistantEvent, UserMessageEvent)):
+            self.messages.append(event)
+        elif isinstance(event, ToolCallEvent):
+            self._pair(event.call_id).call = event
+        elif isinstance(event, ToolResultEvent):
+            self._pair(event.call_id).result = event
+        elif isinstance(event, ApprovalRequestEvent):
+            self.approvals[event.call_id] = event
+        elif isinstance(event, ApprovalResolutionEvent):
+            self.approvals.pop(event.call_id, None)
+        elif isinstance(event, InputRequestEvent):
+            self.inputs[event.request_id] = event
+        elif isinstance(event, InputResolutionEvent):
+            self.inputs.pop(event.request_id, None)
+
+    def _pair(self, call_id: str) -> _ToolCallPair:
+        pair = self.tool_calls.get(call_id)
+        if pair is None:
+            pair = _ToolCallPair()
+            self.tool_calls[call_id] = pair
+            while len(self.tool_calls) > self.max_tool_calls:
+                self.tool_calls.popitem(last=False)
+        else:
+            self.tool_calls.move_to_end(call_id)
+        return pair
+
+    def clear_pending(self) -> None:
+        self.approvals.clear()
+        self.inputs.clear()
+
+    def to_event(
+        self,
+        *,
+        session_id: str,
+        state: str,
+        attach_mode: str | None,
+        controllable: bool | None,
+        open_approvals: Container[str] | None = None,
+        open_inputs: Container[str] | None = None,
+    ) -> SnapshotEvent:
+        return SnapshotEvent(
+            session_id=session_id,
+            state=state,
+            attach_mode=attach_mode,
+            controllable=controllable,
+            last_seq=self.last_seq,
+            pending_approvals=[
+                event.model_dump(mode="json")
+                for call_id, event in self.approvals.items()
+                if open_approvals is None or call_id in open_approvals
+            ],
+            pending_inputs=[
+                event.model_dump(mode="json")
+                for request_id, event in self.inputs.items()
+                if open_inputs is None or request_id in open_inputs
+            ],
+            messages=[event.model_dump(mode="json") for event in self.messages],
+            tool_calls=[
+                {
+                    "call_id": call_id,
+                    "call": pair.call.model_dump(mode="json") if pair.call is not None else None,
+                    "result": pair.result.model_dump(mode="json") if pair.result is not None else None,
+                }
+                for call_id, pair in self.tool_calls.items()
+            ],
+        )
+
+
+def rebuild_snapshot(records: Iterable[tuple[int, Event]], last_seq: int) -> SessionSnapshot:
+    """Fold recorded ``(seq, event)`` pairs into a fresh snapshot, e.g. after a restart or reattach."""
+    snapshot = SessionSnapshot(last_seq=last_seq)
+    for seq, event in records:
+        snapshot.apply(event, seq)
+    snapshot.last_seq = last_seq
+    return snapshot
@@ -1,10 +1,15 @@
-from collections.abc import AsyncIterator
+import asyncio
+from collections.abc import AsyncIterator, Callable
+import functools
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
+from fakes import FakeAgentLoop, GatedAgentLoop, RecordingConnectionManager, fake_vibe_runtime
+from vibecheck import bridge as bridge_module
 from vibecheck.app import create_app
+from vibecheck.bridge import VibeRuntime
 
 
 @pytest.fixture
@@ -20,3 +25,27 @@ async def client(psk: str) -> AsyncIterator[AsyncClient]:
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://testserver") as test_client:
         yield test_client
+
+
+@pytest.fixture
+def fake_agent_loop() -> type[FakeAgentLoop]:
+    """A fresh ``FakeAgentLoop`` subclass so class-level state never leaks between tests."""
+    return type("FakeAgentLoop", (FakeAgentLoop,), {})
+
+
+@pytest.fixture
+def fake_runtime(fake_agent_loop: type[FakeAgentLoop]) -> Callable[[], VibeRuntime]:
+    return functools.partial(fake_vibe_runtime, fake_agent_loop)
+
+
+@pytest.fixture
+def recording_manager() -> RecordingConnectionManager:
+    return RecordingConnectionManager()
+
+
+@pytest.fixture
+def gated_agent_loop(monkeypatch: pytest.MonkeyPatch) -> type[GatedAgentLoop]:
+    """A fresh ``GatedAgentLoop`` class, installed as the runtime bridges load."""
+    agent_loop_cls = type("GatedAgentLoop", (GatedAgentLoop,), {"prompts": [], "gate": asyncio.Event()})
+    monkeypatch.setattr(bridge_module, "load_vibe_runtime", functools.partial(fake_vibe_runtime, agent_loop_cls))
+    return agent_loop_cls
@@ -0,0 +1,88 @@
+"""Stand-ins for the Vibe runtime shared by the bridge, pool and worker tests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+from vibecheck.bridge import VibeRuntime
+
+
+class FakeVibeConfig:
+    @classmethod
+    def load(cls):
+        return cls()
+
+
+class FakeUserMessageEvent:
+    def __init__(self, content: str, message_id: str | None = None) -> None:
+        self.content = content
+        self.message_id = message_id
+
+
+class FakeAssistantEvent:
+    def __init__(self, content: str, message_id: str | None = None) -> None:
+        self.content = content
+        self.message_id = message_id
+
+
+class FakeAgentLoop:
+    def __init__(self, _config, message_observer=None, enable_streaming: bool = False) -> None:
+        _ = enable_streaming
+        self.message_observer = message_observer
+        self.approval_callback = None
+        self.user_input_callback = None
+
+    def set_approval_callback(self, callback) -> None:
+        self.approval_callback = callback
+
+    def set_user_input_callback(self, callback) -> None:
+        self.user_input_callback = callback
+
+
+class GatedAgentLoop(FakeAgentLoop):
+    """Records each prompt and holds the turn on ``gate`` before echoing it back.
+
+    An "approve" turn waits on an approval first; an "explode" turn raises once released.
+    """
+
+    prompts: list[str]
+    gate: asyncio.Event
+
+    async def act(self, msg: str):
+        self.prompts.append(msg)
+        yield FakeUserMessageEvent(content=msg)
+        if msg == "approve":
+            await self.approval_callback("bash", {"command": "ls"}, "tc-1")
+        await self.gate.wait()
+        if msg == "explode":
+            raise RuntimeError("agent crashed")
+        yield FakeAssistantEvent(content=f"echo {msg}")
+
+
+def fake_vibe_runtime(agent_loop_cls: type[FakeAgentLoop]) -> VibeRuntime:
+    return VibeRuntime(
+        agent_loop_cls=agent_loop_cls,
+        vibe_config_cls=FakeVibeConfig,
+        approval_yes="y",
+        approval_no="n",
+        ask_result_cls=None,
+        answer_cls=None,
+    )
+
+
+class RecordingConnectionManager:
+    def __init__(self) -> None:
+        self.events: list[dict] = []
+
+    async def broadcast(self, _session_id: str, event) -> None:
+        self.events.append(event.model_dump(mode="json"))
+
+
+async def wait_for(predicate: Callable[[], bool], timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() >= deadline:
+            raise AssertionError("condition was not met in time")
+        await asyncio.sleep(0.005)
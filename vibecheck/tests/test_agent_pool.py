@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+
+from vibecheck.agent_pool import AgentLoopPool, resolve_agent_pool_size
+from vibecheck.bridge import SessionBridge, SessionManager, VibeRuntime
+
+
+@pytest.mark.asyncio
+async def test_pool_warms_to_size_and_refills_after_acquire(fake_agent_loop, fake_runtime) -> None:
+    pool = AgentLoopPool(2, runtime_loader=fake_runtime)
+    await pool.warm()
+    assert len(pool) == 2
+
+    pooled = pool.acquire()
+    assert pooled is not None
+    assert isinstance(pooled.agent_loop, fake_agent_loop)
+    await pool.warm()
+    assert len(pool) == 2
+    assert pool.stats()["hits"] == 1
+
+    await pool.close()
+    assert len(pool) == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_records_loader_failures_without_raising() -> None:
+    def broken() -> VibeRuntime:
+        raise RuntimeError("vibe missing")
+
+    pool = AgentLoopPool(1, runtime_loader=broken)
+    await pool.warm()
+
+    assert pool.acquire() is None
+    assert pool.last_error == "vibe missing"
+    assert pool.misses == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_bridge_adopts_pooled_loop_and_routes_observer(
+    monkeypatch: pytest.MonkeyPatch, fake_agent_loop, fake_runtime
+) -> None:
+    import vibecheck.bridge as bridge_module
+
+    def unexpected_load() -> VibeRuntime:
+        raise AssertionError("pooled bridge should not load the runtime inline")
+
+    pool = AgentLoopPool(1, runtime_loader=fake_runtime)
+    await pool.warm()
+    monkeypatch.setattr(bridge_module, "load_vibe_runtime", unexpected_load)
+    bridge = SessionBridge("pooled", agent_pool=pool)
+
+    bridge._ensure_agent_loop()
+
+    assert isinstance(bridge._agent_loop, fake_agent_loop)
+    assert bridge._agent_loop.approval_callback is not None
+    assert bridge.attach_mode == "managed"
+    observed: list[object] = []
+    monkeypatch.setattr(bridge, "_on_message_observed", observed.append)
+    bridge._agent_loop.message_observer("hello")
+    assert observed == ["hello"]
+    await pool.close()
+
+
+def test_pool_size_comes_from_environment(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setenv("VIBECHECK_AGENT_POOL_SIZE", "3")
+    assert resolve_agent_pool_size() == 3
+    assert SessionManager(logs_root=tmp_path).agent_pool.size == 3
+
+    monkeypatch.setenv("VIBECHECK_AGENT_POOL_SIZE", "nope")
+    assert resolve_agent_pool_size() == 0
+    assert SessionManager(logs_root=tmp_path).agent_pool is None
+
+
+def test_acquire_without_running_loop_does_not_schedule_refill(fake_runtime) -> None:
+    pool = AgentLoopPool(1, runtime_loader=fake_runtime)
+
+    assert pool.acquire() is None
+    assert pool._refill_task is None
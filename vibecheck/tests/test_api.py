@@ -11,7 +11,9 @@ from httpx import ASGITransport, AsyncClient
 
 from vibecheck.app import create_app
 from vibecheck.bridge import SessionManager
-from vibecheck.events import AssistantEvent
+from vibecheck.events import AssistantEvent, ToolResultEvent
+
+from fakes import wait_for
 
 
 @pytest_asyncio.fixture
@@ -78,6 +80,115 @@ async def test_state_and_detail_endpoints(api_client) -> None:
     assert payload["id"] == "session-a"
     assert payload["state"] == "running"
     assert payload["backlog"][-1]["content"] == "hello from backlog"
+    assert payload["backlog_usage"]["events"] == 1
+    assert payload["backlog_usage"]["bytes"] > 0
+    assert "memory" not in payload
+
+    with_memory = await client.get("/api/sessions/session-a", params={"memory": 1}, headers={"X-PSK": "dev-psk"})
+    assert with_memory.json()["memory"]["structures"]["backlog"] > 0
+
+
+@pytest.mark.asyncio
+async def test_event_endpoint_returns_full_retained_event(api_client) -> None:
+    client, manager = api_client
+    bridge = manager.attach("session-a")
+    event = AssistantEvent(content="z" * 5000)
+    bridge.add_event(event)
+
+    found = await client.get(f"/api/sessions/session-a/events/{event.id}", headers={"X-PSK": "dev-psk"})
+    assert found.status_code == 200
+    assert found.json()["content"] == "z" * 5000
+
+    missing = await client.get("/api/sessions/session-a/events/gone", headers={"X-PSK": "dev-psk"})
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_history_endpoint_pages_by_seq(api_client) -> None:
+    client, manager = api_client
+    bridge = manager.attach("session-a")
+    for i in range(5):
+        bridge.add_event(AssistantEvent(content=f"m{i}"))
+
+    response = await client.get(
+        "/api/sessions/session-a/history?after_seq=2&limit=2",
+        headers={"X-PSK": "dev-psk"},
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert [item["seq"] for item in payload["events"]] == [3, 4]
+    assert payload["events"][0]["event"]["content"] == "m2"
+    assert payload["last_seq"] == 5
+
+
+@pytest.mark.asyncio
+async def test_blob_endpoint_serves_full_and_ranged_payloads(
+    api_client, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    import vibecheck.routes.api as api_module
+    from vibecheck.blobs import BlobStore
+
+    client, _ = api_client
+    store = BlobStore(spill_dir=tmp_path / "blobs")
+    monkeypatch.setattr(api_module, "blob_store", store)
+    ref = store.put(b"0123456789", media_type="text/plain; charset=utf-8")
+    headers = {"X-PSK": "dev-psk"}
+
+    full = await client.get(f"/api/blobs/{ref.hash}", headers=headers)
+    assert full.status_code == 200
+    assert full.content == b"0123456789"
+    assert full.headers["accept-ranges"] == "bytes"
+
+    ranged = await client.get(f"/api/blobs/{ref.hash}", headers={**headers, "Range": "bytes=2-4"})
+    assert ranged.status_code == 206
+    assert ranged.content == b"234"
+    assert ranged.headers["content-range"] == "bytes 2-4/10"
+
+    suffix = await client.get(f"/api/blobs/{ref.hash}", headers={**headers, "Range": "bytes=-3"})
+    assert suffix.content == b"789"
+
+    unsatisfiable = await client.get(f"/api/blobs/{ref.hash}", headers={**headers, "Range": "bytes=20-"})
+    assert unsatisfiable.status_code == 416
+
+    missing = await client.get("/api/blobs/deadbeef", headers=headers)
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_session_blob_endpoint_serves_journaled_payloads_after_a_restart(
+    api_client, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    import vibecheck.routes.api as api_module
+    from vibecheck.blobs import BlobStore
+
+    client, manager = api_client
+    manager.journal_root = tmp_path / "journal"
+    bridge = manager.attach("session-a")
+    bridge.blob_store = BlobStore(inline_threshold=16, spill_dir=tmp_path / "spill")
+    output, ref = bridge.blob_store.externalize_text("x" * 64)
+    bridge.add_event(ToolResultEvent(call_id="tc-1", output=output, output_ref=ref))
+    blob_path = bridge.journal.blob_dir / ref.hash
+    await wait_for(blob_path.exists)
+    # A restarted server starts with an empty blob store.
+    monkeypatch.setattr(api_module, "blob_store", BlobStore(spill_dir=tmp_path / "fresh"))
+    headers = {"X-PSK": "dev-psk"}
+
+    unscoped = await client.get(f"/api/blobs/{ref.hash}", headers=headers)
+    assert unscoped.status_code == 404
+
+    full = await client.get(f"/api/sessions/session-a/blobs/{ref.hash}", headers=headers)
+    assert full.status_code == 200
+    assert full.content == b"x" * 64
+    assert full.headers["content-type"] == "text/plain; charset=utf-8"
+
+    ranged = await client.get(
+        f"/api/sessions/session-a/blobs/{ref.hash}", headers={**headers, "Range": "bytes=0-1"}
+    )
+    assert ranged.status_code == 206
+    assert ranged.content == b"xx"
+
+    missing = await client.get(f"/api/sessions/session-a/blobs/{'0' * 64}", headers=headers)
+    assert missing.status_code == 404
 
 
 @pytest.mark.asyncio
@@ -166,6 +277,9 @@ async def test_fleet_state_aggregates(api_client) -> None:
         ("get", "/api/sessions", None),
         ("get", "/api/sessions/session-a/state", None),
         ("get", "/api/sessions/session-a", None),
+        ("get", "/api/sessions/session-a/events/abc", None),
+        ("get", "/api/blobs/abc", None),
+        ("get", "/api/sessions/session-a/history", None),
         ("post", "/api/sessions/session-a/message", {"content": "hi"}),
         ("post", "/api/sessions/session-a/approve", {"call_id": "tc-1", "approved": True}),
         ("post", "/api/sessions/session-a/input", {"request_id": "req-1", "response": "ok"}),
@@ -175,3 +289,13 @@ async def test_protected_endpoints_require_psk(api_client, method: str, path: st
     client, _ = api_client
     response = await client.request(method, path, json=json_body)
     assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_interrupt_returns_409_without_a_running_turn(api_client) -> None:
+    client, manager = api_client
+    manager.attach("session-a")
+
+    response = await client.post("/api/sessions/session-a/interrupt", headers={"X-PSK": "dev-psk"})
+
+    assert response.status_code == 409
@@ -1,6 +1,7 @@
 import pytest
 
 from vibecheck.app import create_app
+from vibecheck.auth import PrefixTrie, is_exempt_path, psk_from_scope
 
 
 @pytest.mark.asyncio
@@ -52,3 +53,52 @@ def test_app_startup_fails_when_psk_missing(monkeypatch: pytest.MonkeyPatch) ->
 
     with pytest.raises(RuntimeError, match="VIBECHECK_PSK"):
         create_app()
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/", True),
+        ("/api/health", True),
+        ("/static/app.js", True),
+        ("/static/", True),
+        ("/assets/nested/app.css", True),
+        ("/icons/icon-192.png", True),
+        ("/static", False),
+        ("/staticfiles/app.js", False),
+        ("/api/static/app.js", False),
+        ("/api/state", False),
+    ],
+)
+def test_is_exempt_path_matches_exact_and_prefix_rules(path: str, expected: bool) -> None:
+    assert is_exempt_path(path) is expected
+
+
+def test_prefix_trie_handles_multi_segment_prefixes() -> None:
+    trie = PrefixTrie(("/api/public/",))
+
+    assert trie.matches("/api/public/file.txt")
+    assert trie.matches("/api/public/deep/file.txt")
+    assert not trie.matches("/api/private/file.txt")
+    assert not trie.matches("/api/public")
+
+
+def test_psk_from_scope_prefers_header_over_query() -> None:
+    scope = {"type": "http", "headers": [(b"x-psk", b"from-header")], "query_string": b"psk=from-query"}
+    assert psk_from_scope(scope) == "from-header"
+
+    scope = {"type": "http", "headers": [], "query_string": b"a=1&psk=from%20query"}
+    assert psk_from_scope(scope) == "from query"
+
+    assert psk_from_scope({"type": "http", "headers": [], "query_string": b""}) is None
+
+
+def test_psk_from_scope_accepts_a_bearer_token() -> None:
+    scope = {"type": "http", "headers": [(b"authorization", b"Bearer scrape-psk")], "query_string": b""}
+    assert psk_from_scope(scope) == "scrape-psk"
+
+    both = [(b"authorization", b"Bearer scrape-psk"), (b"x-psk", b"from-header")]
+    assert psk_from_scope({"type": "http", "headers": both, "query_string": b""}) == "from-header"
+
+    basic = {"type": "http", "headers": [(b"authorization", b"Basic abc")], "query_string": b""}
+    assert psk_from_scope(basic) is None
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pytest
+
+from vibecheck.backlog import BacklogBudget, EventBacklog, encoded_size
+from vibecheck.events import AssistantEvent
+
+
+def _event(content: str) -> AssistantEvent:
+    # A fixed id and timestamp keep every encoded size exact.
+    return AssistantEvent(id="e0000000", timestamp=1_700_000_000.0, content=content)
+
+
+def test_backlog_evicts_oldest_events_over_byte_budget() -> None:
+    size = encoded_size(_event("x" * 100))
+    backlog = EventBacklog(max_bytes=size * 3)
+
+    for i in range(10):
+        backlog.append(_event(f"{i}" * 100))
+
+    assert len(backlog) == 3
+    assert [event.content[0] for event in backlog] == ["7", "8", "9"]
+    assert backlog.bytes_used == size * 3
+    assert backlog.usage()["evicted_events"] == 7
+
+
+def test_backlog_keeps_many_small_events_and_newest_oversized_event() -> None:
+    backlog = EventBacklog(max_bytes=64 * 1024)
+    for i in range(500):
+        backlog.append(AssistantEvent(content=f"m{i}"))
+    assert len(backlog) == 500
+
+    backlog.append(AssistantEvent(content="y" * 100_000))
+    assert len(backlog) == 1
+    assert next(reversed(backlog)).content.startswith("y")
+
+
+def test_backlog_ages_out_old_events(monkeypatch: pytest.MonkeyPatch) -> None:
+    import vibecheck.backlog as backlog_module
+
+    now = [1000.0]
+    monkeypatch.setattr(backlog_module.time, "monotonic", lambda: now[0])
+    backlog = EventBacklog(max_age_seconds=60)
+    backlog.append(AssistantEvent(content="old"))
+    now[0] += 120
+    backlog.append(AssistantEvent(content="new"))
+
+    assert [event.content for event in backlog] == ["new"]
+
+
+def test_global_budget_reclaims_from_oldest_session_first() -> None:
+    size = encoded_size(_event("x" * 100))
+    budget = BacklogBudget(max_bytes=size * 4)
+    first = EventBacklog(budget=budget)
+    second = EventBacklog(budget=budget)
+
+    for i in range(3):
+        first.append(_event(f"{i}" * 100))
+    for i in range(3):
+        second.append(_event(f"{i}" * 100))
+
+    assert budget.used_bytes == size * 4
+    assert len(first) == 1
+    assert len(second) == 3
+
+    budget.unregister(first)
+    assert budget.used_bytes == second.bytes_used
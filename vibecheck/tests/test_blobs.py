@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from vibecheck.blobs import BlobStore
+
+
+def test_put_deduplicates_identical_payloads(tmp_path: Path) -> None:
+    store = BlobStore(spill_dir=tmp_path)
+
+    first = store.put(b"same file contents", media_type="text/plain")
+    second = store.put(b"same file contents", media_type="text/plain")
+
+    assert first == second
+    assert len(store) == 1
+    assert store.memory_bytes == len(b"same file contents")
+
+
+def test_lru_spills_to_disk_and_reloads(tmp_path: Path) -> None:
+    store = BlobStore(memory_budget_bytes=10, spill_dir=tmp_path)
+
+    old = store.put(b"a" * 8)
+    store.put(b"b" * 8)
+
+    assert store.memory_bytes <= 10
+    assert store.disk_bytes == 8
+    assert (tmp_path / old.hash[:2] / old.hash).exists()
+    assert store.get(old.hash) == b"a" * 8
+
+
+def test_disk_budget_drops_oldest_spilled_blob(tmp_path: Path) -> None:
+    store = BlobStore(memory_budget_bytes=0, disk_budget_bytes=10, spill_dir=tmp_path)
+
+    first = store.put(b"1" * 8)
+    second = store.put(b"2" * 8)
+
+    assert first.hash not in store
+    assert store.get(first.hash) is None
+    assert store.get(second.hash) == b"2" * 8
+
+
+def test_externalize_keeps_small_values_inline(tmp_path: Path) -> None:
+    store = BlobStore(inline_threshold=32, preview_chars=8, spill_dir=tmp_path)
+
+    assert store.externalize_text("short") == ("short", None)
+    assert store.externalize_args({"path": "a.txt"}) == ({"path": "a.txt"}, None)
+
+    preview, ref = store.externalize_text("x" * 100)
+    assert preview == "x" * 8
+    assert ref is not None and ref.size == 100
+
+    args_preview, args_ref = store.externalize_args({"path": "a.txt", "content": "y" * 100})
+    assert args_preview == {"path": "a.txt", "content": "y" * 8 + "…"}
+    assert args_ref is not None
+    assert args_ref.media_type == "application/json"
+
+
+def test_spills_inside_a_loop_are_written_off_loop_and_read_back(tmp_path: Path) -> None:
+    store = BlobStore(memory_budget_bytes=10, spill_dir=tmp_path)
+
+    async def scenario() -> tuple[bytes | None, bytes | None]:
+        old = store.put(b"a" * 8)
+        store.put(b"b" * 8)
+        # Still readable while the write is queued on the I/O thread.
+        pending = store.get(old.hash)
+        store.put(b"c" * 8)
+        await asyncio.sleep(0.05)
+        return pending, await store.aget(old.hash)
+
+    pending, reloaded = asyncio.run(scenario())
+    store.close()
+
+    assert pending == b"a" * 8
+    assert reloaded == b"a" * 8
+
+
+def test_close_removes_a_temporary_spill_directory(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("VIBECHECK_BLOB_DIR", raising=False)
+    store = BlobStore(memory_budget_bytes=0)
+    ref = store.put(b"spilled")
+    spill_dir = store._spill_dir
+
+    assert spill_dir is not None and (spill_dir / ref.hash[:2] / ref.hash).exists()
+    store.close()
+
+    assert not spill_dir.exists()
+    assert ref.hash not in store
+    assert store.get(ref.hash) is None
+
+
+def test_close_keeps_a_configured_spill_directory(tmp_path: Path) -> None:
+    store = BlobStore(memory_budget_bytes=0, spill_dir=tmp_path / "blobs")
+    ref = store.put(b"spilled")
+    store.close()
+
+    assert (tmp_path / "blobs" / ref.hash[:2] / ref.hash).exists()
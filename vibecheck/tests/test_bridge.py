@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import gc
 import json
 from pathlib import Path
+import weakref
 
 import pytest
 from pydantic import BaseModel, ConfigDict
 
+from fakes import FakeAgentLoop, FakeAssistantEvent, FakeUserMessageEvent, FakeVibeConfig, wait_for
+from vibecheck.blobs import BlobStore
+from vibecheck import bridge as bridge_module
 from vibecheck.bridge import SessionBridge, SessionManager, VibeRuntime
 from vibecheck.events import AssistantEvent
 
@@ -79,12 +84,6 @@ class FakeObservedMessage:
         self.message_id = message_id
 
 
-class FakeUserMessageEvent:
-    def __init__(self, content: str, message_id: str) -> None:
-        self.content = content
-        self.message_id = message_id
-
-
 class FakeToolCallEvent:
     def __init__(self, tool_name: str, args: FakeToolArgs, tool_call_id: str) -> None:
         self.tool_name = tool_name
@@ -99,31 +98,7 @@ class FakeToolResultEvent:
         self.error = error
 
 
-class FakeAssistantEvent:
-    def __init__(self, content: str, message_id: str | None = None) -> None:
-        self.content = content
-        self.message_id = message_id
-
-
-class FakeVibeConfig:
-    @classmethod
-    def load(cls):
-        return cls()
-
-
-class FakeAgentLoop:
-    def __init__(self, _config, message_observer=None, enable_streaming: bool = False) -> None:
-        _ = enable_streaming
-        self.message_observer = message_observer
-        self.approval_callback = None
-        self.user_input_callback = None
-
-    def set_approval_callback(self, callback) -> None:
-        self.approval_callback = callback
-
-    def set_user_input_callback(self, callback) -> None:
-        self.user_input_callback = callback
-
+class ScriptedAgentLoop(FakeAgentLoop):
     async def act(self, msg: str):
         yield FakeUserMessageEvent(content=msg, message_id="m-user-1")
         if self.message_observer:
@@ -202,6 +177,203 @@ def test_session_bridge_backlog_is_capped() -> None:
     assert backlog[-1].content == "message-59"
 
 
+@pytest.mark.asyncio
+async def test_large_tool_payloads_are_stored_once_by_reference(tmp_path: Path) -> None:
+    store = BlobStore(inline_threshold=64, preview_chars=8, spill_dir=tmp_path)
+    bridge = SessionBridge("blobs", blob_store=store)
+    big_output = "line\n" * 100
+
+    first = bridge._convert_vibe_event(
+        FakeToolResultEvent(tool_call_id="tc-1", result=FakeToolResult(answer=big_output, command="cat"))
+    )
+    second = bridge._convert_vibe_event(
+        FakeToolResultEvent(tool_call_id="tc-2", result=FakeToolResult(answer=big_output, command="cat"))
+    )
+
+    assert first.output_ref is not None
+    assert first.output_ref == second.output_ref
+    assert len(first.output) == 8
+    assert len(store) == 1
+    assert json.loads(store.get(first.output_ref.hash))["answer"] == big_output
+
+    task = asyncio.create_task(bridge.request_approval("tc-3", "write_file", {"content": "x" * 200}))
+    await asyncio.sleep(0)
+    pending = bridge.state_payload()["pending_approval"]
+    assert pending["args"] == {"content": "x" * 8 + "…"}
+    assert pending["args_ref"]["size"] > 200
+    assert bridge.resolve_approval("tc-3", approved=True)
+    await task
+
+
+class FakePydanticToolResult(BaseModel):
+    command: str
+    stdout: str
+
+
+def test_vibe_event_converters_are_cached_per_class() -> None:
+    bridge = SessionBridge("dispatch")
+    bridge_module._VIBE_EVENT_CONVERTERS.clear()
+
+    first = bridge._convert_vibe_event(FakeAssistantEvent(content="one"))
+    second = bridge._convert_vibe_event(FakeAssistantEvent(content="two"))
+    ignored = bridge._convert_vibe_event(FakeObservedMessage(role="user", content="x", message_id="m"))
+
+    assert isinstance(first, AssistantEvent) and first.content == "one"
+    assert isinstance(second, AssistantEvent) and second.content == "two"
+    assert ignored is None
+    assert bridge_module._VIBE_EVENT_CONVERTERS[FakeAssistantEvent] is SessionBridge._convert_assistant
+    assert bridge_module._VIBE_EVENT_CONVERTERS[FakeObservedMessage] is None
+
+
+def test_pydantic_tool_results_serialize_to_json() -> None:
+    bridge = SessionBridge("tool-json")
+
+    event = bridge._convert_vibe_event(
+        FakeToolResultEvent(tool_call_id="tc-1", result=FakePydanticToolResult(command="pwd", stdout="/tmp"))
+    )
+
+    assert json.loads(event.output) == {"command": "pwd", "stdout": "/tmp"}
+    assert event.is_error is False
+
+
+def test_journaled_history_survives_restart(tmp_path: Path) -> None:
+    manager = SessionManager(logs_root=tmp_path / "logs", journal_root=tmp_path / "journal")
+    bridge = manager.attach("durable")
+    for i in range(60):
+        bridge.add_event(AssistantEvent(content=f"message-{i}"))
+
+    assert bridge.event_seq == 60
+    assert [seq for seq, _ in bridge.history(after_seq=5, limit=3)] == [6, 7, 8]
+    manager.detach("durable")
+
+    restarted = SessionManager(logs_root=tmp_path / "logs", journal_root=tmp_path / "journal")
+    revived = restarted.attach("durable")
+    assert revived.event_seq > 60
+    assert revived.backlog(limit=5)[-1].state == "disconnected"
+    assert revived.history(after_seq=0, limit=1)[0][1].content == "message-0"
+
+
+def test_history_without_journal_numbers_in_memory_backlog() -> None:
+    bridge = SessionBridge("memory-only")
+    for i in range(60):
+        bridge.add_event(AssistantEvent(content=f"message-{i}"))
+
+    records = bridge.history(after_seq=58)
+    assert [(seq, event.content) for seq, event in records] == [(59, "message-58"), (60, "message-59")]
+
+
+def _write_session_meta(logs_root: Path, session_id: str) -> None:
+    session_dir = logs_root / session_id
+    session_dir.mkdir(parents=True)
+    (session_dir / "meta.json").write_text(json.dumps({"session_id": session_id}), encoding="utf-8")
+
+
+def test_session_manager_evicts_idle_observe_only_bridges_after_ttl(tmp_path: Path) -> None:
+    manager = SessionManager(logs_root=tmp_path, idle_ttl_seconds=60, max_resident=0)
+    _write_session_meta(tmp_path, "browsed")
+    bridge = manager.attach("browsed")
+    bridge.add_event(AssistantEvent(content="hello"))
+    budget_bytes = manager.backlog_budget.used_bytes
+
+    assert manager.evict_idle(now=bridge.last_active + 30) == []
+    assert manager.evict_idle(now=bridge.last_active + 61) == ["browsed"]
+    assert "browsed" not in manager.sessions
+    assert manager.backlog_budget.used_bytes == budget_bytes - bridge.event_backlog.bytes_used
+    assert manager.has_known_session("browsed")
+    assert [item["id"] for item in manager.list()] == ["browsed"]
+    assert manager.attach("browsed").attach_mode == "observe_only"
+
+
+@pytest.mark.asyncio
+async def test_eviction_sweeps_run_without_attach_or_list(tmp_path: Path) -> None:
+    manager = SessionManager(logs_root=tmp_path, idle_ttl_seconds=0.05, max_resident=0, eviction_sweep_seconds=0.01)
+    _write_session_meta(tmp_path, "browsed")
+    manager.attach("browsed")
+    manager.start_eviction_sweeps()
+    try:
+        await wait_for(lambda: "browsed" not in manager.sessions)
+    finally:
+        await manager.stop_eviction_sweeps()
+
+    assert manager.has_known_session("browsed")
+    disabled = SessionManager(logs_root=tmp_path, idle_ttl_seconds=0, max_resident=0)
+    disabled.start_eviction_sweeps()
+    assert disabled._sweep_task is None
+
+
+@pytest.mark.asyncio
+async def test_evicted_and_detail_only_sessions_reuse_their_loaded_journal(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manager = SessionManager(logs_root=tmp_path / "logs", journal_root=tmp_path / "journal", idle_ttl_seconds=60)
+    _write_session_meta(tmp_path / "logs", "browsed")
+    _write_session_meta(tmp_path / "logs", "cold")
+    previous_run = SessionBridge("cold", journal=manager.open_journal("cold"))
+    previous_run.add_event(AssistantEvent(content="from disk"))
+    previous_run.stop()
+    bridge = await manager.aattach("browsed")
+    bridge.add_event(AssistantEvent(content="hello"))
+    journal = bridge.journal
+    assert manager.evict_idle(now=bridge.last_active + 61) == ["browsed"]
+
+    opened: list[str] = []
+    real_init = bridge_module.SessionJournal.__init__
+
+    def counting_init(self, directory, **kwargs) -> None:
+        opened.append(directory.name)
+        real_init(self, directory, **kwargs)
+
+    monkeypatch.setattr(bridge_module.SessionJournal, "__init__", counting_init)
+
+    first = await manager.session_detail("cold")
+    second = await manager.session_detail("cold")
+    revived = await manager.aattach("browsed")
+
+    assert [event["content"] for event in first["backlog"] if event["type"] == "assistant"] == ["from disk"]
+    assert second["backlog"] == first["backlog"]
+    assert opened == ["cold"]
+    assert revived.journal is journal
+    assert revived.history()[-1][1].content == "hello"
+
+
+def test_session_manager_caps_resident_bridges_in_lru_order(tmp_path: Path) -> None:
+    manager = SessionManager(logs_root=tmp_path, idle_ttl_seconds=0, max_resident=2)
+    for session_id in ("a", "b", "c"):
+        _write_session_meta(tmp_path, session_id)
+
+    manager.attach("a")
+    manager.attach("b")
+    manager.attach("a")
+    manager.attach("c")
+    assert manager.evict_idle() == ["b"]
+    assert list(manager.sessions) == ["a", "c"]
+    assert manager.evictions == 1
+    assert {item["id"] for item in manager.list()} == {"a", "b", "c"}
+
+
+def test_session_manager_keeps_busy_bridges_resident(tmp_path: Path) -> None:
+    class ClientCounter:
+        def session_clients(self, session_id: str) -> int:
+            return 1 if session_id == "watched" else 0
+
+    manager = SessionManager(logs_root=tmp_path, connection_manager=ClientCounter(), idle_ttl_seconds=1)
+    manager.attach("watched", attach_mode="observe_only")
+    manager.attach("live", attach_mode="live")
+    waiting = manager.attach("waiting", attach_mode="observe_only")
+    waiting.pending_approval["tc-1"] = object()
+    running = manager.attach("running")
+    running.state = "running"
+    finished = manager.attach("finished")
+    finished.state = "disconnected"
+    manager.attach("never-started")
+
+    evicted = manager.evict_idle(now=float("inf"))
+
+    assert sorted(evicted) == ["finished", "never-started"]
+    assert sorted(manager.sessions) == ["live", "running", "waiting", "watched"]
+    assert manager.attach("finished").attach_mode == "managed"
+
+
 def test_session_manager_discover_attach_detach_and_fleet_status(tmp_path: Path) -> None:
     logs_root = tmp_path / "logs" / "session"
     session_a = logs_root / "session_a"
@@ -250,7 +422,7 @@ async def test_start_session_wires_agent_loop_callbacks_and_processes_events(
     import vibecheck.bridge as bridge_module
 
     runtime = bridge_module.VibeRuntime(
-        agent_loop_cls=FakeAgentLoop,
+        agent_loop_cls=ScriptedAgentLoop,
         vibe_config_cls=FakeVibeConfig,
         approval_yes=FakeApprovalResponse.YES,
         approval_no=FakeApprovalResponse.NO,
@@ -292,7 +464,7 @@ async def test_inject_message_lazily_starts_agent_loop_when_runtime_is_available
     import vibecheck.bridge as bridge_module
 
     runtime = bridge_module.VibeRuntime(
-        agent_loop_cls=FakeAgentLoop,
+        agent_loop_cls=ScriptedAgentLoop,
         vibe_config_cls=FakeVibeConfig,
         approval_yes=FakeApprovalResponse.YES,
         approval_no=FakeApprovalResponse.NO,
@@ -328,7 +500,7 @@ async def test_edited_args_are_applied_to_tool_invocation(
     import vibecheck.bridge as bridge_module
 
     runtime = bridge_module.VibeRuntime(
-        agent_loop_cls=FakeAgentLoop,
+        agent_loop_cls=ScriptedAgentLoop,
         vibe_config_cls=FakeVibeConfig,
         approval_yes=FakeApprovalResponse.YES,
         approval_no=FakeApprovalResponse.NO,
@@ -362,7 +534,7 @@ async def test_invalid_edited_args_deny_execution_and_do_not_mutate_tool_args(
     import vibecheck.bridge as bridge_module
 
     runtime = bridge_module.VibeRuntime(
-        agent_loop_cls=FakeAgentLoop,
+        agent_loop_cls=ScriptedAgentLoop,
         vibe_config_cls=FakeVibeConfig,
         approval_yes=FakeApprovalResponse.YES,
         approval_no=FakeApprovalResponse.NO,
@@ -397,14 +569,14 @@ def test_attach_to_loop_sets_live_mode_and_wires_callbacks() -> None:
     import vibecheck.bridge as bridge_module
 
     runtime = bridge_module.VibeRuntime(
-        agent_loop_cls=FakeAgentLoop,
+        agent_loop_cls=ScriptedAgentLoop,
         vibe_config_cls=FakeVibeConfig,
         approval_yes=FakeApprovalResponse.YES,
         approval_no=FakeApprovalResponse.NO,
         ask_result_cls=FakeAskUserQuestionResult,
         answer_cls=FakeAnswer,
     )
-    fake_loop = FakeAgentLoop(FakeVibeConfig.load())
+    fake_loop = ScriptedAgentLoop(FakeVibeConfig.load())
     bridge = SessionBridge("live-1")
 
     bridge.attach_to_loop(fake_loop, runtime)
@@ -444,7 +616,7 @@ async def test_attach_to_loop_uses_existing_loop_for_message_injection(
     import vibecheck.bridge as bridge_module
 
     runtime = bridge_module.VibeRuntime(
-        agent_loop_cls=FakeAgentLoop,
+        agent_loop_cls=ScriptedAgentLoop,
         vibe_config_cls=FakeVibeConfig,
         approval_yes=FakeApprovalResponse.YES,
         approval_no=FakeApprovalResponse.NO,
@@ -454,7 +626,7 @@ async def test_attach_to_loop_uses_existing_loop_for_message_injection(
 
     manager = RecordingConnectionManager()
     bridge = SessionBridge("live-2", connection_manager=manager)
-    fake_loop = FakeAgentLoop(FakeVibeConfig.load())
+    fake_loop = ScriptedAgentLoop(FakeVibeConfig.load())
     bridge.attach_to_loop(fake_loop, runtime)
 
     assert bridge.inject_message("from-live")
@@ -478,7 +650,7 @@ async def test_raw_event_listener_receives_unconverted_agent_events(
     import vibecheck.bridge as bridge_module
 
     runtime = bridge_module.VibeRuntime(
-        agent_loop_cls=FakeAgentLoop,
+        agent_loop_cls=ScriptedAgentLoop,
         vibe_config_cls=FakeVibeConfig,
         approval_yes=FakeApprovalResponse.YES,
         approval_no=FakeApprovalResponse.NO,
@@ -501,6 +673,8 @@ async def test_raw_event_listener_receives_unconverted_agent_events(
     request_id = next(iter(bridge.pending_input.keys()))
     assert bridge.resolve_input(request_id=request_id, response="yes")
     await _wait_until(lambda: bridge.state == "idle")
+    # Coroutine listeners are drained off the producer path, so give the queue a moment.
+    await _wait_until(lambda: "FakeToolResultEvent" in raw_kinds)
 
     assert "FakeUserMessageEvent" in raw_kinds
     assert "FakeToolCallEvent" in raw_kinds
@@ -516,7 +690,7 @@ async def test_local_callbacks_can_resolve_approval_and_input_without_rest(
     import vibecheck.bridge as bridge_module
 
     runtime = bridge_module.VibeRuntime(
-        agent_loop_cls=FakeAgentLoop,
+        agent_loop_cls=ScriptedAgentLoop,
         vibe_config_cls=FakeVibeConfig,
         approval_yes=FakeApprovalResponse.YES,
         approval_no=FakeApprovalResponse.NO,
@@ -527,7 +701,7 @@ async def test_local_callbacks_can_resolve_approval_and_input_without_rest(
 
     manager = RecordingConnectionManager()
     bridge = SessionBridge("local-callbacks", connection_manager=manager)
-    loop = FakeAgentLoop(FakeVibeConfig.load())
+    loop = ScriptedAgentLoop(FakeVibeConfig.load())
 
     async def local_approval(_tool: str, _args: object, _call_id: str) -> tuple[str, None]:
         return (FakeApprovalResponse.YES, None)
@@ -580,9 +754,9 @@ async def test_mobile_resolution_does_not_leave_local_pending_state_stuck() -> N
     owner = CancellationSensitiveOwner()
     manager = RecordingConnectionManager()
     bridge = SessionBridge("mobile-first", connection_manager=manager)
-    loop = FakeAgentLoop(FakeVibeConfig.load())
+    loop = ScriptedAgentLoop(FakeVibeConfig.load())
     runtime = VibeRuntime(
-        agent_loop_cls=FakeAgentLoop,
+        agent_loop_cls=ScriptedAgentLoop,
         vibe_config_cls=FakeVibeConfig,
         approval_yes=FakeApprovalResponse.YES,
         approval_no=FakeApprovalResponse.NO,
@@ -655,6 +829,59 @@ async def test_settle_local_state_resolves_wrapped_and_partial_callbacks() -> No
     await _wait_until(lambda: owner.switch_to_input_calls >= 2)
 
 
+def test_callback_owner_resolution_is_cached_and_invalidated(monkeypatch: pytest.MonkeyPatch) -> None:
+    class Owner:
+        def __init__(self) -> None:
+            self._pending_approval = None
+
+        async def approval_callback(self, _tool: str, _args: object, _call_id: str):
+            return (FakeApprovalResponse.YES, None)
+
+    walks: list[object] = []
+    real_find = bridge_module._find_callback_owner
+
+    def counting_find(callback: object, pending_attr: str) -> object | None:
+        walks.append(callback)
+        return real_find(callback, pending_attr)
+
+    monkeypatch.setattr(bridge_module, "_find_callback_owner", counting_find)
+    first, second = Owner(), Owner()
+    bridge = SessionBridge("owner-cache")
+    bridge.configure_local_callbacks(approval_callback=first.approval_callback, input_callback=None)
+
+    for _ in range(3):
+        bridge._settle_local_approval_state(approved=True)
+    assert len(walks) == 1
+
+    bridge.configure_local_callbacks(approval_callback=second.approval_callback, input_callback=None)
+    assert bridge._local_owner_for_settle(
+        bridge._local_approval_callback,
+        pending_attr="_pending_approval",
+        owner_hint=None,
+        callback_label="approval",
+    ) is second
+    assert len(walks) == 2
+
+
+def test_callback_owner_cache_does_not_keep_owner_alive() -> None:
+    class Owner:
+        def __init__(self) -> None:
+            self._pending_approval = None
+
+        async def approval_callback(self, _tool: str, _args: object, _call_id: str):
+            return (FakeApprovalResponse.YES, None)
+
+    owner = Owner()
+    owner_ref = weakref.ref(owner)
+    bridge = SessionBridge("owner-weak")
+    bridge.configure_local_callbacks(approval_callback=owner.approval_callback, input_callback=None)
+    bridge.configure_local_callbacks(approval_callback=None, input_callback=None)
+    del owner
+    gc.collect()
+
+    assert owner_ref() is None
+
+
 @pytest.mark.asyncio
 async def test_settle_local_state_schedules_follow_up_ui_reset() -> None:
     class Owner:
@@ -685,7 +912,7 @@ async def test_late_local_approval_task_skips_after_mobile_resolution(
     import vibecheck.bridge as bridge_module
 
     runtime = VibeRuntime(
-        agent_loop_cls=FakeAgentLoop,
+        agent_loop_cls=ScriptedAgentLoop,
         vibe_config_cls=FakeVibeConfig,
         approval_yes=FakeApprovalResponse.YES,
         approval_no=FakeApprovalResponse.NO,
@@ -722,7 +949,7 @@ async def test_late_local_approval_task_skips_after_mobile_resolution(
     owner = Owner()
     bridge = SessionBridge("late-approval")
     bridge.attach_to_loop(
-        FakeAgentLoop(FakeVibeConfig.load()),
+        ScriptedAgentLoop(FakeVibeConfig.load()),
         runtime,
         approval_callback=owner.approval_callback,
         input_callback=None,
@@ -753,7 +980,7 @@ async def test_late_local_input_task_skips_after_mobile_resolution(
     import vibecheck.bridge as bridge_module
 
     runtime = VibeRuntime(
-        agent_loop_cls=FakeAgentLoop,
+        agent_loop_cls=ScriptedAgentLoop,
         vibe_config_cls=FakeVibeConfig,
         approval_yes=FakeApprovalResponse.YES,
         approval_no=FakeApprovalResponse.NO,
@@ -790,7 +1017,7 @@ async def test_late_local_input_task_skips_after_mobile_resolution(
     owner = Owner()
     bridge = SessionBridge("late-input")
     bridge.attach_to_loop(
-        FakeAgentLoop(FakeVibeConfig.load()),
+        ScriptedAgentLoop(FakeVibeConfig.load()),
         runtime,
         approval_callback=None,
         input_callback=owner.input_callback,
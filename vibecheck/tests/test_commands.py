@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from vibecheck.bridge import SessionBridge
+from vibecheck.commands import (
+    ApproveCommand,
+    InputCommand,
+    MessageCommand,
+    PingCommand,
+    execute_command,
+    parse_command,
+)
+from vibecheck.events import CommandAckEvent
+
+
+def test_parse_command_dispatches_on_type() -> None:
+    approve = parse_command('{"type": "approve", "correlation_id": "c1", "call_id": "tc-1", "approved": true}')
+    assert isinstance(approve, ApproveCommand)
+    assert approve.correlation_id == "c1"
+    assert isinstance(parse_command('{"type": "input", "request_id": "r", "response": "y"}'), InputCommand)
+    assert isinstance(parse_command('{"type": "message", "content": "hi"}'), MessageCommand)
+    assert isinstance(parse_command('{"type": "ping"}'), PingCommand)
+
+
+def test_parse_command_rejects_invalid_frames_with_correlated_ack() -> None:
+    unknown = parse_command('{"type": "explode", "correlation_id": "c2"}')
+    assert isinstance(unknown, CommandAckEvent)
+    assert unknown.ok is False
+    assert unknown.correlation_id == "c2"
+    assert unknown.error and unknown.error.startswith("Invalid command")
+
+    garbage = parse_command("not json")
+    assert isinstance(garbage, CommandAckEvent)
+    assert garbage.ok is False
+    assert garbage.correlation_id is None
+
+
+@pytest.mark.asyncio
+async def test_execute_approve_resolves_pending_future() -> None:
+    bridge = SessionBridge(session_id="s1")
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    bridge.pending_approval["tc-1"] = future
+
+    ack = execute_command(bridge, ApproveCommand(correlation_id="c1", call_id="tc-1", approved=True))
+
+    assert ack.ok is True
+    assert ack.correlation_id == "c1"
+    assert await future == {"approved": True, "edited_args": None}
+
+    missing = execute_command(bridge, ApproveCommand(correlation_id="c2", call_id="tc-1", approved=True))
+    assert missing.ok is False
+    assert missing.error == "No pending approval for call_id=tc-1"
+
+
+@pytest.mark.asyncio
+async def test_execute_input_and_ping() -> None:
+    bridge = SessionBridge(session_id="s1")
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    bridge.pending_input["req-1"] = future
+
+    ack = execute_command(bridge, InputCommand(request_id="req-1", response="yes"))
+    assert ack.ok is True
+    assert await future == "yes"
+
+    missing = execute_command(bridge, InputCommand(request_id="req-1", response="yes"))
+    assert missing.error == "No pending input for request_id=req-1"
+
+    pong = execute_command(bridge, PingCommand(correlation_id="p"))
+    assert pong.ok is True
+    assert pong.status == "pong"
+
+
+@pytest.mark.asyncio
+async def test_execute_message_reports_unavailable_runtime() -> None:
+    bridge = SessionBridge(session_id="s1")
+    bridge.attach_mode = "observe_only"
+
+    ack = execute_command(bridge, MessageCommand(correlation_id="m1", content="hello"))
+
+    assert ack.ok is False
+    assert ack.error == "Vibe runtime unavailable; message was not forwarded to AgentLoop"
+    assert bridge.messages_to_inject[-1] == "hello"
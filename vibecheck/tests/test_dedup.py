@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import pytest
+
+from vibecheck.dedup import RecentIds
+
+
+def test_add_reports_duplicates_within_window() -> None:
+    recent = RecentIds(max_size=3)
+
+    assert recent.add("a") is True
+    assert recent.add("a") is False
+    assert "a" in recent
+    assert len(recent) == 1
+
+
+def test_oldest_ids_fall_out_of_the_window() -> None:
+    recent = RecentIds(max_size=2)
+    recent.add("a")
+    recent.add("b")
+    recent.add("c")
+
+    assert "a" not in recent
+    assert len(recent) == 2
+    assert recent.add("a") is True
+
+
+def test_duplicate_hit_refreshes_recency() -> None:
+    recent = RecentIds(max_size=2)
+    recent.add("a")
+    recent.add("b")
+    recent.add("a")
+    recent.add("c")
+
+    assert "a" in recent
+    assert "b" not in recent
+
+
+def test_rejects_empty_window() -> None:
+    with pytest.raises(ValueError):
+        RecentIds(max_size=0)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from fakes import wait_for
+from vibecheck.bridge import SessionBridge, SessionManager
+from vibecheck.injections import InjectionAudit
+
+
+def test_audit_is_bounded_by_entries_and_bytes() -> None:
+    audit = InjectionAudit(max_entries=3, max_bytes=1000, max_content_chars=400)
+    first = audit.record("a" * 10)
+    for index in range(3):
+        audit.record(f"prompt {index}")
+
+    assert len(audit) == 3
+    assert audit.get(first.injection_id) is None
+    audit.mark_finished(first.injection_id)
+
+    long = audit.record("b" * 5000)
+    assert long.chars == 5000
+    assert long.to_dict()["truncated"] is True
+    assert audit.bytes_used <= 1000
+    audit.record("c" * 400)
+    audit.record("d" * 400)
+    assert audit.bytes_used <= 1000
+    assert audit.usage()["evicted"] == audit.total - len(audit)
+
+
+def test_audit_status_transitions_are_one_way() -> None:
+    audit = InjectionAudit()
+    entry = audit.record("hello")
+
+    audit.mark_started(entry.injection_id)
+    audit.mark_failed(entry.injection_id, "boom")
+    audit.mark_finished(entry.injection_id)
+    audit.mark_started(entry.injection_id)
+
+    assert entry.status == "failed"
+    assert entry.error == "boom"
+    assert entry.started_at is not None and entry.finished_at is not None
+    assert audit.recent(status="failed")[0]["id"] == entry.injection_id
+    assert audit.recent(status="queued") == []
+
+
+@pytest.mark.asyncio
+async def test_inline_injections_move_through_delivery_states(gated_agent_loop) -> None:
+    bridge = SessionBridge("audited")
+    try:
+        assert bridge.inject_message("first")
+        assert bridge.inject_message("explode")
+        first, second = reversed(bridge.injections.recent())
+
+        await wait_for(lambda: bridge.injections.get(first["id"]).status == "started")
+        assert bridge.injections.get(second["id"]).status == "queued"
+
+        gated_agent_loop.gate.set()
+        await wait_for(lambda: bridge.injections.get(second["id"]).status == "failed")
+        assert bridge.injections.get(first["id"]).status == "finished"
+        assert bridge.messages_to_inject == ["first", "explode"]
+    finally:
+        bridge.stop()
+
+
+def test_observe_only_injection_is_recorded_as_failed() -> None:
+    bridge = SessionBridge("observer", attach_mode="observe_only")
+
+    assert bridge.inject_message("hello") is False
+
+    [entry] = bridge.injections.recent()
+    assert entry["status"] == "failed"
+    assert entry["error"] == "session is observe-only"
+
+
+@pytest.mark.asyncio
+async def test_injections_endpoint_lists_recent_prompts(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    import vibecheck.routes.api as api_module
+    from vibecheck.app import create_app
+
+    monkeypatch.setenv("VIBECHECK_PSK", "dev-psk")
+    session_dir = tmp_path / "session_a"
+    session_dir.mkdir()
+    (session_dir / "meta.json").write_text(json.dumps({"session_id": "session-a"}), encoding="utf-8")
+    manager = SessionManager(logs_root=tmp_path)
+    monkeypatch.setattr(api_module, "session_manager", manager)
+    bridge = manager.attach("session-a")
+    bridge.injections.record("one")
+    bridge.injections.mark_failed(bridge.injections.record("two").injection_id, "nope")
+
+    transport = ASGITransport(app=create_app())
+    headers = {"X-PSK": "dev-psk"}
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        listing = await client.get("/api/sessions/session-a/injections", headers=headers)
+        failed = await client.get("/api/sessions/session-a/injections", params={"status": "failed"}, headers=headers)
+        invalid = await client.get("/api/sessions/session-a/injections", params={"status": "lost"}, headers=headers)
+
+    assert [entry["content"] for entry in listing.json()["injections"]] == ["two", "one"]
+    assert listing.json()["usage"]["queued"] == 1
+    assert [entry["error"] for entry in failed.json()["injections"]] == ["nope"]
+    assert invalid.status_code == 400
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+import time
+
+import pytest
+
+import vibecheck.journal as journal_module
+from vibecheck.events import AssistantEvent, BlobRef
+from vibecheck.journal import RECORD_HEADER, RetentionPolicy, SessionJournal, read_journal_blob
+
+
+def _contents(records) -> list[str]:
+    return [event.content for _seq, event in records]
+
+
+def test_append_assigns_sequential_seq_and_supports_range_reads(tmp_path: Path) -> None:
+    journal = SessionJournal(tmp_path / "s1")
+    seqs = [journal.append(AssistantEvent(content=f"m{i}")) for i in range(5)]
+
+    assert seqs == [1, 2, 3, 4, 5]
+    assert _contents(journal.read(after_seq=2)) == ["m2", "m3", "m4"]
+    assert _contents(journal.read(after_seq=0, limit=2)) == ["m0", "m1"]
+    assert _contents(journal.tail(2)) == ["m3", "m4"]
+    journal.close()
+
+
+def test_segments_rotate_and_retention_drops_oldest(tmp_path: Path) -> None:
+    journal = SessionJournal(
+        tmp_path / "s1",
+        segment_bytes=200,
+        retention=RetentionPolicy(max_segments=2, max_bytes=None),
+    )
+    for i in range(20):
+        journal.append(AssistantEvent(content=f"message-{i:02d}"))
+
+    assert journal.segment_count == 2
+    assert len(list((tmp_path / "s1").glob("*.seg"))) == 2
+    assert journal.first_seq > 1
+    assert journal.read()[-1][0] == 20
+    journal.close()
+
+
+def test_reopen_recovers_seq_and_truncates_torn_tail(tmp_path: Path) -> None:
+    journal = SessionJournal(tmp_path / "s1")
+    journal.append(AssistantEvent(content="kept"))
+    journal.close()
+
+    segment = next((tmp_path / "s1").glob("*.seg"))
+    with segment.open("ab") as handle:
+        handle.write(RECORD_HEADER.pack(100, 2) + b"{partial")
+
+    reopened = SessionJournal(tmp_path / "s1")
+    assert reopened.last_seq == 1
+    assert reopened.append(AssistantEvent(content="after-restart")) == 2
+    assert _contents(reopened.read()) == ["kept", "after-restart"]
+    reopened.close()
+
+
+def test_find_locates_event_by_id(tmp_path: Path) -> None:
+    journal = SessionJournal(tmp_path / "s1")
+    target = AssistantEvent(content="needle")
+    journal.append(AssistantEvent(content="hay"))
+    journal.append(target)
+
+    found = journal.find(target.id)
+    assert found is not None and found.content == "needle"
+    assert journal.find("missing") is None
+    journal.close()
+
+
+def test_find_uses_the_id_index_across_rotation_reopen_and_retention(tmp_path: Path) -> None:
+    journal = SessionJournal(
+        tmp_path / "s1",
+        segment_bytes=200,
+        retention=RetentionPolicy(max_segments=2, max_bytes=None),
+    )
+    events = [AssistantEvent(content=f"message-{i:02d}") for i in range(20)]
+    for event in events:
+        journal.append(event)
+    assert journal.find(events[0].id) is None
+    assert journal.find(events[-1].id).content == "message-19"
+    journal.close()
+
+    reopened = SessionJournal(tmp_path / "s1", segment_bytes=200)
+    retained = {event.id for _seq, event in reopened.read()}
+
+    assert reopened.find(events[0].id) is None
+    assert reopened.find(events[-1].id).content == "message-19"
+    assert all(reopened.find(event.id) is not None for event in events if event.id in retained)
+    assert asyncio.run(reopened.afind(events[-2].id)).content == "message-18"
+    reopened.close()
+
+
+def test_reopen_loads_sealed_segments_from_their_index_without_parsing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    journal = SessionJournal(tmp_path / "s1", segment_bytes=200)
+    events = [AssistantEvent(content=f"message-{i:02d}") for i in range(8)]
+    for event in events:
+        journal.append(event)
+    journal.close()
+    assert len(list((tmp_path / "s1").glob("*.idx"))) == journal.segment_count
+
+    def unexpected_parse(body: bytes) -> str | None:
+        raise AssertionError("sealed segments should not be re-parsed")
+
+    monkeypatch.setattr(journal_module, "_body_event_id", unexpected_parse)
+    reopened = asyncio.run(SessionJournal.aopen(tmp_path / "s1", segment_bytes=200))
+
+    assert reopened.last_seq == 8
+    assert reopened.find(events[0].id).content == "message-00"
+    assert reopened.find(events[-1].id).content == "message-07"
+    reopened.close()
+
+
+def test_records_appended_after_the_index_was_written_are_scanned(tmp_path: Path) -> None:
+    journal = SessionJournal(tmp_path / "s1")
+    first = AssistantEvent(content="sealed")
+    journal.append(first)
+    journal.close()
+    # Appending reopens the sealed segment; the process then dies without closing it again.
+    later = AssistantEvent(content="unsealed")
+    journal.append(later)
+    journal.sync()
+
+    reopened = SessionJournal(tmp_path / "s1")
+
+    assert reopened.last_seq == 2
+    assert reopened.find(first.id).content == "sealed"
+    assert reopened.find(later.id).content == "unsealed"
+    reopened.close()
+
+
+def test_range_reads_seek_through_the_sparse_seq_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    journal = SessionJournal(tmp_path / "s1")
+    for i in range(300):
+        journal.append(AssistantEvent(content=f"m{i}"))
+    journal.close()
+    reopened = SessionJournal(tmp_path / "s1")
+
+    starts: list[int] = []
+    real_iter_records = journal_module._iter_records
+
+    def recording_iter_records(handle, offset=0):
+        starts.append(offset)
+        return real_iter_records(handle, offset)
+
+    monkeypatch.setattr(journal_module, "_iter_records", recording_iter_records)
+
+    assert _contents(reopened.read(after_seq=260, limit=3)) == ["m260", "m261", "m262"]
+    assert starts[-1] > 0
+    assert _contents(reopened.tail(2)) == ["m298", "m299"]
+    assert _contents(asyncio.run(reopened.aread(after_seq=127, limit=2))) == ["m127", "m128"]
+    assert _contents(asyncio.run(reopened.atail(1))) == ["m299"]
+    assert [seq for seq, _event in reopened.read(after_seq=63, limit=2)] == [64, 65]
+    reopened.close()
+
+
+def test_kept_blobs_survive_reopen_and_expire_with_their_segments(tmp_path: Path) -> None:
+    journal = SessionJournal(
+        tmp_path / "s1",
+        segment_bytes=200,
+        retention=RetentionPolicy(max_segments=2, max_bytes=None),
+    )
+    expired = BlobRef(hash="a" * 64, size=3, media_type="text/plain; charset=utf-8")
+    live = BlobRef(hash="b" * 64, size=4, media_type="application/json")
+    journal.keep_blob(expired, b"old")
+    journal.keep_blob(live, b"{}{}")
+    os.utime(journal.blob_dir / expired.hash, (1000, 1000))
+    os.utime(journal.blob_dir / live.hash, (time.time() + 3600,) * 2)
+
+    assert read_journal_blob(tmp_path / "s1", live.hash) == (b"{}{}", "application/json")
+    for i in range(20):
+        journal.append(AssistantEvent(content=f"message-{i:02d}"))
+    journal.close()
+
+    assert read_journal_blob(tmp_path / "s1", expired.hash) is None
+    assert read_journal_blob(tmp_path / "s1", live.hash) == (b"{}{}", "application/json")
+    assert read_journal_blob(tmp_path / "s1", "../s1") is None
@@ -109,72 +109,75 @@ def test_launch_creates_live_bridge_and_runs_app(
     assert FakeVibeCheckApp.last_instance.kwargs["ws_port"] == 9001
 
 
-@pytest.mark.asyncio
-async def test_on_mount_rebinds_callbacks_and_intercepts_future_rebinds(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    class Loop:
-        def __init__(self) -> None:
-            self.approval_callback = None
-            self.user_input_callback = None
+class MountedAgentLoop:
+    def __init__(self) -> None:
+        self.approval_callback = None
+        self.user_input_callback = None
 
-        def set_approval_callback(self, callback) -> None:
-            self.approval_callback = callback
+    def set_approval_callback(self, callback) -> None:
+        self.approval_callback = callback
 
-        def set_user_input_callback(self, callback) -> None:
-            self.user_input_callback = callback
+    def set_user_input_callback(self, callback) -> None:
+        self.user_input_callback = callback
 
-    class Bridge:
-        def __init__(self) -> None:
-            self.attach_calls: list[dict] = []
-            self._local_approval_callback = None
-            self._local_input_callback = None
-
-        @property
-        def local_approval_callback(self):
-            return self._local_approval_callback
-
-        @property
-        def local_input_callback(self):
-            return self._local_input_callback
-
-        async def _approval_callback(self, *_args):
-            return ("yes", None)
-
-        async def _user_input_callback(self, *_args):
-            return {"response": "ok"}
-
-        def configure_local_callbacks(self, *, approval_callback, input_callback) -> None:
-            self._local_approval_callback = approval_callback
-            self._local_input_callback = input_callback
-
-        def attach_to_loop(self, agent_loop, *_args, approval_callback=None, input_callback=None, **_kwargs) -> None:
-            self.attach_calls.append(
-                {
-                    "approval_callback": approval_callback,
-                    "input_callback": input_callback,
-                }
-            )
-            self.configure_local_callbacks(
-                approval_callback=approval_callback,
-                input_callback=input_callback,
-            )
-            agent_loop.set_approval_callback(self._approval_callback)
-            agent_loop.set_user_input_callback(self._user_input_callback)
-
-        def add_raw_event_listener(self, _listener) -> None:
-            return None
-
-        def remove_raw_event_listener(self, _listener) -> None:
-            return None
 
+class MountedBridge:
+    def __init__(self) -> None:
+        self.attach_calls: list[dict] = []
+        self.raw_listeners: list[tuple[object, str | None]] = []
+        self._local_approval_callback = None
+        self._local_input_callback = None
+
+    @property
+    def local_approval_callback(self):
+        return self._local_approval_callback
+
+    @property
+    def local_input_callback(self):
+        return self._local_input_callback
+
+    async def _approval_callback(self, *_args):
+        return ("yes", None)
+
+    async def _user_input_callback(self, *_args):
+        return {"response": "ok"}
+
+    def configure_local_callbacks(self, *, approval_callback, input_callback) -> None:
+        self._local_approval_callback = approval_callback
+        self._local_input_callback = input_callback
+
+    def attach_to_loop(self, agent_loop, *_args, approval_callback=None, input_callback=None, **_kwargs) -> None:
+        self.attach_calls.append(
+            {
+                "approval_callback": approval_callback,
+                "input_callback": input_callback,
+            }
+        )
+        self.configure_local_callbacks(
+            approval_callback=approval_callback,
+            input_callback=input_callback,
+        )
+        agent_loop.set_approval_callback(self._approval_callback)
+        agent_loop.set_user_input_callback(self._user_input_callback)
+
+    def add_raw_event_listener(self, listener, *, mode=None, timeout=None) -> None:
+        self.raw_listeners.append((listener, mode))
+
+    def remove_raw_event_listener(self, listener) -> None:
+        self.raw_listeners = [(known, mode) for known, mode in self.raw_listeners if known != listener]
+
+
+def _patch_base_app(monkeypatch: pytest.MonkeyPatch, *, event_handler=None) -> None:
     async def fake_super_on_mount(self) -> None:
         self.agent_loop.set_approval_callback(lambda *_args: ("yes", None))
         self.agent_loop.set_user_input_callback(lambda *_args: {"response": "ok"})
 
+    async def fake_super_on_unmount(self) -> None:
+        return None
+
     def fake_super_init(self, *_args, **kwargs) -> None:
         self.agent_loop = kwargs.get("agent_loop")
-        self.event_handler = None
+        self.event_handler = event_handler
         self._loading_widget = None
 
     def fake_run_worker(self, worker, *, exclusive: bool = False) -> None:
@@ -185,10 +188,18 @@ async def test_on_mount_rebinds_callbacks_and_intercepts_future_rebinds(
 
     monkeypatch.setattr(launcher._BaseVibeApp, "__init__", fake_super_init, raising=False)
     monkeypatch.setattr(launcher._BaseVibeApp, "on_mount", fake_super_on_mount, raising=False)
+    monkeypatch.setattr(launcher._BaseVibeApp, "on_unmount", fake_super_on_unmount, raising=False)
     monkeypatch.setattr(launcher.VibeCheckApp, "run_worker", fake_run_worker, raising=False)
 
-    loop = Loop()
-    bridge = Bridge()
+
+@pytest.mark.asyncio
+async def test_on_mount_rebinds_callbacks_and_intercepts_future_rebinds(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _patch_base_app(monkeypatch)
+
+    loop = MountedAgentLoop()
+    bridge = MountedBridge()
     app = launcher.VibeCheckApp(
         agent_loop=loop,
         bridge=bridge,
@@ -198,6 +209,7 @@ async def test_on_mount_rebinds_callbacks_and_intercepts_future_rebinds(
     await app.on_mount()
 
     assert bridge.attach_calls
+    assert bridge.raw_listeners == []
     assert loop.approval_callback.__func__ is bridge._approval_callback.__func__
     assert loop.user_input_callback.__func__ is bridge._user_input_callback.__func__
 
@@ -214,6 +226,44 @@ async def test_on_mount_rebinds_callbacks_and_intercepts_future_rebinds(
     assert loop.user_input_callback.__func__ is bridge._user_input_callback.__func__
 
 
+@pytest.mark.asyncio
+async def test_on_mount_renders_raw_events_through_a_fast_tui_bridge_listener(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class EventHandler:
+        def __init__(self) -> None:
+            self.events: list[object] = []
+
+        async def handle_event(self, event, **_kwargs) -> None:
+            self.events.append(event)
+
+    class AssistantEvent:
+        def __init__(self, content: str) -> None:
+            self.content = content
+            self.message_id = "m-1"
+
+    handler = EventHandler()
+    _patch_base_app(monkeypatch, event_handler=handler)
+    bridge = MountedBridge()
+    app = launcher.VibeCheckApp(
+        agent_loop=MountedAgentLoop(),
+        bridge=bridge,
+        ws_port=9001,
+        api_app=object(),
+    )
+    await app.on_mount()
+
+    [(listener, mode)] = bridge.raw_listeners
+    assert mode == "fast"
+    await listener(AssistantEvent("Hel"))
+    await listener(AssistantEvent("lo"))
+    await app.on_unmount()
+
+    assert bridge.raw_listeners == []
+    # Vibe's handler appends deltas, so queued chunks of one message render once, merged.
+    assert [event.content for event in handler.events] == ["Hello"]
+
+
 @pytest.mark.asyncio
 async def test_handle_agent_loop_turn_renders_prompt_before_bridge_injection(
     monkeypatch: pytest.MonkeyPatch,
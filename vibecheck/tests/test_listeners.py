@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from vibecheck.bridge import SessionBridge
+from vibecheck.events import ApprovalRequestEvent, AssistantEvent
+from vibecheck.listeners import ListenerRegistry
+
+
+async def _wait_until(predicate, *, attempts: int = 200) -> None:
+    for _ in range(attempts):
+        if predicate():
+            return
+        await asyncio.sleep(0.001)
+    raise AssertionError("condition was not met in time")
+
+
+@pytest.mark.asyncio
+async def test_slow_listener_does_not_delay_fast_listeners_or_the_producer() -> None:
+    registry = ListenerRegistry("test")
+    release = asyncio.Event()
+    slow_seen: list[int] = []
+    fast_seen: list[int] = []
+
+    async def slow(event: int) -> None:
+        await release.wait()
+        slow_seen.append(event)
+
+    registry.add(slow)
+    registry.add(fast_seen.append)
+
+    for index in range(3):
+        await asyncio.wait_for(registry.dispatch(index), 0.1)
+
+    assert fast_seen == [0, 1, 2]
+    assert slow_seen == []
+    release.set()
+    await _wait_until(lambda: len(slow_seen) == 3)
+    assert slow_seen == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_listener_timeouts_and_failures_are_counted() -> None:
+    registry = ListenerRegistry("test")
+
+    async def hangs(_event: object) -> None:
+        await asyncio.sleep(10)
+
+    def explodes(_event: object) -> None:
+        raise RuntimeError("boom")
+
+    registry.add(hangs, mode="fast", timeout=0.01)
+    registry.add(explodes)
+
+    await registry.dispatch("event")
+
+    stats = {item["listener"].rsplit(".", 1)[-1]: item for item in registry.stats()}
+    assert stats["hangs"]["timeouts"] == 1
+    assert stats["hangs"]["mode"] == "fast"
+    assert stats["explodes"]["failures"] == 1
+    assert stats["explodes"]["calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_listener_backlog_drops_oldest_when_full() -> None:
+    registry = ListenerRegistry("test", max_pending=2)
+    seen: list[int] = []
+
+    async def record(event: int) -> None:
+        seen.append(event)
+
+    registry.add(record)
+    for index in range(5):
+        await registry.dispatch(index)
+    await _wait_until(lambda: len(seen) == 2)
+
+    assert seen == [3, 4]
+    assert registry.stats()[0]["dropped"] == 3
+
+
+@pytest.mark.asyncio
+async def test_slow_listener_sees_approval_requests_before_queued_bulk_events() -> None:
+    registry = ListenerRegistry("test")
+    seen: list[str] = []
+
+    async def record(event) -> None:
+        seen.append(event.type)
+
+    registry.add(record)
+    await registry.dispatch(AssistantEvent(content="one"))
+    await registry.dispatch(AssistantEvent(content="two"))
+    await registry.dispatch(ApprovalRequestEvent(call_id="tc-1", tool_name="bash", args={}))
+    await _wait_until(lambda: len(seen) == 3)
+
+    assert seen == ["approval_request", "assistant", "assistant"]
+
+
+@pytest.mark.asyncio
+async def test_bridge_exposes_listener_stats_and_cancels_on_release() -> None:
+    bridge = SessionBridge("listeners")
+    release = asyncio.Event()
+
+    async def blocked(_event: object) -> None:
+        await release.wait()
+
+    bridge.add_event_listener(blocked)
+    await bridge._broadcast(AssistantEvent(content="hello"))
+
+    stats = bridge.listener_stats()
+    assert stats["raw_event"] == []
+    assert stats["event"][0]["mode"] == "slow"
+
+    bridge.release()
+    await asyncio.sleep(0)
+    assert bridge.listener_stats()["event"][0]["pending"] == 0
@@ -125,16 +125,6 @@ def live_client(
         manager.sessions.clear()
 
 
-def _read_until(websocket, predicate, *, max_messages: int = 20) -> list[dict]:
-    seen: list[dict] = []
-    for _ in range(max_messages):
-        payload = websocket.receive_json()
-        seen.append(payload)
-        if predicate(seen):
-            return seen
-    raise AssertionError("expected websocket messages were not observed")
-
-
 def _wait_until(predicate, *, timeout_seconds: float = 2.0) -> None:
     deadline = time.time() + timeout_seconds
     while time.time() < deadline:
@@ -162,17 +152,13 @@ def test_live_attach_flow_with_rest_and_websocket(live_client) -> None:
 
     with client.websocket_connect("/ws/events/live-session?psk=dev-psk") as websocket:
         connected = websocket.receive_json()
-        state = websocket.receive_json()
-        backlog = _read_until(
-            websocket,
-            lambda msgs: any(msg.get("type") == "approval_request" for msg in msgs),
-        )
+        snapshot = websocket.receive_json()
 
     assert connected["type"] == "connected"
-    assert state["type"] == "state"
-    assert state["state"] in {"idle", "waiting_approval"}
-    assert any(msg.get("type") == "tool_call" for msg in backlog)
-    assert any(msg.get("type") == "approval_request" for msg in backlog)
+    assert snapshot["type"] == "snapshot"
+    assert snapshot["state"] in {"idle", "waiting_approval"}
+    assert any(pair["call"] is not None for pair in snapshot["tool_calls"])
+    assert [item["call_id"] for item in snapshot["pending_approvals"]] == ["tc-live"]
 
     detail = client.get("/api/sessions/live-session", headers=headers)
     assert detail.status_code == 200
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from vibecheck.loop_monitor import (
+    LOOP_LAG_SECONDS,
+    LoopAttributionMiddleware,
+    LoopMonitor,
+    attributed,
+    resolve_slow_callback_threshold,
+)
+
+
+def _block_the_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_is_recorded_with_stack_and_session() -> None:
+    monitor = LoopMonitor(interval=0.01, slow_threshold=0.05)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+
+        async def turn() -> None:
+            with attributed(session_id="sess-1"):
+                _block_the_loop(0.3)
+
+        await asyncio.create_task(turn(), name="agent-turn")
+        for _ in range(100):
+            if monitor.stalls:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await monitor.stop()
+
+    [stall] = monitor.stalls
+    assert stall["session_id"] == "sess-1"
+    assert stall["task"] == "agent-turn"
+    assert stall["duration_ms"] >= 200
+    assert any("_block_the_loop" in frame for frame in stall["stack"])
+    assert monitor.slow_callbacks == 1
+    assert monitor.max_lag_seconds >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_middleware_attributes_stalls_to_the_request_route() -> None:
+    async def slow_app(scope, receive, send) -> None:
+        _block_the_loop(0.2)
+
+    monitor = LoopMonitor(interval=0.01, slow_threshold=0.05)
+    monitor.start()
+    try:
+        await LoopAttributionMiddleware(slow_app)(
+            {"type": "http", "method": "GET", "path": "/api/sessions/abc/history"}, None, None
+        )
+        for _ in range(100):
+            if monitor.stalls:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await monitor.stop()
+
+    [stall] = monitor.stalls
+    assert stall["route"] == "GET /api/sessions/abc/history"
+    assert stall["session_id"] == "abc"
+
+
+@pytest.mark.asyncio
+async def test_lag_samples_feed_the_histogram_without_stalls() -> None:
+    before = LOOP_LAG_SECONDS._default.count
+    monitor = LoopMonitor(interval=0.005, slow_threshold=0.5)
+    monitor.start()
+    await asyncio.sleep(0.06)
+    await monitor.stop()
+
+    assert LOOP_LAG_SECONDS._default.count - before >= 5
+    assert not monitor.stalls
+    assert monitor.stats()["slow_callbacks"] == 0
+
+
+def test_slow_callback_threshold_comes_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("VIBECHECK_SLOW_CALLBACK_MS", "250")
+    assert resolve_slow_callback_threshold() == 0.25
+    monkeypatch.setenv("VIBECHECK_SLOW_CALLBACK_MS", "0")
+    assert resolve_slow_callback_threshold() == 0.0
+    monkeypatch.delenv("VIBECHECK_SLOW_CALLBACK_MS")
+    assert resolve_slow_callback_threshold() == 0.1
+
+
+@pytest.mark.asyncio
+async def test_loop_debug_endpoint_and_metrics(monkeypatch: pytest.MonkeyPatch) -> None:
+    import vibecheck.routes.api as api_module
+    from vibecheck.app import create_app
+
+    monkeypatch.setenv("VIBECHECK_PSK", "dev-psk")
+    monitor = LoopMonitor()
+    monitor.observe(0.02)
+    monkeypatch.setattr(api_module, "loop_monitor", monitor)
+
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        debug = await client.get("/api/debug/loop", headers={"X-PSK": "dev-psk"})
+        scrape = await client.get("/metrics", headers={"X-PSK": "dev-psk"})
+
+    assert debug.status_code == 200
+    assert debug.json()["max_lag_ms"] == 20.0
+    assert "vibecheck_event_loop_lag_seconds_bucket" in scrape.text
+    assert "vibecheck_event_loop_slow_callbacks_total" in scrape.text
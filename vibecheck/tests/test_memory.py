@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from vibecheck.bridge import SessionBridge, SessionManager
+from vibecheck.events import AssistantEvent
+from vibecheck.memory import HeapDiffer, SizeWalker
+from vibecheck.message_queue import QueuedMessage
+from vibecheck.tracing import Tracer
+
+
+def test_size_walker_counts_shared_objects_once() -> None:
+    shared = "x" * 10_000
+    walker = SizeWalker()
+
+    first = walker.sizeof({"a": [shared]})
+    second = walker.sizeof([shared, shared])
+
+    assert first > sys.getsizeof(shared)
+    assert second == sys.getsizeof([shared, shared], 0)
+
+
+def test_size_walker_stops_at_object_budget() -> None:
+    walker = SizeWalker(max_objects=10)
+    walker.sizeof([str(index) * 3 for index in range(100)])
+    assert walker.truncated
+
+
+def test_size_walker_skips_shared_types() -> None:
+    class Shared:
+        def __init__(self) -> None:
+            self.buffer = "s" * 10_000
+
+    root = {"owned": "o" * 1_000, "shared": Shared()}
+
+    assert SizeWalker(skip_types=(Shared,)).sizeof(root) < 10_000 <= SizeWalker().sizeof(root)
+
+
+def test_bridge_memory_usage_leaves_out_the_shared_tracer() -> None:
+    shared_tracer = Tracer(1.0)
+    shared_tracer.traces.extend({"pad": str(index) * 1_000} for index in range(50))
+    trace = shared_tracer.start("message", "memory")
+    bridge = SessionBridge("memory")
+    before = bridge.memory_usage()["structures"]["message_queue"]
+
+    bridge._message_queue.put(QueuedMessage("q" * 2_000, trace=trace))
+    growth = bridge.memory_usage()["structures"]["message_queue"] - before
+
+    assert 2_000 <= growth < 10_000
+
+
+def test_bridge_memory_usage_tracks_each_structure() -> None:
+    bridge = SessionBridge("memory")
+    before = bridge.memory_usage()
+
+    bridge.add_event(AssistantEvent(content="y" * 50_000))
+    bridge.injections.record("z" * 3_000)
+    bridge.pending_approval_context["tc-1"] = {"tool_name": "bash", "args": {"command": "w" * 30_000}}
+    after = bridge.memory_usage()
+
+    growth = {
+        name: after["structures"][name] - before["structures"][name] for name in after["structures"]
+    }
+    assert growth["backlog"] >= 50_000
+    assert growth["injections"] >= 3_000
+    assert growth["pending_approval_context"] >= 30_000
+    assert after["total_bytes"] == sum(after["structures"].values())
+    assert after["truncated"] is False
+
+
+@pytest.mark.asyncio
+async def test_session_detail_reports_memory_only_on_request(tmp_path: Path) -> None:
+    manager = SessionManager(logs_root=tmp_path)
+    manager.attach("live")
+
+    assert "memory" not in await manager.session_detail("live")
+    detail = await manager.session_detail("live", include_memory=True)
+
+    assert detail["memory"]["total_bytes"] > 0
+    assert "observed_message_ids" in detail["memory"]["structures"]
+
+
+def test_heap_differ_reports_growth_between_calls() -> None:
+    differ = HeapDiffer()
+    was_tracing = tracemalloc.is_tracing()
+    try:
+        assert differ.diff()["baseline"] is True
+        retained = [bytearray(1024) for _ in range(2000)]
+        result = differ.diff(top=5)
+    finally:
+        differ.stop()
+
+    assert result["baseline"] is False
+    assert any(
+        "test_memory.py" in entry["location"][0] and entry["size_diff"] >= 2_000_000 for entry in result["growth"]
+    )
+    assert len(retained) == 2000
+    assert tracemalloc.is_tracing() is was_tracing
+
+
+@pytest.mark.asyncio
+async def test_heap_endpoint_diffs_and_stops(monkeypatch: pytest.MonkeyPatch) -> None:
+    import vibecheck.routes.api as api_module
+    from vibecheck.app import create_app
+
+    monkeypatch.setenv("VIBECHECK_PSK", "dev-psk")
+    differ = HeapDiffer()
+    monkeypatch.setattr(api_module, "heap_differ", differ)
+    headers = {"X-PSK": "dev-psk"}
+
+    transport = ASGITransport(app=create_app())
+    try:
+        async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+            baseline = await client.get("/api/debug/heap", headers=headers)
+            diff = await client.get("/api/debug/heap", params={"top": 3}, headers=headers)
+            invalid = await client.get("/api/debug/heap", params={"group_by": "module"}, headers=headers)
+            stopped = await client.delete("/api/debug/heap", headers=headers)
+    finally:
+        differ.stop()
+
+    assert baseline.json()["baseline"] is True
+    assert diff.json()["baseline"] is False
+    assert len(diff.json()["growth"]) <= 3
+    assert invalid.status_code == 400
+    assert stopped.json() == {"tracing": False}
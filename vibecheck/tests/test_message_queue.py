@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from fakes import RecordingConnectionManager, wait_for
+from vibecheck.bridge import SessionBridge
+from vibecheck.commands import InterruptCommand, execute_command, parse_command
+from vibecheck.message_queue import MessageQueue, QueuedMessage
+
+
+@pytest.mark.asyncio
+async def test_urgent_messages_jump_ahead_in_arrival_order() -> None:
+    queue = MessageQueue()
+    for content, urgent in (("a", False), ("b", False), ("u1", True), ("u2", True)):
+        queue.put(QueuedMessage(content), urgent=urgent)
+
+    received = [(await queue.get()).content for _ in range(4)]
+
+    assert received == ["u1", "u2", "a", "b"]
+    assert queue.last_wait_seconds is not None
+
+
+@pytest.mark.asyncio
+async def test_coalescing_merges_waiting_messages_and_keeps_join_balanced() -> None:
+    queue = MessageQueue(coalesce=True)
+    queue.put(QueuedMessage("one", injection_ids=("i1",)))
+    queue.put(QueuedMessage("two", injection_ids=("i2",)))
+    queue.put(QueuedMessage("now", injection_ids=("i3",)), urgent=True)
+
+    merged = await queue.get()
+    queue.task_done()
+    await asyncio.wait_for(queue.join(), 1)
+
+    assert merged.content == "now\n\none\n\ntwo"
+    assert merged.injection_ids == ("i3", "i1", "i2")
+    assert queue.coalesced == 2
+    assert queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_burst_of_messages_costs_one_extra_turn_when_coalescing(gated_agent_loop) -> None:
+    bridge = SessionBridge("burst", coalesce_messages=True)
+    try:
+        bridge.inject_message("first")
+        await wait_for(lambda: gated_agent_loop.prompts == ["first"])
+        bridge.inject_message("second")
+        bridge.inject_message("third")
+
+        queue = bridge.state_payload()["queue"]
+        assert queue["depth"] == 2
+        assert queue["oldest_wait_ms"] >= 0
+
+        gated_agent_loop.gate.set()
+        await wait_for(lambda: bridge.state == "idle")
+    finally:
+        bridge.stop()
+
+    assert gated_agent_loop.prompts == ["first", "second\n\nthird"]
+    assert [entry["status"] for entry in bridge.injections.recent()] == ["finished"] * 3
+    assert bridge.state_payload()["queue"]["coalesced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_interrupting_message_cancels_the_running_turn(
+    gated_agent_loop, recording_manager: RecordingConnectionManager
+) -> None:
+    bridge = SessionBridge("interrupted", connection_manager=recording_manager)
+    try:
+        bridge.inject_message("approve")
+        await wait_for(lambda: "tc-1" in bridge.pending_approval)
+        bridge.inject_message("later")
+
+        assert bridge.inject_message("stop that", interrupt=True)
+        await wait_for(lambda: gated_agent_loop.prompts[-1:] == ["stop that"])
+        gated_agent_loop.gate.set()
+        await wait_for(lambda: bridge.state == "idle")
+    finally:
+        bridge.stop()
+
+    assert gated_agent_loop.prompts == ["approve", "stop that", "later"]
+    assert not bridge.pending_approval
+    resolutions = [event for event in recording_manager.events if event["type"] == "approval_resolution"]
+    assert [resolution["approved"] for resolution in resolutions] == [False]
+    statuses = {entry["content"]: (entry["status"], entry["error"]) for entry in bridge.injections.recent()}
+    assert statuses["approve"] == ("failed", "interrupted")
+    assert statuses["stop that"] == ("finished", None)
+    assert bridge.interrupts == 1
+
+
+@pytest.mark.asyncio
+async def test_interrupt_command_reports_when_nothing_is_running(gated_agent_loop) -> None:
+    bridge = SessionBridge("idle-interrupt")
+    command = parse_command('{"type": "interrupt", "correlation_id": "c1"}')
+    assert isinstance(command, InterruptCommand)
+
+    ack = execute_command(bridge, command)
+    assert ack.ok is False
+
+    bridge.inject_message("work")
+    await wait_for(lambda: gated_agent_loop.prompts == ["work"])
+    ack = execute_command(bridge, command)
+    await wait_for(lambda: bridge.state == "idle")
+    bridge.stop()
+
+    assert ack.ok is True
+    assert ack.status == "interrupted"
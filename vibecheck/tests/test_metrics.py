@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+import pytest
+
+from vibecheck.app import create_app
+from vibecheck.bridge import SessionBridge, session_manager
+from vibecheck.events import AssistantEvent
+from vibecheck.metrics import MetricsRegistry
+
+
+def test_registry_renders_text_exposition_format() -> None:
+    registry = MetricsRegistry()
+    requests = registry.counter("demo_requests", "Requests served.", ("route",))
+    depth = registry.gauge("demo_depth", "Queue depth.")
+    latency = registry.histogram("demo_latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    registry.collector("demo_sessions", "Sessions.", lambda: [("demo_sessions", {"id": 'a"b'}, 2)])
+
+    requests.labels("/x").inc()
+    requests.labels("/x").inc(2)
+    depth.set(4.5)
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5)
+
+    text = registry.render()
+    assert "# TYPE demo_requests_total counter" in text
+    assert 'demo_requests_total{route="/x"} 3' in text
+    assert "demo_depth 4.5" in text
+    assert 'demo_latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'demo_latency_seconds_bucket{le="1"} 2' in text
+    assert 'demo_latency_seconds_bucket{le="+Inf"} 3' in text
+    assert "demo_latency_seconds_count 3" in text
+    assert 'demo_sessions{id="a\\"b"} 2' in text
+    assert text.endswith("\n")
+
+
+def test_counter_type_lines_name_the_emitted_samples() -> None:
+    registry = MetricsRegistry()
+    registry.counter("demo_frames", "Frames.").inc()
+    registry.counter("demo_sent_total", "Sent.").inc(2)
+    registry.collector("demo_shed_total", "Shed.", lambda: [("demo_shed_total", {}, 1)], kind="counter")
+
+    text = registry.render()
+
+    assert "# TYPE demo_frames_total counter\ndemo_frames_total 1" in text
+    assert "# TYPE demo_sent_total counter\ndemo_sent_total 2" in text
+    assert "# TYPE demo_shed_total counter\ndemo_shed_total 1" in text
+    assert "demo_sent_total_total" not in text
+
+
+def test_registry_rejects_wrong_label_arity_and_reuses_families() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("demo", "Demo.", ("a", "b"))
+
+    with pytest.raises(ValueError):
+        counter.labels("only-one")
+    assert registry.counter("demo", "Demo.", ("a", "b")) is counter
+
+
+def test_failing_collector_does_not_break_the_scrape() -> None:
+    registry = MetricsRegistry()
+    registry.gauge("healthy", "Fine.").set(1)
+
+    def broken():
+        raise RuntimeError("boom")
+
+    registry.collector("broken", "Raises.", broken)
+
+    text = registry.render()
+    assert "healthy 1" in text
+    assert "broken" not in text
+
+
+def test_metrics_endpoint_reports_bridge_activity(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("VIBECHECK_PSK", "dev-psk")
+    bridge = SessionBridge("metrics-session")
+    session_manager.sessions["metrics-session"] = bridge
+    try:
+        bridge.add_event(AssistantEvent(content="hello"))
+        client = TestClient(create_app())
+
+        assert client.get("/metrics").status_code == 401
+        assert client.get("/metrics", headers={"authorization": "Bearer wrong"}).status_code == 401
+        assert client.get("/metrics", headers={"authorization": "Bearer dev-psk"}).status_code == 200
+        response = client.get("/metrics", headers={"x-psk": "dev-psk"})
+    finally:
+        session_manager.sessions.pop("metrics-session", None)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'vibecheck_events_total{type="assistant"}' in body
+    assert 'vibecheck_backlog_events{session="metrics-session"} 1' in body
+    assert 'vibecheck_event_encode_seconds_count{stage="backlog"}' in body
+    assert "vibecheck_overload_level 0" in body
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+
+from vibecheck import ws as ws_module
+from vibecheck.events import ApprovalRequestEvent, AssistantEvent, StateChangeEvent, ToolResultEvent
+from vibecheck.loop_monitor import LoopMonitor
+from vibecheck.overload import DegradationLevel, OverloadController
+from vibecheck.priority import Priority
+
+
+def test_controller_escalates_one_level_per_sample_and_records_transitions() -> None:
+    controller = OverloadController()
+
+    assert controller.observe(0.6, 0, now=0.0) is DegradationLevel.COALESCE
+    assert controller.observe(0.6, 0, now=0.25) is DegradationLevel.TRUNCATE
+    assert controller.observe(0.0, 2000, now=0.5) is DegradationLevel.SHED
+    assert controller.observe(0.0, 2000, now=0.75) is DegradationLevel.SHED
+
+    assert controller.transitions == {
+        ("normal", "coalesce"): 1,
+        ("coalesce", "truncate"): 1,
+        ("truncate", "shed"): 1,
+    }
+    assert controller.coalesce_factor == 8
+
+
+def test_controller_steps_down_only_after_cooldown() -> None:
+    controller = OverloadController(cooldown_seconds=2.0)
+    controller.observe(0.1, 0, now=0.0)
+    assert controller.level is DegradationLevel.COALESCE
+
+    assert controller.observe(0.0, 0, now=1.0) is DegradationLevel.COALESCE
+    assert controller.observe(0.0, 0, now=2.5) is DegradationLevel.COALESCE
+    assert controller.observe(0.0, 0, now=3.0) is DegradationLevel.NORMAL
+    assert {"from": "coalesce", "to": "normal", "count": 1} in controller.stats()["transitions"]
+
+
+def test_controller_reads_peak_lag_from_the_loop_monitor() -> None:
+    async def scenario() -> tuple[DegradationLevel, float]:
+        monitor = LoopMonitor(slow_threshold=0)
+        controller = OverloadController(interval=0.01)
+        monitor.observe(0.2)
+        monitor.observe(0.01)
+        controller.start(lambda: 0, monitor.take_peak_lag)
+        await asyncio.sleep(0.03)
+        await controller.stop()
+        return controller.level, controller.lag_seconds
+
+    level, lag_seconds = asyncio.run(scenario())
+
+    # Only the first evaluation saw the spike; later ones read an empty window.
+    assert level is DegradationLevel.COALESCE
+    assert lag_seconds == 0.0
+
+
+def test_truncation_applies_only_to_bulk_frames_under_pressure() -> None:
+    controller = OverloadController(truncate_limit=4)
+    output = ToolResultEvent(call_id="tc-1", output="0123456789").model_dump(mode="json")
+
+    assert controller.degrade(output, Priority.BULK, session_id="s") is output
+    controller.level = DegradationLevel.TRUNCATE
+    degraded = controller.degrade(output, Priority.BULK, session_id="s")
+    approval = ApprovalRequestEvent(call_id="tc-2", tool_name="bash", args={"command": "x" * 50})
+    approval_payload = approval.model_dump(mode="json")
+
+    assert degraded["output"] == "0123…"
+    assert degraded["full_ref"].startswith("/api/sessions/s/events/")
+    assert controller.degrade(approval_payload, Priority.BLOCKING) is approval_payload
+    assert controller.truncated == 1
+
+
+def test_coalesce_level_leaves_websocket_frames_alone() -> None:
+    controller = OverloadController(lagging_client_depth=1)
+    controller.level = DegradationLevel.COALESCE
+
+    assert controller.should_shed({"type": "heartbeat"}, client_depth=5) is False
+    assert controller.should_shed({"type": "tool_result"}, client_depth=5) is False
+    controller.level = DegradationLevel.TRUNCATE
+    assert controller.should_shed({"type": "heartbeat"}, client_depth=5) is True
+    assert controller.should_shed({"type": "tool_result"}, client_depth=5) is False
+    assert controller.shed == {"heartbeat": 1}
+
+
+def test_critical_frames_are_never_shed() -> None:
+    controller = OverloadController(lagging_client_depth=1)
+    controller.level = DegradationLevel.SHED
+
+    for kind in ("approval_request", "input_request", "state", "approval_resolution", "input_resolution"):
+        assert controller.should_shed({"type": kind}, client_depth=10_000) is False
+    assert controller.should_shed({"type": "tool_result"}, client_depth=0) is False
+    assert controller.should_shed({"type": "tool_result"}, client_depth=1) is True
+    assert controller.should_shed({"type": "heartbeat"}, client_depth=1) is True
+    assert controller.shed == {"tool_result": 1, "heartbeat": 1}
+
+
+def test_lagging_client_keeps_approvals_and_state_while_bulk_is_shed() -> None:
+    class StalledWebSocket:
+        def __init__(self) -> None:
+            self.gate = asyncio.Event()
+            self.messages: list[dict] = []
+
+        async def accept(self) -> None:
+            return None
+
+        async def send_json(self, payload: dict) -> None:
+            await self.gate.wait()
+            self.messages.append(payload)
+
+    async def scenario() -> list[str]:
+        controller = OverloadController(lagging_client_depth=2)
+        controller.level = DegradationLevel.SHED
+        manager = ws_module.ConnectionManager(overload=controller)
+        manager._expected_psk = "dev-psk"
+        socket = StalledWebSocket()
+        await manager.connect(socket, "alpha", "dev-psk")
+
+        for index in range(4):
+            await manager.broadcast("alpha", AssistantEvent(content=f"chunk-{index}"))
+        await manager.broadcast("alpha", StateChangeEvent(state="waiting_approval"))
+        await manager.broadcast("alpha", ApprovalRequestEvent(call_id="tc-1", tool_name="bash", args={}))
+        socket.gate.set()
+        for _ in range(20):
+            await asyncio.sleep(0)
+        await manager.disconnect(socket)
+        return [message.get("content") or message["type"] for message in socket.messages]
+
+    assert asyncio.run(scenario()) == ["approval_request", "state", "chunk-0", "chunk-1"]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+
+from vibecheck.events import ApprovalRequestEvent, AssistantEvent, StateChangeEvent
+from vibecheck.priority import Priority, PriorityLanes, event_priority
+
+
+def test_event_priority_classifies_models_and_payloads() -> None:
+    approval = ApprovalRequestEvent(call_id="tc-1", tool_name="bash", args={})
+
+    assert event_priority(approval) is Priority.BLOCKING
+    assert event_priority({"type": "input_request"}) is Priority.BLOCKING
+    assert event_priority(StateChangeEvent(state="running")) is Priority.CONTROL
+    assert event_priority(AssistantEvent(content="hi")) is Priority.BULK
+    assert event_priority(object()) is Priority.BULK
+
+
+def test_priority_lanes_serve_urgent_first_and_keep_order_within_a_class() -> None:
+    lanes: PriorityLanes[str] = PriorityLanes()
+    lanes.append("bulk-1")
+    lanes.append("state-1", Priority.CONTROL)
+    lanes.append("bulk-2")
+    lanes.append("approval-1", Priority.BLOCKING)
+    lanes.append("state-2", Priority.CONTROL)
+
+    assert len(lanes) == 5
+    assert [lanes.popleft() for _ in range(5)] == ["approval-1", "state-1", "state-2", "bulk-1", "bulk-2"]
+    with pytest.raises(IndexError):
+        lanes.popleft()
+
+
+def test_priority_lanes_drop_oldest_from_least_urgent_lane() -> None:
+    lanes: PriorityLanes[str] = PriorityLanes()
+    lanes.append("approval", Priority.BLOCKING)
+    lanes.append("bulk-1")
+    lanes.append("bulk-2")
+
+    assert lanes.drop_oldest() == "bulk-1"
+    assert list(lanes) == ["approval", "bulk-2"]
+    assert lanes.lane_size(Priority.BULK) == 1
+
+
+def test_priority_lanes_never_drop_blocking_items() -> None:
+    lanes: PriorityLanes[str] = PriorityLanes()
+    lanes.append("approval", Priority.BLOCKING)
+    lanes.append("state", Priority.CONTROL)
+
+    assert lanes.drop_oldest() == "state"
+    assert lanes.drop_oldest() is None
+    assert list(lanes) == ["approval"]
+    assert len(lanes) == 1
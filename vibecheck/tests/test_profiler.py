@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from vibecheck.loop_monitor import attributed
+from vibecheck.profiler import SamplingProfiler, loop_thread
+
+
+def _spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def _as_coroutine(callback):
+    return callback()
+
+
+async def _busy_session(session_id: str, stop: asyncio.Event) -> None:
+    with attributed(session_id=session_id):
+        while not stop.is_set():
+            _spin(0.02)
+            await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_profile_collapses_stacks_from_all_threads() -> None:
+    stop = threading.Event()
+    worker = threading.Thread(target=lambda: stop.wait(5), name="idle-worker")
+    worker.start()
+    try:
+        profile = await SamplingProfiler(interval=0.005).profile(0.1)
+    finally:
+        stop.set()
+        worker.join()
+
+    assert profile is not None
+    assert profile.samples >= 5
+    roots = {stack.split(";", 1)[0] for stack in profile.stacks}
+    assert {"event-loop", "idle-worker"} <= roots
+    line = profile.collapsed().splitlines()[0]
+    stack, count = line.rsplit(" ", 1)
+    assert int(count) >= 1 and ";" in stack
+
+
+@pytest.mark.asyncio
+async def test_profile_scoped_to_a_session_keeps_only_its_tasks() -> None:
+    stop = asyncio.Event()
+    tasks = [
+        asyncio.create_task(_busy_session("wanted", stop)),
+        asyncio.create_task(_busy_session("other", stop)),
+    ]
+    profiler = SamplingProfiler(interval=0.002)
+    try:
+        profile = await profiler.profile(0.2, session_id="wanted")
+    finally:
+        stop.set()
+        await asyncio.gather(*tasks)
+
+    assert profile is not None
+    assert profile.stacks
+    assert all(stack.startswith("event-loop;") for stack in profile.stacks)
+    assert all("_busy_session" in stack for stack in profile.stacks)
+    assert sum(profile.stacks.values()) < profile.samples
+
+
+@pytest.mark.asyncio
+async def test_session_profile_samples_the_loop_the_session_runs_on() -> None:
+    session_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=session_loop.run_forever, daemon=True)
+    thread.start()
+    stop = asyncio.Event()
+    try:
+        home = await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(_as_coroutine(loop_thread), session_loop))
+        busy = asyncio.run_coroutine_threadsafe(_busy_session("elsewhere", stop), session_loop)
+        profiler = SamplingProfiler(interval=0.002)
+
+        caller_loop_only = await profiler.profile(0.1, session_id="elsewhere")
+        scoped = await profiler.profile(0.1, session_id="elsewhere", session_loop=home)
+        session_loop.call_soon_threadsafe(stop.set)
+        await asyncio.wrap_future(busy)
+    finally:
+        session_loop.call_soon_threadsafe(session_loop.stop)
+        thread.join(2)
+        session_loop.close()
+
+    assert home == (session_loop, thread.ident)
+    assert caller_loop_only is not None and not caller_loop_only.stacks
+    assert scoped is not None and scoped.stacks
+    assert all("_busy_session" in stack for stack in scoped.stacks)
+
+
+@pytest.mark.asyncio
+async def test_only_one_profile_runs_at_a_time() -> None:
+    profiler = SamplingProfiler(interval=0.01)
+    first = asyncio.create_task(profiler.profile(0.1))
+    await asyncio.sleep(0.02)
+
+    assert profiler.busy
+    assert await profiler.profile(0.1) is None
+    assert await first is not None
+    assert not profiler.busy
+
+
+@pytest.mark.asyncio
+async def test_cancelled_profile_holds_the_lock_until_sampling_ends() -> None:
+    profiler = SamplingProfiler(interval=0.01)
+    first = asyncio.create_task(profiler.profile(0.15))
+    await asyncio.sleep(0.02)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    assert profiler.busy
+    assert await profiler.profile(0.05) is None
+    for _ in range(100):
+        if not profiler.busy:
+            break
+        await asyncio.sleep(0.01)
+    assert await profiler.profile(0.02) is not None
+
+
+@pytest.mark.asyncio
+async def test_profile_endpoint_returns_collapsed_stacks(monkeypatch: pytest.MonkeyPatch) -> None:
+    from vibecheck.app import create_app
+
+    monkeypatch.setenv("VIBECHECK_PSK", "dev-psk")
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        unauthorized = await client.get("/api/debug/profile", params={"seconds": 0.05})
+        collapsed = await client.get("/api/debug/profile", params={"seconds": 0.05}, headers={"X-PSK": "dev-psk"})
+        as_json = await client.get(
+            "/api/debug/profile", params={"seconds": 0.05, "format": "json"}, headers={"X-PSK": "dev-psk"}
+        )
+        too_long = await client.get("/api/debug/profile", params={"seconds": 600}, headers={"X-PSK": "dev-psk"})
+
+    assert unauthorized.status_code == 401
+    assert collapsed.status_code == 200
+    assert collapsed.headers["content-type"].startswith("text/plain")
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed.text.splitlines())
+    assert any(line.startswith("event-loop;") for line in collapsed.text.splitlines())
+    assert as_json.json()["samples"] >= 1
+    assert too_long.status_code == 400
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from vibecheck.events import AssistantEvent, HeartbeatEvent, ToolCallEvent, ToolResultEvent
+from vibecheck.projection import PASSTHROUGH, SubscriptionFilter, project_payload
+
+
+def test_filter_from_query_parses_profile() -> None:
+    subscription = SubscriptionFilter.from_query(
+        {"types": "assistant, tool_result", "max_field": "16", "headers_only": "1"}
+    )
+
+    assert subscription.event_types == frozenset({"assistant", "tool_result"})
+    assert subscription.max_field_length == 16
+    assert subscription.headers_only is True
+    assert SubscriptionFilter.from_query({}) == PASSTHROUGH
+    assert SubscriptionFilter.from_query({"max_field": "lots"}).max_field_length is None
+
+
+def test_type_allowlist_skips_events_but_keeps_control_frames() -> None:
+    subscription = SubscriptionFilter(event_types=frozenset({"assistant"}))
+
+    tool_result = ToolResultEvent(call_id="tc-1", output="ok").model_dump(mode="json")
+    heartbeat = HeartbeatEvent().model_dump(mode="json")
+    assistant = AssistantEvent(content="hi").model_dump(mode="json")
+
+    assert project_payload(tool_result, subscription) is None
+    assert project_payload(heartbeat, subscription) == heartbeat
+    assert project_payload(assistant, subscription) == assistant
+
+
+def test_max_field_length_truncates_nested_args_and_adds_full_ref() -> None:
+    event = ToolCallEvent(
+        tool_name="write_file",
+        args={"path": "a.txt", "content": "x" * 100},
+        call_id="tc-1",
+    )
+    payload = event.model_dump(mode="json")
+
+    projected = project_payload(payload, SubscriptionFilter(max_field_length=10), session_id="s1")
+
+    assert projected is not None
+    assert projected["args"]["path"] == "a.txt"
+    assert projected["args"]["content"] == "x" * 10 + "…"
+    assert projected["truncated"] == ["args"]
+    assert projected["full_ref"] == f"/api/sessions/s1/events/{event.id}"
+    assert payload["args"]["content"] == "x" * 100
+
+
+def test_headers_only_drops_bulk_fields() -> None:
+    payload = ToolResultEvent(call_id="tc-1", output="y" * 50).model_dump(mode="json")
+
+    projected = project_payload(payload, SubscriptionFilter(headers_only=True), session_id="s1")
+
+    assert projected is not None
+    assert "output" not in projected
+    assert projected["call_id"] == "tc-1"
+    assert projected["omitted"] == ["output"]
+    assert projected["full_ref"].startswith("/api/sessions/s1/events/")
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+from pathlib import Path
+import threading
+import time
+
+import httpx
+from httpx import ASGITransport, AsyncClient
+import pytest
+import uvicorn
+
+from vibecheck.app import create_app
+from vibecheck.bridge import SessionBridge, SessionManager
+import vibecheck.routes.api as api_module
+from vibecheck.events import AssistantEvent
+from vibecheck.server_thread import CrossLoopConnectionManager, ServerThread, resolve_server_thread
+
+
+class LoopRecordingManager:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str, int]] = []
+        self.received = threading.Event()
+
+    async def broadcast(self, session_id: str, event) -> None:
+        self.calls.append((session_id, event.content, threading.get_ident()))
+        self.received.set()
+
+
+@pytest.fixture
+def other_loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        yield loop, thread
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(2)
+        loop.close()
+
+
+@pytest.mark.asyncio
+async def test_cross_loop_manager_broadcasts_on_the_server_loop(other_loop) -> None:
+    loop, thread = other_loop
+    target = LoopRecordingManager()
+    manager = CrossLoopConnectionManager(target, loop)
+
+    await manager.broadcast("s1", AssistantEvent(content="hi"))
+
+    assert target.received.wait(2)
+    assert target.calls == [("s1", "hi", thread.ident)]
+
+
+@pytest.mark.asyncio
+async def test_resolutions_from_another_thread_hop_to_the_bridge_loop(other_loop) -> None:
+    server_loop, _thread = other_loop
+    bridge = SessionBridge("threaded")
+    bridge.bind_home_loop(asyncio.get_running_loop())
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    bridge.pending_approval["tc-1"] = future
+
+    async def resolve_from_server(call_id: str) -> bool:
+        return await bridge.on_home_loop(functools.partial(bridge.resolve_approval, call_id, approved=True))
+
+    def run_on_server(call_id: str) -> asyncio.Future[bool]:
+        return asyncio.wrap_future(asyncio.run_coroutine_threadsafe(resolve_from_server(call_id), server_loop))
+
+    assert await run_on_server("tc-1") is True
+    # The answer comes from the bridge's loop, so a call that is already resolved reports failure.
+    assert await run_on_server("tc-1") is False
+    assert await asyncio.wait_for(future, 2) == {"approved": True, "edited_args": None}
+    assert "tc-1" not in bridge.pending_approval
+
+
+def test_server_thread_serves_requests_off_the_calling_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("VIBECHECK_PSK", "dev-psk")
+    server_thread = ServerThread(uvicorn.Config(create_app(), host="127.0.0.1", port=0, log_level="warning"))
+    server_thread.start()
+    try:
+        deadline = time.monotonic() + 5
+        while not server_thread.server.started and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert server_thread.server.started
+        port = server_thread.server.servers[0].sockets[0].getsockname()[1]
+
+        response = httpx.get(f"http://127.0.0.1:{port}/api/health")
+        assert response.status_code == 200
+    finally:
+        server_thread.stop()
+    assert not server_thread.is_alive
+
+
+def test_server_thread_flag_comes_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("VIBECHECK_SERVER_THREAD", "1")
+    assert resolve_server_thread() is True
+    monkeypatch.setenv("VIBECHECK_SERVER_THREAD", "0")
+    assert resolve_server_thread() is False
+
+
+@pytest.mark.asyncio
+async def test_api_reads_run_on_the_bridge_loop(
+    other_loop, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    tui_loop, tui_thread = other_loop
+    monkeypatch.setenv("VIBECHECK_PSK", "dev-psk")
+    manager = SessionManager(logs_root=tmp_path)
+    monkeypatch.setattr(api_module, "session_manager", manager)
+    bridge = manager.attach("threaded")
+    bridge.add_event(AssistantEvent(content="hello"))
+    bridge.bind_home_loop(tui_loop)
+
+    reader_threads: list[int] = []
+    real_history = bridge.ahistory
+
+    async def recording_history(*args, **kwargs):
+        reader_threads.append(threading.get_ident())
+        return await real_history(*args, **kwargs)
+
+    monkeypatch.setattr(bridge, "ahistory", recording_history)
+
+    async with AsyncClient(transport=ASGITransport(app=create_app()), base_url="http://testserver") as client:
+        history = await client.get("/api/sessions/threaded/history", headers={"X-PSK": "dev-psk"})
+        event_id = history.json()["events"][0]["event"]["id"]
+        found = await client.get(f"/api/sessions/threaded/events/{event_id}", headers={"X-PSK": "dev-psk"})
+
+    assert history.json()["last_seq"] == 1
+    assert found.json()["content"] == "hello"
+    assert reader_threads == [tui_thread.ident]
+    assert await bridge.on_home_loop(threading.get_ident) == tui_thread.ident
+    with pytest.raises(KeyError):
+        await bridge.on_home_loop({}.__getitem__, "missing")
+
+
+@pytest.mark.asyncio
+async def test_api_lookups_and_attaches_run_on_the_manager_loop(
+    other_loop, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    tui_loop, tui_thread = other_loop
+    monkeypatch.setenv("VIBECHECK_PSK", "dev-psk")
+    session_dir = tmp_path / "threaded"
+    session_dir.mkdir()
+    (session_dir / "meta.json").write_text(json.dumps({"session_id": "threaded"}), encoding="utf-8")
+    manager = SessionManager(logs_root=tmp_path)
+    monkeypatch.setattr(api_module, "session_manager", manager)
+    manager.bind_home_loop(tui_loop)
+
+    lookup_threads: list[int] = []
+    real_has_known_session = manager.has_known_session
+
+    def recording_has_known_session(session_id: str) -> bool:
+        lookup_threads.append(threading.get_ident())
+        return real_has_known_session(session_id)
+
+    monkeypatch.setattr(manager, "has_known_session", recording_has_known_session)
+
+    async with AsyncClient(transport=ASGITransport(app=create_app()), base_url="http://testserver") as client:
+        missing = await client.get("/api/sessions/ghost/state", headers={"X-PSK": "dev-psk"})
+        found = await client.get("/api/sessions/threaded/state", headers={"X-PSK": "dev-psk"})
+
+    assert missing.status_code == 404
+    assert found.status_code == 200
+    assert lookup_threads == [tui_thread.ident, tui_thread.ident]
+    # Bridges the manager attaches inherit its loop, so their reads hop there as well.
+    assert await manager.sessions["threaded"].on_home_loop(threading.get_ident) == tui_thread.ident
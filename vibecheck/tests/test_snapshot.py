@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from vibecheck.events import (
+    ApprovalRequestEvent,
+    ApprovalResolutionEvent,
+    AssistantEvent,
+    InputRequestEvent,
+    ToolCallEvent,
+    ToolResultEvent,
+    UserMessageEvent,
+)
+from vibecheck.projection import SubscriptionFilter, project_payload
+from vibecheck.snapshot import SessionSnapshot
+
+
+def _snapshot_payload(snapshot: SessionSnapshot, **kwargs) -> dict:
+    return snapshot.to_event(
+        session_id="s1",
+        state="waiting_input",
+        attach_mode="managed",
+        controllable=True,
+        **kwargs,
+    ).model_dump(mode="json")
+
+
+def test_snapshot_collapses_tool_pairs_and_drops_resolved_requests() -> None:
+    snapshot = SessionSnapshot(max_messages=2)
+    events = [
+        UserMessageEvent(content="run it"),
+        ToolCallEvent(tool_name="bash", args={"command": "ls"}, call_id="tc-1"),
+        ApprovalRequestEvent(call_id="tc-1", tool_name="bash", args={"command": "ls"}),
+        ApprovalResolutionEvent(call_id="tc-1", approved=True),
+        ToolResultEvent(call_id="tc-1", output="a.txt"),
+        AssistantEvent(content="first"),
+        AssistantEvent(content="second"),
+        InputRequestEvent(request_id="req-1", question="Continue?"),
+    ]
+    for seq, event in enumerate(events, start=1):
+        snapshot.apply(event, seq)
+
+    payload = _snapshot_payload(snapshot)
+
+    assert payload["last_seq"] == 8
+    assert [message["content"] for message in payload["messages"]] == ["first", "second"]
+    assert payload["pending_approvals"] == []
+    assert [item["request_id"] for item in payload["pending_inputs"]] == ["req-1"]
+    assert len(payload["tool_calls"]) == 1
+    assert payload["tool_calls"][0]["call"]["tool_name"] == "bash"
+    assert payload["tool_calls"][0]["result"]["output"] == "a.txt"
+
+
+def test_snapshot_limits_tool_pairs_and_respects_open_request_filter() -> None:
+    snapshot = SessionSnapshot(max_tool_calls=2)
+    for index in range(3):
+        snapshot.apply(ToolCallEvent(tool_name="bash", args={}, call_id=f"tc-{index}"), index + 1)
+    snapshot.apply(ApprovalRequestEvent(call_id="stale", tool_name="bash", args={}), 4)
+
+    payload = _snapshot_payload(snapshot, open_approvals=set())
+
+    assert [item["call_id"] for item in payload["tool_calls"]] == ["tc-1", "tc-2"]
+    assert payload["pending_approvals"] == []
+
+
+def test_snapshot_frames_are_projected_per_embedded_event() -> None:
+    snapshot = SessionSnapshot()
+    snapshot.apply(AssistantEvent(content="x" * 50), 1)
+    snapshot.apply(ToolResultEvent(call_id="tc-1", output="y" * 50), 2)
+
+    projected = project_payload(
+        _snapshot_payload(snapshot),
+        SubscriptionFilter(max_field_length=5),
+        session_id="s1",
+    )
+
+    assert projected["messages"][0]["content"] == "xxxxx…"
+    assert projected["tool_calls"][0]["result"]["output"] == "yyyyy…"
+    assert projected["tool_calls"][0]["result"]["full_ref"].startswith("/api/sessions/s1/events/")
+
+
+def test_snapshot_frame_reaches_type_allowlisted_subscribers() -> None:
+    snapshot = SessionSnapshot()
+    snapshot.apply(AssistantEvent(content="hello"), 1)
+    snapshot.apply(ApprovalRequestEvent(call_id="tc-1", tool_name="bash", args={}), 2)
+
+    projected = project_payload(
+        _snapshot_payload(snapshot),
+        SubscriptionFilter(event_types=frozenset({"approval_request"})),
+        session_id="s1",
+    )
+
+    assert projected is not None
+    assert projected["type"] == "snapshot"
+    assert projected["messages"] == []
+    assert [item["call_id"] for item in projected["pending_approvals"]] == ["tc-1"]
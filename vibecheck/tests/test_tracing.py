@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+import threading
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from fakes import wait_for
+from vibecheck import bridge as bridge_module
+from vibecheck import tracing as tracing_module
+from vibecheck import ws as ws_module
+from vibecheck.bridge import SessionBridge
+from vibecheck.tracing import Tracer, resolve_trace_sample_rate
+
+
+class _RecordingWebSocket:
+    def __init__(self) -> None:
+        self.messages: list[dict] = []
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_json(self, payload: dict) -> None:
+        self.messages.append(payload)
+
+    async def close(self, code: int = 1000) -> None:
+        return None
+
+
+def test_trace_is_exported_once_every_holder_releases_it(tmp_path: Path) -> None:
+    export_path = tmp_path / "traces.jsonl"
+    tracer = Tracer(1.0, export_path=export_path)
+    trace = tracer.start("inject_message", "s-1", chars=5)
+    assert trace is not None
+
+    trace.record("queue_wait", trace.origin)
+    with trace.span("ws_send"):
+        pass
+    with trace.span("ws_send"):
+        pass
+    assert trace.hold()
+    trace.release()
+    assert not tracer.traces
+
+    trace.delivered()
+    trace.release()
+    assert not trace.hold()
+
+    [record] = tracer.traces
+    assert record["attrs"] == {"chars": 5}
+    assert record["stages"]["ws_send"]["count"] == 2
+    assert record["first_delivery_ms"] is not None
+    assert [json.loads(line)["trace_id"] for line in export_path.read_text().splitlines()] == [record["trace_id"]]
+
+
+@pytest.mark.asyncio
+async def test_exports_inside_a_loop_are_written_off_the_loop(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    export_path = tmp_path / "traces.jsonl"
+    tracer = Tracer(1.0, export_path=export_path)
+    writer_threads: list[int] = []
+    real_append_lines = tracing_module._append_lines
+
+    def recording_append_lines(path: Path, lines: list[str]) -> None:
+        writer_threads.append(threading.get_ident())
+        real_append_lines(path, lines)
+
+    monkeypatch.setattr(tracing_module, "_append_lines", recording_append_lines)
+    traces = [tracer.start("inject_message", "s-1") for _ in range(3)]
+    for trace in traces:
+        trace.release()
+
+    await wait_for(lambda: export_path.exists() and len(export_path.read_text().splitlines()) == 3)
+    assert [json.loads(line)["trace_id"] for line in export_path.read_text().splitlines()] == [
+        trace.trace_id for trace in traces
+    ]
+    assert writer_threads and threading.get_ident() not in writer_threads
+
+
+def test_unsampled_messages_start_no_trace() -> None:
+    assert Tracer(0.0).start("inject_message", "s-1") is None
+
+
+def test_sample_rate_is_read_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("VIBECHECK_TRACE_SAMPLE_RATE", "0.25")
+    assert resolve_trace_sample_rate() == 0.25
+    monkeypatch.setenv("VIBECHECK_TRACE_SAMPLE_RATE", "7")
+    assert resolve_trace_sample_rate() == 1.0
+    monkeypatch.setenv("VIBECHECK_TRACE_SAMPLE_RATE", "often")
+    assert resolve_trace_sample_rate() == 0.01
+
+
+@pytest.mark.asyncio
+async def test_sampled_turn_is_traced_through_to_websocket_delivery(
+    monkeypatch: pytest.MonkeyPatch, gated_agent_loop
+) -> None:
+    tracer = Tracer(1.0)
+    monkeypatch.setattr(bridge_module, "tracer", tracer)
+    manager = ws_module.ConnectionManager()
+    manager._expected_psk = "dev-psk"
+    socket = _RecordingWebSocket()
+    assert await manager.connect(socket, "traced", "dev-psk")
+    bridge = SessionBridge("traced", connection_manager=manager)
+
+    try:
+        assert bridge.inject_message("hi")
+        await wait_for(lambda: gated_agent_loop.prompts == ["hi"])
+        await asyncio.sleep(0.01)
+        gated_agent_loop.gate.set()
+        await wait_for(lambda: bool(tracer.traces))
+    finally:
+        bridge.stop()
+        await manager.disconnect(socket)
+
+    [record] = tracer.traces
+    assert record["session_id"] == "traced"
+    for stage in ("queue_wait", "run_lock_wait", "agent_act", "convert", "record", "fanout", "ws_queue_wait", "ws_send"):
+        assert stage in record["stages"], stage
+    assert record["stages"]["agent_act"]["total_ms"] >= 10
+    assert record["first_delivery_ms"] <= record["last_delivery_ms"]
+    assert any(message.get("content") == "echo hi" for message in socket.messages)
+
+
+@pytest.mark.asyncio
+async def test_traces_endpoint_reports_stage_breakdown(monkeypatch: pytest.MonkeyPatch) -> None:
+    import vibecheck.routes.api as api_module
+    from vibecheck.app import create_app
+
+    monkeypatch.setenv("VIBECHECK_PSK", "dev-psk")
+    tracer = Tracer(1.0)
+    for session_id in ("a", "b", "a"):
+        trace = tracer.start("inject_message", session_id)
+        trace.record("agent_act", trace.origin - 0.002)
+        trace.delivered()
+        trace.release()
+    monkeypatch.setattr(api_module, "tracer", tracer)
+
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        response = await client.get("/api/debug/traces", params={"session_id": "a"}, headers={"X-PSK": "dev-psk"})
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["started"] == 3
+    assert [trace["session_id"] for trace in payload["traces"]] == ["a", "a"]
+    assert payload["stages"]["agent_act"]["traces"] == 2
+    assert payload["stages"]["agent_act"]["p50_ms"] >= 2
+    assert "first_delivery" in payload["stages"]
@@ -6,7 +6,7 @@ import pytest
 
 from vibecheck.bridge import SessionBridge
 from vibecheck.events import AssistantEvent
-from vibecheck.tui_bridge import TuiBridge
+from vibecheck.tui_bridge import TUI_DROPPED_TOTAL, TuiBridge
 
 
 class RecordingConnectionManager:
@@ -106,3 +106,99 @@ async def test_tui_bridge_receives_waiting_approval_state_change() -> None:
 
     assert session_bridge.resolve_approval("tc-2", approved=False)
     await task
+
+
+class StreamingAssistantEvent:
+    def __init__(self, content: str, message_id: str | None = "m-1") -> None:
+        self.content = content
+        self.message_id = message_id
+
+
+class ToolCallEvent:
+    def __init__(self, call_id: str) -> None:
+        self.call_id = call_id
+
+
+@pytest.mark.asyncio
+async def test_queued_tui_bridge_does_not_block_the_producer() -> None:
+    class BlockingHandler:
+        def __init__(self) -> None:
+            self.release = asyncio.Event()
+            self.events: list[object] = []
+
+        async def handle_event(self, event, **_kwargs) -> None:
+            await self.release.wait()
+            self.events.append(event)
+
+    handler = BlockingHandler()
+    bridge = TuiBridge(handler, max_redraws_per_second=1000)
+
+    for index in range(5):
+        await asyncio.wait_for(bridge.on_bridge_raw_event(ToolCallEvent(f"tc-{index}")), 0.1)
+
+    handler.release.set()
+    await bridge.aclose()
+    assert [event.call_id for event in handler.events] == [f"tc-{index}" for index in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_queued_tui_bridge_coalesces_streaming_deltas() -> None:
+    handler = RecordingEventHandler()
+    bridge = TuiBridge(handler, max_redraws_per_second=1000, merge_deltas=True)
+
+    bridge.enqueue(StreamingAssistantEvent("Hel"))
+    bridge.enqueue(StreamingAssistantEvent("lo"))
+    bridge.enqueue(ToolCallEvent("tc-1"))
+    bridge.enqueue(StreamingAssistantEvent(" again"))
+    bridge.enqueue(StreamingAssistantEvent(" there", message_id="m-2"))
+    await bridge.aclose()
+
+    rendered = [getattr(event, "content", getattr(event, "call_id", None)) for event, _ in handler.events]
+    assert rendered == ["Hello", "tc-1", " again", " there"]
+    assert bridge.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_queued_tui_bridge_caps_render_rate() -> None:
+    handler = RecordingEventHandler()
+    bridge = TuiBridge(handler, max_redraws_per_second=20, merge_deltas=True)
+
+    for index in range(50):
+        bridge.enqueue(StreamingAssistantEvent(str(index % 10)))
+        await asyncio.sleep(0.002)
+    await bridge.aclose()
+
+    assert bridge.renders <= 4
+    assert "".join(event.content for event, _ in handler.events) == "0123456789" * 5
+
+
+@pytest.mark.asyncio
+async def test_queued_tui_bridge_keeps_chunks_apart_unless_they_are_known_deltas() -> None:
+    handler = RecordingEventHandler()
+    bridge = TuiBridge(handler, max_redraws_per_second=1000)
+
+    # Cumulative content: concatenating would repeat "Hel".
+    bridge.enqueue(StreamingAssistantEvent("Hel"))
+    bridge.enqueue(StreamingAssistantEvent("Hello"))
+    await bridge.aclose()
+
+    assert [event.content for event, _ in handler.events] == ["Hel", "Hello"]
+    assert bridge.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_queued_tui_bridge_drops_only_streaming_chunks_when_full() -> None:
+    handler = RecordingEventHandler()
+    bridge = TuiBridge(handler, max_redraws_per_second=1, max_queue=2)
+    dropped_before = TUI_DROPPED_TOTAL.labels().value
+
+    bridge.enqueue(ToolCallEvent("tc-0"))
+    bridge.enqueue(StreamingAssistantEvent("a"))
+    bridge.enqueue(StreamingAssistantEvent("b"))
+    bridge.enqueue(ToolCallEvent("tc-1"))
+    bridge.enqueue(ToolCallEvent("tc-2"))
+    await bridge.aclose()
+
+    assert bridge.dropped == 2
+    assert TUI_DROPPED_TOTAL.labels().value - dropped_before == 2
+    assert [event.call_id for event, _ in handler.events] == ["tc-0", "tc-1", "tc-2"]
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+
+import pytest
+
+from fakes import RecordingConnectionManager, wait_for
+from vibecheck.bridge import SessionBridge, SessionManager
+from vibecheck.worker import SessionWorker
+
+# Worker children start a fresh interpreter, so allow for import time.
+WORKER_TIMEOUT = 10.0
+
+# The child runs in its own interpreter and cannot import the shared test fakes.
+WORKER_SCRIPT = """
+import asyncio
+import os
+import sys
+import time
+
+from vibecheck.bridge import VibeRuntime
+from vibecheck.worker import run_worker
+
+
+class Config:
+    @classmethod
+    def load(cls):
+        return cls()
+
+
+class UserMessageEvent:
+    def __init__(self, content):
+        self.content = content
+        self.message_id = None
+
+
+class AssistantEvent:
+    def __init__(self, content):
+        self.content = content
+        self.message_id = None
+
+
+class AgentLoop:
+    def __init__(self, config, message_observer=None, enable_streaming=False):
+        self.message_observer = message_observer
+
+    def set_approval_callback(self, callback):
+        self.approval_callback = callback
+
+    def set_user_input_callback(self, callback):
+        self.user_input_callback = callback
+
+    async def act(self, message):
+        yield UserMessageEvent(message)
+        if message == "crash":
+            os._exit(3)
+        if message == "busy":
+            time.sleep(0.5)
+            yield AssistantEvent("done busy")
+            return
+        approval, _feedback = await self.approval_callback("bash", {"command": "ls"}, "tc-1")
+        yield AssistantEvent(f"approval={approval}")
+
+
+def load():
+    return VibeRuntime(
+        agent_loop_cls=AgentLoop,
+        vibe_config_cls=Config,
+        approval_yes="y",
+        approval_no="n",
+        ask_result_cls=None,
+        answer_cls=None,
+    )
+
+
+asyncio.run(run_worker(sys.argv[1], runtime_loader=load))
+"""
+
+
+def _process_bridge(session_id: str, manager: RecordingConnectionManager) -> SessionBridge:
+    bridge = SessionBridge(session_id, connection_manager=manager, execution_mode="process")
+    bridge.worker = SessionWorker(
+        session_id,
+        on_frame=bridge._on_worker_frame,
+        on_exit=bridge._on_worker_exit,
+        command=[sys.executable, "-c", WORKER_SCRIPT, session_id],
+        restart_backoff_seconds=0.05,
+    )
+    return bridge
+
+
+async def _stop(bridge: SessionBridge) -> None:
+    worker = bridge.worker
+    bridge.stop()
+    if worker is not None:
+        # Let the supervisor reap the killed child before the test loop closes.
+        await worker.close()
+
+
+def _assistant_texts(manager: RecordingConnectionManager) -> list[str]:
+    return [event["content"] for event in manager.events if event["type"] == "assistant"]
+
+
+@pytest.mark.asyncio
+async def test_worker_streams_events_and_round_trips_approvals(recording_manager: RecordingConnectionManager) -> None:
+    manager = recording_manager
+    bridge = _process_bridge("worker-approval", manager)
+    try:
+        assert bridge.inject_message("hello") is True
+        await wait_for(lambda: "tc-1" in bridge.pending_approval, timeout=WORKER_TIMEOUT)
+        assert bridge.state == "waiting_approval"
+        assert bridge.state_payload()["pending_approval"]["args"] == {"command": "ls"}
+
+        assert bridge.resolve_approval("tc-1", approved=True)
+        await wait_for(lambda: "approval=y" in _assistant_texts(manager), timeout=WORKER_TIMEOUT)
+        await wait_for(lambda: bridge.state == "idle", timeout=WORKER_TIMEOUT)
+
+        user_messages = [event["content"] for event in manager.events if event["type"] == "user_message"]
+        assert user_messages == ["hello"]
+        resolutions = [event for event in manager.events if event["type"] == "approval_resolution"]
+        assert len(resolutions) == 1
+        assert [entry["status"] for entry in bridge.injections.recent()] == ["finished"]
+    finally:
+        await _stop(bridge)
+
+
+@pytest.mark.asyncio
+async def test_worker_is_restarted_after_a_crash(recording_manager: RecordingConnectionManager) -> None:
+    manager = recording_manager
+    bridge = _process_bridge("worker-crash", manager)
+    try:
+        bridge.inject_message("crash")
+        await wait_for(lambda: any("restarting" in text for text in _assistant_texts(manager)), timeout=WORKER_TIMEOUT)
+        assert bridge.worker is not None
+        await wait_for(lambda: bridge.worker.restarts == 1, timeout=WORKER_TIMEOUT)
+
+        bridge.inject_message("again")
+        await wait_for(lambda: "tc-1" in bridge.pending_approval, timeout=WORKER_TIMEOUT)
+        assert bridge.resolve_approval("tc-1", approved=False)
+        await wait_for(lambda: "approval=n" in _assistant_texts(manager), timeout=WORKER_TIMEOUT)
+    finally:
+        await _stop(bridge)
+
+
+@pytest.mark.asyncio
+async def test_blocking_agent_work_does_not_stall_the_server_loop(recording_manager: RecordingConnectionManager) -> None:
+    manager = recording_manager
+    bridge = _process_bridge("worker-busy", manager)
+    try:
+        bridge.inject_message("busy")
+        await wait_for(lambda: any(event["type"] == "user_message" for event in manager.events), timeout=WORKER_TIMEOUT)
+
+        started = time.monotonic()
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+        assert time.monotonic() - started < 0.4
+
+        await wait_for(lambda: "done busy" in _assistant_texts(manager), timeout=WORKER_TIMEOUT)
+    finally:
+        await _stop(bridge)
+
+
+def test_execution_mode_comes_from_environment(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setenv("VIBECHECK_EXECUTION_MODE", "process")
+    monkeypatch.setenv("VIBECHECK_AGENT_POOL_SIZE", "2")
+    manager = SessionManager(logs_root=tmp_path)
+
+    assert manager.execution_mode == "process"
+    assert manager.agent_pool is None
+    assert manager.attach("new-session").execution_mode == "process"
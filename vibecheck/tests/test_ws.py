@@ -2,13 +2,21 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Generator
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 from starlette.websockets import WebSocketDisconnect
 
 from vibecheck.app import create_app
-from vibecheck.events import AssistantEvent
+from vibecheck.bridge import SessionBridge
+from vibecheck.events import (
+    ApprovalRequestEvent,
+    ApprovalResolutionEvent,
+    AssistantEvent,
+    ToolCallEvent,
+    ToolResultEvent,
+)
 from vibecheck import ws as ws_module
 
 
@@ -52,14 +60,14 @@ def test_ws_connects_with_valid_psk_and_sends_connected_event(ws_client: TestCli
 
     with ws_client.websocket_connect("/ws/events/session-2?psk=dev-psk") as websocket:
         connected = websocket.receive_json()
-        state = websocket.receive_json()
+        snapshot = websocket.receive_json()
 
     assert connected["type"] == "connected"
     assert connected["session_id"] == "session-2"
     assert isinstance(connected["id"], str) and len(connected["id"]) == 8
     assert isinstance(connected["timestamp"], float)
-    assert state["type"] == "state"
-    assert state["state"] == "idle"
+    assert snapshot["type"] == "snapshot"
+    assert snapshot["state"] == "idle"
 
 
 def test_broadcast_targets_only_subscribers_in_session(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -98,11 +106,29 @@ def test_disconnect_removes_client_from_room(monkeypatch: pytest.MonkeyPatch) ->
     assert manager.socket_to_session == {}
 
 
+def test_snapshot_is_delivered_on_connect_as_single_frame(ws_client: TestClient) -> None:
+    bridge = ws_module.session_manager.attach("session-snapshot")
+    bridge.add_event(AssistantEvent(content="from backlog"))
+    bridge.add_event(ApprovalRequestEvent(call_id="old", tool_name="bash", args={}))
+    bridge.add_event(ApprovalResolutionEvent(call_id="old", approved=True))
+
+    with ws_client.websocket_connect("/ws/events/session-snapshot?psk=dev-psk") as websocket:
+        connected = websocket.receive_json()
+        snapshot = websocket.receive_json()
+
+    assert connected["type"] == "connected"
+    assert snapshot["type"] == "snapshot"
+    assert snapshot["session_id"] == "session-snapshot"
+    assert snapshot["last_seq"] == 3
+    assert [message["content"] for message in snapshot["messages"]] == ["from backlog"]
+    assert snapshot["pending_approvals"] == []
+
+
 def test_backlog_is_delivered_on_connect(ws_client: TestClient) -> None:
     bridge = ws_module.session_manager.attach("session-backlog")
     bridge.add_event(AssistantEvent(content="from backlog"))
 
-    with ws_client.websocket_connect("/ws/events/session-backlog?psk=dev-psk") as websocket:
+    with ws_client.websocket_connect("/ws/events/session-backlog?psk=dev-psk&replay=backlog") as websocket:
         connected = websocket.receive_json()
         state = websocket.receive_json()
         backlog_event = websocket.receive_json()
@@ -129,15 +155,186 @@ def test_two_sessions_get_independent_backlogs(ws_client: TestClient) -> None:
     session_a.add_event(AssistantEvent(content="only-a"))
     session_b.add_event(AssistantEvent(content="only-b"))
 
-    with ws_client.websocket_connect("/ws/events/session-a?psk=dev-psk") as websocket_a:
+    with ws_client.websocket_connect("/ws/events/session-a?psk=dev-psk&replay=backlog") as websocket_a:
         websocket_a.receive_json()  # connected
         websocket_a.receive_json()  # state
         backlog_a = websocket_a.receive_json()
 
-    with ws_client.websocket_connect("/ws/events/session-b?psk=dev-psk") as websocket_b:
+    with ws_client.websocket_connect("/ws/events/session-b?psk=dev-psk&replay=backlog") as websocket_b:
         websocket_b.receive_json()  # connected
         websocket_b.receive_json()  # state
         backlog_b = websocket_b.receive_json()
 
     assert backlog_a["content"] == "only-a"
     assert backlog_b["content"] == "only-b"
+
+
+def test_projection_is_computed_once_per_filter_profile(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("VIBECHECK_PSK", "dev-psk")
+    manager = ws_module.ConnectionManager()
+    full = DummyWebSocket()
+    phone_one = DummyWebSocket()
+    phone_two = DummyWebSocket()
+    manager.rooms["alpha"] = {full, phone_one, phone_two}
+    manager.socket_to_session = {full: "alpha", phone_one: "alpha", phone_two: "alpha"}
+    manager.socket_filters = {
+        phone_one: ws_module.SubscriptionFilter(max_field_length=4),
+        phone_two: ws_module.SubscriptionFilter(max_field_length=4),
+    }
+
+    calls: list[object] = []
+    real_project = ws_module.project_payload
+
+    def counting_project(payload, subscription, **kwargs):
+        calls.append(subscription)
+        return real_project(payload, subscription, **kwargs)
+
+    monkeypatch.setattr(ws_module, "project_payload", counting_project)
+    asyncio.run(manager.broadcast("alpha", AssistantEvent(content="a long message")))
+
+    assert len(calls) == 1
+    assert full.messages[0]["content"] == "a long message"
+    assert phone_one.messages[0]["content"] == "a lo…"
+    assert phone_one.messages[0] is phone_two.messages[0]
+
+
+def test_ws_query_filter_applies_to_backlog(ws_client: TestClient) -> None:
+    bridge = ws_module.session_manager.attach("session-filtered")
+    bridge.add_event(AssistantEvent(content="hello there"))
+
+    with ws_client.websocket_connect(
+        "/ws/events/session-filtered?psk=dev-psk&headers_only=1&replay=backlog"
+    ) as websocket:
+        websocket.receive_json()  # connected
+        websocket.receive_json()  # state
+        backlog_event = websocket.receive_json()
+
+    assert backlog_event["type"] == "assistant"
+    assert "content" not in backlog_event
+    assert backlog_event["full_ref"].startswith("/api/sessions/session-filtered/events/")
+
+
+def test_ws_resumes_from_after_seq(ws_client: TestClient) -> None:
+    bridge = ws_module.session_manager.attach("session-resume")
+    for i in range(3):
+        bridge.add_event(AssistantEvent(content=f"m{i}"))
+
+    with ws_client.websocket_connect("/ws/events/session-resume?psk=dev-psk&after_seq=2") as websocket:
+        websocket.receive_json()  # connected
+        resumed = websocket.receive_json()
+
+    assert resumed["content"] == "m2"
+
+
+def _receive_until(websocket, event_type: str) -> dict:
+    while True:
+        payload = websocket.receive_json()
+        if payload["type"] == event_type:
+            return payload
+
+
+def test_ws_commands_are_acknowledged_by_correlation_id(ws_client: TestClient) -> None:
+    bridge = ws_module.session_manager.attach("session-commands")
+    loop = asyncio.new_event_loop()
+    future = loop.create_future()
+    bridge.pending_approval["tc-1"] = future
+    bridge.pending_approval_context["tc-1"] = {"tool_name": "bash", "args": {}}
+
+    try:
+        with ws_client.websocket_connect("/ws/events/session-commands?psk=dev-psk") as websocket:
+            websocket.send_json({"type": "approve", "correlation_id": "c-1", "call_id": "tc-1", "approved": True})
+            ack = _receive_until(websocket, "ack")
+            websocket.send_text("{broken")
+            invalid = _receive_until(websocket, "ack")
+            websocket.send_json({"type": "ping", "correlation_id": "c-2"})
+            pong = _receive_until(websocket, "ack")
+    finally:
+        loop.close()
+
+    assert ack["correlation_id"] == "c-1"
+    assert ack["ok"] is True
+    assert future.result() == {"approved": True, "edited_args": None}
+    assert invalid["ok"] is False
+    assert pong["correlation_id"] == "c-2"
+    assert pong["status"] == "pong"
+
+
+class GatedWebSocket(DummyWebSocket):
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = asyncio.Event()
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_json(self, payload: dict) -> None:
+        await self.gate.wait()
+        self.messages.append(payload)
+
+
+def test_approval_request_overtakes_queued_bulk_output() -> None:
+    async def scenario() -> list[str]:
+        manager = ws_module.ConnectionManager()
+        manager._expected_psk = "dev-psk"
+        socket = GatedWebSocket()
+        assert await manager.connect(socket, "alpha", "dev-psk")
+
+        for index in range(3):
+            await manager.broadcast("alpha", AssistantEvent(content=f"chunk-{index}"))
+        await manager.broadcast("alpha", ApprovalRequestEvent(call_id="tc-1", tool_name="bash", args={}))
+        await asyncio.sleep(0)
+        socket.gate.set()
+        for _ in range(20):
+            if len(socket.messages) == 4:
+                break
+            await asyncio.sleep(0)
+        await manager.disconnect(socket)
+        return [message.get("content") or message["type"] for message in socket.messages]
+
+    assert asyncio.run(scenario()) == ["approval_request", "chunk-0", "chunk-1", "chunk-2"]
+
+
+def test_ws_commands_are_acknowledged_on_type_filtered_sockets(ws_client: TestClient) -> None:
+    ws_module.session_manager.attach("session-filtered-commands")
+
+    with ws_client.websocket_connect(
+        "/ws/events/session-filtered-commands?psk=dev-psk&types=approval_request"
+    ) as websocket:
+        assert websocket.receive_json()["type"] == "connected"
+        assert websocket.receive_json()["type"] == "snapshot"
+        websocket.send_json({"type": "ping", "correlation_id": "c-filtered"})
+        ack = websocket.receive_json()
+
+    assert ack["type"] == "ack"
+    assert ack["correlation_id"] == "c-filtered"
+
+
+def test_snapshot_is_rebuilt_from_journal_after_restart_and_reattach(
+    ws_client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setattr(ws_module.session_manager, "journal_root", tmp_path)
+    previous_run = SessionBridge("session-journaled", journal=ws_module.session_manager.open_journal("session-journaled"))
+    previous_run.add_event(AssistantEvent(content="before restart"))
+    previous_run.add_event(ToolCallEvent(tool_name="bash", args={"command": "ls"}, call_id="tc-1"))
+    previous_run.add_event(ToolResultEvent(call_id="tc-1", output="a.txt"))
+    previous_run.stop()
+
+    ws_module.session_manager.attach("session-journaled")
+    with ws_client.websocket_connect("/ws/events/session-journaled?psk=dev-psk") as websocket:
+        websocket.receive_json()  # connected
+        restarted = websocket.receive_json()
+
+    assert ws_module.session_manager.evict("session-journaled")
+    with ws_client.websocket_connect("/ws/events/session-journaled?psk=dev-psk") as websocket:
+        websocket.receive_json()  # connected
+        reattached = websocket.receive_json()
+
+    for snapshot in (restarted, reattached):
+        assert snapshot["type"] == "snapshot"
+        assert snapshot["last_seq"] == 4
+        assert [message["content"] for message in snapshot["messages"]] == ["before restart"]
+        assert snapshot["tool_calls"][0]["result"]["output"] == "a.txt"
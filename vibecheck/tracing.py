@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import json
+import logging
+import os
+from pathlib import Path
+import random
+import statistics
+import threading
+import time
+from typing import Any
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_RATE = 0.01
+DEFAULT_TRACE_CAPACITY = 256
+MAX_SPANS_PER_TRACE = 256
+
+
+def resolve_trace_sample_rate() -> float:
+    configured = os.environ.get("VIBECHECK_TRACE_SAMPLE_RATE", "")
+    try:
+        rate = float(configured) if configured else DEFAULT_SAMPLE_RATE
+    except ValueError:
+        rate = DEFAULT_SAMPLE_RATE
+    return min(1.0, max(0.0, rate))
+
+
+def resolve_trace_file() -> Path | None:
+    configured = os.environ.get("VIBECHECK_TRACE_FILE")
+    if configured:
+        return Path(configured).expanduser().resolve()
+    return None
+
+
+class Trace:
+    """Timings for one injected message, from queueing to the last frame written to a client.
+
+    Stage totals are always kept; individual spans are capped per trace. The trace
+    is exported once the turn and every frame it queued have released it.
+    """
+
+    __slots__ = (
+        "_done",
+        "_refs",
+        "_tracer",
+        "attrs",
+        "first_delivery_ms",
+        "last_delivery_ms",
+        "name",
+        "origin",
+        "session_id",
+        "spans",
+        "stages",
+        "started_at",
+        "trace_id",
+    )
+
+    def __init__(self, tracer: Tracer, name: str, session_id: str, attrs: dict[str, Any]) -> None:
+        self._tracer = tracer
+        self.trace_id = uuid4().hex[:16]
+        self.name = name
+        self.session_id = session_id
+        self.attrs = attrs
+        self.origin = time.perf_counter()
+        self.started_at = time.time()
+        self.stages: dict[str, list[float]] = {}
+        self.spans: list[tuple[str, float, float]] = []
+        self.first_delivery_ms: float | None = None
+        self.last_delivery_ms: float | None = None
+        self._refs = 1
+        self._done = False
+
+    def record(self, stage: str, start: float, end: float | None = None) -> None:
+        end = time.perf_counter() if end is None else end
+        duration_ms = (end - start) * 1000
+        totals = self.stages.get(stage)
+        if totals is None:
+            # [total_ms, count, max_ms]
+            self.stages[stage] = [duration_ms, 1, duration_ms]
+        else:
+            totals[0] += duration_ms
+            totals[1] += 1
+            if duration_ms > totals[2]:
+                totals[2] = duration_ms
+        if len(self.spans) < MAX_SPANS_PER_TRACE:
+            self.spans.append((stage, (start - self.origin) * 1000, duration_ms))
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, started)
+
+    def delivered(self) -> None:
+        elapsed_ms = (time.perf_counter() - self.origin) * 1000
+        if self.first_delivery_ms is None:
+            self.first_delivery_ms = elapsed_ms
+        self.last_delivery_ms = elapsed_ms
+
+    def hold(self) -> bool:
+        if self._done:
+            return False
+        self._refs += 1
+        return True
+
+    def release(self) -> None:
+        if self._done:
+            return
+        self._refs -= 1
+        if self._refs <= 0:
+            self._done = True
+            self._tracer.export(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "session_id": self.session_id,
+            "started_at": self.started_at,
+            "attrs": self.attrs,
+            "first_delivery_ms": _round(self.first_delivery_ms),
+            "last_delivery_ms": _round(self.last_delivery_ms),
+            "stages": {
+                stage: {"total_ms": _round(total), "count": int(count), "max_ms": _round(peak)}
+                for stage, (total, count, peak) in self.stages.items()
+            },
+            "spans": [
+                {"stage": stage, "start_ms": _round(start), "duration_ms": _round(duration)}
+                for stage, start, duration in self.spans
+            ],
+        }
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 3)
+
+
+def _append_lines(path: Path, lines: list[str]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as handle:
+            handle.writelines(lines)
+    except OSError:
+        logger.exception("Failed to export traces to %s", path)
+
+
+class Tracer:
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        *,
+        capacity: int = DEFAULT_TRACE_CAPACITY,
+        export_path: Path | None = None,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.export_path = export_path
+        self.traces: deque[dict[str, Any]] = deque(maxlen=capacity)
+        self.started = 0
+        # Export lines waiting for the writer; one flush is queued on the executor at a time.
+        self._pending: list[str] = []
+        self._flush_queued = False
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def start(self, name: str, session_id: str, **attrs: Any) -> Trace | None:
+        if self.sample_rate <= 0.0 or random.random() >= self.sample_rate:
+            return None
+        self.started += 1
+        return Trace(self, name, session_id, attrs)
+
+    def export(self, trace: Trace) -> None:
+        record = trace.to_dict()
+        self.traces.append(record)
+        if self.export_path is None:
+            return
+        with self._pending_lock:
+            self._pending.append(json.dumps(record, separators=(",", ":")) + "\n")
+            if self._flush_queued:
+                return
+            self._flush_queued = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        # Keep the file append off the event loop; traces exported meanwhile join this flush.
+        loop.run_in_executor(None, self.flush)
+
+    def flush(self) -> None:
+        """Append buffered export lines to ``export_path``; safe from any thread."""
+        with self._write_lock:
+            with self._pending_lock:
+                lines, self._pending = self._pending, []
+                self._flush_queued = False
+            if lines and self.export_path is not None:
+                _append_lines(self.export_path, lines)
+
+    def recent(self, *, limit: int = 50, session_id: str | None = None) -> list[dict[str, Any]]:
+        matching = [record for record in self.traces if session_id is None or record["session_id"] == session_id]
+        return matching[-limit:][::-1]
+
+    def stage_summary(self, records: list[dict[str, Any]]) -> dict[str, dict[str, float]]:
+        """Per-stage totals across ``records``: how much of each trace each stage took."""
+        per_stage: dict[str, list[float]] = {}
+        for record in records:
+            for stage, totals in record["stages"].items():
+                per_stage.setdefault(stage, []).append(totals["total_ms"])
+            if record["first_delivery_ms"] is not None:
+                per_stage.setdefault("first_delivery", []).append(record["first_delivery_ms"])
+        summary: dict[str, dict[str, float]] = {}
+        for stage, samples in per_stage.items():
+            ordered = sorted(samples)
+            summary[stage] = {
+                "traces": len(ordered),
+                "p50_ms": round(statistics.median(ordered), 3),
+                "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+                "max_ms": round(ordered[-1], 3),
+            }
+        return summary
+
+
+tracer = Tracer(resolve_trace_sample_rate(), export_path=resolve_trace_file())
+current_trace: ContextVar[Trace | None] = ContextVar("vibecheck_current_trace", default=None)
@@ -1,10 +1,62 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+from collections import deque
 import inspect
+import logging
+import time
 from typing import Any, Callable
 
+from vibecheck.metrics import registry as metrics
+
+DEFAULT_MAX_QUEUE = 1024
+DEFAULT_MAX_REDRAWS_PER_SECOND = 30.0
+STREAMING_EVENT_SUFFIXES = ("AssistantEvent", "ReasoningEvent")
+
+logger = logging.getLogger(__name__)
+
+TUI_DROPPED_TOTAL = metrics.counter(
+    "vibecheck_tui_dropped_events_total",
+    "Streaming chunks dropped from a full TUI render queue.",
+)
+
+
+def _is_streaming(event: object) -> bool:
+    return event.__class__.__name__.endswith(STREAMING_EVENT_SUFFIXES)
+
+
+def _merge_streaming(previous: object, current: object) -> object | None:
+    """Fold ``current`` into ``previous`` when both are deltas of the same streamed message.
+
+    Only valid for handlers that append each event's content, i.e. when the stream is known to carry deltas.
+    """
+    if previous.__class__ is not current.__class__ or not _is_streaming(previous):
+        return None
+    previous_content = getattr(previous, "content", None)
+    current_content = getattr(current, "content", None)
+    if not isinstance(previous_content, str) or not isinstance(current_content, str):
+        return None
+    if getattr(previous, "message_id", None) != getattr(current, "message_id", None):
+        return None
+    merged_content = previous_content + current_content
+    model_copy = getattr(previous, "model_copy", None)
+    if callable(model_copy):
+        return model_copy(update={"content": merged_content})
+    merged = copy.copy(previous)
+    merged.content = merged_content
+    return merged
+
+
 class TuiBridge:
-    """Adapts SessionBridge events to a Textual-style event handler."""
+    """Adapts SessionBridge events to a Textual-style event handler.
+
+    With ``max_redraws_per_second`` set, raw events are queued and rendered by a
+    background pump so the agent loop never waits on the terminal. ``merge_deltas``
+    declares that assistant/reasoning events carry deltas the handler appends, which
+    lets queued chunks of one message render as one. A full queue only ever drops
+    streaming chunks; tool, approval and state events are always rendered.
+    """
 
     def __init__(
         self,
@@ -12,10 +64,31 @@ class TuiBridge:
         *,
         loading_state_getter: Callable[[], bool] | None = None,
         loading_widget_getter: Callable[[], Any] | None = None,
+        max_redraws_per_second: float | None = None,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        frame_scale_getter: Callable[[], float] | None = None,
+        merge_deltas: bool = False,
     ) -> None:
         self._event_handler = event_handler
         self._loading_state_getter = loading_state_getter or (lambda: False)
         self._loading_widget_getter = loading_widget_getter or (lambda: None)
+        self.max_redraws_per_second = max_redraws_per_second
+        self.max_queue = max_queue
+        self.merge_deltas = merge_deltas
+        # Multiplies the frame interval, e.g. to widen the coalescing window under load.
+        self._frame_scale_getter = frame_scale_getter or (lambda: 1.0)
+        self.coalesced = 0
+        self.dropped = 0
+        self.renders = 0
+        self._queue: deque[object] = deque()
+        self._wakeup = asyncio.Event()
+        self._pump_task: asyncio.Task[None] | None = None
+        self._last_render = 0.0
+        self._closing = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
 
     async def _dispatch(self, event: object) -> None:
         handle_event = getattr(self._event_handler, "handle_event", None)
@@ -34,4 +107,83 @@ class TuiBridge:
         await self._dispatch(event)
 
     async def on_bridge_raw_event(self, event: object) -> None:
-        await self._dispatch(event)
+        if self.max_redraws_per_second is None:
+            await self._dispatch(event)
+            return
+        self.enqueue(event)
+
+    def enqueue(self, event: object) -> None:
+        if self.merge_deltas and self._queue:
+            merged = _merge_streaming(self._queue[-1], event)
+            if merged is not None:
+                self._queue[-1] = merged
+                self.coalesced += 1
+                self._ensure_pump()
+                return
+        self._queue.append(event)
+        if len(self._queue) > self.max_queue:
+            self._drop_oldest_streaming()
+        self._wakeup.set()
+        self._ensure_pump()
+
+    def _drop_oldest_streaming(self) -> None:
+        for index, queued in enumerate(self._queue):
+            if _is_streaming(queued):
+                del self._queue[index]
+                break
+        else:
+            # Nothing droppable; the queue grows rather than lose a tool, approval or state event.
+            return
+        self.dropped += 1
+        TUI_DROPPED_TOTAL.inc()
+        if self.dropped == 1:
+            logger.warning("TUI render queue overflowed; dropping oldest streaming chunks")
+
+    def _ensure_pump(self) -> None:
+        if self._pump_task is not None and not self._pump_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._pump_task = loop.create_task(self._pump())
+
+    async def _pump(self) -> None:
+        assert self.max_redraws_per_second is not None
+        while True:
+            if not self._queue:
+                if self._closing:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            frame_interval = self._frame_scale_getter() / self.max_redraws_per_second
+            wait = self._last_render + frame_interval - time.monotonic()
+            if wait > 0 and not self._closing:
+                # Deltas that arrive while we wait merge into the queued tail event.
+                await asyncio.sleep(wait)
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._queue:
+            return
+        self._last_render = time.monotonic()
+        self.renders += 1
+        # Events queued while this batch renders wait for the next frame.
+        batch = list(self._queue)
+        self._queue.clear()
+        for event in batch:
+            try:
+                await self._dispatch(event)
+            except Exception:
+                logger.exception("TUI event handler failed")
+
+    async def aclose(self) -> None:
+        # Let the pump finish its current batch rather than cancelling mid-render.
+        self._closing = True
+        self._wakeup.set()
+        task = self._pump_task
+        self._pump_task = None
+        if task is not None and not task.done():
+            await task
+        await self.flush()
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+import json
+import logging
+import os
+from pathlib import Path
+import sys
+import time
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from vibecheck.events import Event
+
+if TYPE_CHECKING:
+    from vibecheck.bridge import VibeRuntime
+
+# Tool output can be large; frames are single JSON lines so the reader limit must cover them.
+FRAME_LIMIT_BYTES = 32 * 1024 * 1024
+DEFAULT_MAX_RESTARTS = 5
+DEFAULT_RESTART_WINDOW = 60.0
+DEFAULT_RESTART_BACKOFF = 0.5
+
+FrameHandler = Callable[[dict[str, Any]], Awaitable[None]]
+ExitHandler = Callable[[int | None, bool], Awaitable[None]]
+
+logger = logging.getLogger(__name__)
+
+
+def encode_frame(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def worker_command(session_id: str) -> list[str]:
+    return [sys.executable, "-m", "vibecheck.worker", session_id]
+
+
+def _worker_env() -> dict[str, str]:
+    env = dict(os.environ)
+    package_root = str(Path(__file__).resolve().parent.parent)
+    existing = env.get("PYTHONPATH")
+    env["PYTHONPATH"] = package_root if not existing else os.pathsep.join([package_root, existing])
+    return env
+
+
+class SessionWorker:
+    """Supervises the subprocess that runs one managed session's AgentLoop."""
+
+    def __init__(
+        self,
+        session_id: str,
+        *,
+        on_frame: FrameHandler,
+        on_exit: ExitHandler,
+        command: list[str] | None = None,
+        max_restarts: int = DEFAULT_MAX_RESTARTS,
+        restart_window_seconds: float = DEFAULT_RESTART_WINDOW,
+        restart_backoff_seconds: float = DEFAULT_RESTART_BACKOFF,
+    ) -> None:
+        self.session_id = session_id
+        self.command = command or worker_command(session_id)
+        self.max_restarts = max_restarts
+        self.restart_window_seconds = restart_window_seconds
+        self.restart_backoff_seconds = restart_backoff_seconds
+        self.restarts = 0
+        self._on_frame = on_frame
+        self._on_exit = on_exit
+        self._process: asyncio.subprocess.Process | None = None
+        self._ready = False
+        self._outbox: list[bytes] = []
+        self._restart_times: deque[float] = deque()
+        self._closing = False
+        self._supervisor: asyncio.Task[None] | None = None
+
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid if self._process is not None else None
+
+    @property
+    def running(self) -> bool:
+        return self._supervisor is not None and not self._supervisor.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._closing = False
+        self._supervisor = asyncio.get_running_loop().create_task(self._supervise())
+
+    def send(self, payload: dict[str, Any]) -> None:
+        frame = encode_frame(payload)
+        process = self._process
+        if not self._ready or process is None or process.stdin is None or process.stdin.is_closing():
+            self._outbox.append(frame)
+            return
+        process.stdin.write(frame)
+
+    async def _supervise(self) -> None:
+        while not self._closing:
+            returncode = await self._run_once()
+            if self._closing:
+                return
+            now = time.monotonic()
+            self._restart_times.append(now)
+            while self._restart_times and now - self._restart_times[0] > self.restart_window_seconds:
+                self._restart_times.popleft()
+            gave_up = len(self._restart_times) > self.max_restarts
+            await self._on_exit(returncode, gave_up)
+            if gave_up:
+                logger.error("Session worker %s keeps exiting; giving up", self.session_id)
+                return
+            self.restarts += 1
+            await asyncio.sleep(self.restart_backoff_seconds)
+
+    async def _run_once(self) -> int | None:
+        self._ready = False
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *self.command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                env=_worker_env(),
+                limit=FRAME_LIMIT_BYTES,
+            )
+        except OSError:
+            logger.exception("Failed to spawn session worker for %s", self.session_id)
+            return None
+        self._process = process
+        assert process.stdout is not None
+        try:
+            while True:
+                line = await process.stdout.readline()
+                if not line:
+                    break
+                try:
+                    frame = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Dropping malformed frame from session worker %s", self.session_id)
+                    continue
+                if frame.get("op") == "ready":
+                    self._flush_outbox()
+                await self._on_frame(frame)
+        finally:
+            self._ready = False
+            if process.returncode is None:
+                process.kill()
+            # Reap the child even when cancelled so its pipe transport closes on this loop.
+            returncode = await process.wait()
+        return returncode
+
+    def _flush_outbox(self) -> None:
+        self._ready = True
+        process = self._process
+        if process is None or process.stdin is None:
+            return
+        for frame in self._outbox:
+            process.stdin.write(frame)
+        self._outbox.clear()
+
+    def terminate(self) -> None:
+        self._closing = True
+        self._outbox.clear()
+        process = self._process
+        if process is not None and process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        if self._supervisor is not None and not self._supervisor.done():
+            self._supervisor.cancel()
+
+    async def close(self, timeout: float = 2.0) -> None:
+        self._closing = True
+        process = self._process
+        if process is not None and process.returncode is None and self._ready:
+            self.send({"op": "shutdown"})
+            try:
+                await asyncio.wait_for(process.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        self.terminate()
+        if self._supervisor is not None:
+            try:
+                await self._supervisor
+            except asyncio.CancelledError:
+                pass
+
+
+class _PipeConnectionManager:
+    def __init__(self, output: BinaryIO) -> None:
+        self._output = output
+
+    async def broadcast(self, _session_id: str, event: Event) -> None:
+        self._output.write(encode_frame({"op": "event", "event": event.model_dump(mode="json")}))
+
+
+async def run_worker(session_id: str, *, runtime_loader: Callable[[], VibeRuntime] | None = None) -> None:
+    from vibecheck.agent_pool import AgentLoopPool
+    from vibecheck.blobs import BlobStore
+    from vibecheck.bridge import SessionBridge, load_vibe_runtime
+
+    # Frames go to the original stdout; anything the agent or its tools print lands on stderr.
+    output = os.fdopen(os.dup(1), "wb", buffering=0)
+    os.dup2(2, 1)
+
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=FRAME_LIMIT_BYTES)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+    pool = AgentLoopPool(1, runtime_loader=runtime_loader or load_vibe_runtime)
+    await pool.warm()
+    bridge = SessionBridge(
+        session_id,
+        connection_manager=_PipeConnectionManager(output),
+        attach_mode="managed",
+        # Payloads are externalized by the parent so its blob endpoint can serve them.
+        blob_store=BlobStore(inline_threshold=sys.maxsize),
+        agent_pool=pool,
+    )
+    output.write(encode_frame({"op": "ready", "pid": os.getpid()}))
+
+    while line := await reader.readline():
+        frame = json.loads(line)
+        op = frame.get("op")
+        if op == "message":
+            if not bridge.inject_message(str(frame.get("content", "")), urgent=bool(frame.get("urgent"))):
+                output.write(encode_frame({"op": "error", "error": "Vibe runtime unavailable in session worker"}))
+        elif op == "approval":
+            bridge.resolve_approval(
+                call_id=str(frame.get("call_id")),
+                approved=bool(frame.get("approved")),
+                edited_args=frame.get("edited_args"),
+            )
+        elif op == "input":
+            bridge.resolve_input(request_id=str(frame.get("request_id")), response=str(frame.get("response", "")))
+        elif op == "interrupt":
+            bridge.interrupt()
+        elif op == "shutdown":
+            break
+
+    bridge.stop()
+    await pool.close()
+
+
+def main() -> None:
+    if len(sys.argv) != 2:
+        raise SystemExit("usage: python -m vibecheck.worker <session_id>")
+    asyncio.run(run_worker(sys.argv[1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,108 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Awaitable, Callable, Iterable
+import functools
+import time
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from vibecheck.auth import is_psk_valid, load_psk
-from vibecheck.bridge import session_manager
-from vibecheck.events import ConnectedEvent, Event, HeartbeatEvent, StateChangeEvent
+from vibecheck.bridge import EVENT_ENCODE_SECONDS, SessionBridge, session_manager
+from vibecheck.commands import execute_command, parse_command
+from vibecheck.events import (
+    CommandAckEvent,
+    ConnectedEvent,
+    Event,
+    HeartbeatEvent,
+    StateChangeEvent,
+)
+from vibecheck.metrics import registry as metrics
+from vibecheck.overload import OverloadController, overload_controller, resolve_overload_control
+from vibecheck.priority import Priority, PriorityLanes, event_priority
+from vibecheck.projection import PASSTHROUGH, SubscriptionFilter, project_payload
+from vibecheck.tracing import Trace, current_trace
+
+
+WS_SEND_SECONDS = metrics.histogram("vibecheck_ws_send_seconds", "Time to write one frame to a WebSocket.")
+WS_FRAMES_TOTAL = metrics.counter("vibecheck_ws_frames_total", "Frames written to WebSocket clients.")
+_WS_ENCODE_SECONDS = EVENT_ENCODE_SECONDS.labels("ws")
+
+
+async def _timed_send(websocket: WebSocket, payload: dict) -> None:
+    started = time.perf_counter()
+    await websocket.send_json(payload)
+    WS_SEND_SECONDS.observe(time.perf_counter() - started)
+    WS_FRAMES_TOTAL.inc()
+
+
+class ClientSendQueue:
+    """Per-socket outbox; a single writer task always sends the most urgent frame next."""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        on_error: Callable[[WebSocket], Awaitable[None]],
+    ) -> None:
+        self.websocket = websocket
+        # (payload, trace held for this frame, perf_counter at enqueue when traced)
+        self.lanes: PriorityLanes[tuple[dict, Trace | None, float]] = PriorityLanes()
+        self.sent = 0
+        self._on_error = on_error
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def __len__(self) -> int:
+        return len(self.lanes)
+
+    def put(self, payload: dict, priority: Priority, trace: Trace | None = None) -> None:
+        self.lanes.append((payload, trace, time.perf_counter() if trace is not None else 0.0), priority)
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            while not self.lanes:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            payload, trace, enqueued_at = self.lanes.popleft()
+            if trace is None:
+                try:
+                    await _timed_send(self.websocket, payload)
+                except Exception:
+                    await self._on_error(self.websocket)
+                    return
+                self.sent += 1
+                continue
+            try:
+                sending_at = time.perf_counter()
+                trace.record("ws_queue_wait", enqueued_at, sending_at)
+                await _timed_send(self.websocket, payload)
+                trace.record("ws_send", sending_at)
+                trace.delivered()
+            except Exception:
+                await self._on_error(self.websocket)
+                return
+            finally:
+                trace.release()
+            self.sent += 1
+
+    def close(self) -> None:
+        while self.lanes:
+            _payload, trace, _enqueued_at = self.lanes.popleft()
+            if trace is not None:
+                trace.release()
+        if self._task is not asyncio.current_task():
+            self._task.cancel()
 
 
 class ConnectionManager:
-    def __init__(self) -> None:
+    def __init__(self, overload: OverloadController | None = None) -> None:
+        self.overload = overload
         self.rooms: dict[str, set[WebSocket]] = {}
         self.socket_to_session: dict[WebSocket, str] = {}
+        self.socket_filters: dict[WebSocket, SubscriptionFilter] = {}
+        # Sockets accepted through connect() send via their own queue; others are written inline.
+        self.send_queues: dict[WebSocket, ClientSendQueue] = {}
         self._expected_psk: str | None = None
 
     def _get_expected_psk(self) -> str:
@@ -21,7 +110,13 @@ class ConnectionManager:
             self._expected_psk = load_psk()
         return self._expected_psk
 
-    async def connect(self, websocket: WebSocket, session_id: str, psk: str | None) -> bool:
+    async def connect(
+        self,
+        websocket: WebSocket,
+        session_id: str,
+        psk: str | None,
+        subscription: SubscriptionFilter = PASSTHROUGH,
+    ) -> bool:
         if not is_psk_valid(psk, self._get_expected_psk()):
             await websocket.close(code=4401)
             return False
@@ -29,9 +124,16 @@ class ConnectionManager:
         connections = self.rooms.setdefault(session_id, set())
         connections.add(websocket)
         self.socket_to_session[websocket] = session_id
+        if not subscription.is_passthrough:
+            self.socket_filters[websocket] = subscription
+        self.send_queues[websocket] = ClientSendQueue(websocket, self.disconnect)
         return True
 
     async def disconnect(self, websocket: WebSocket) -> None:
+        self.socket_filters.pop(websocket, None)
+        queue = self.send_queues.pop(websocket, None)
+        if queue is not None:
+            queue.close()
         session_id = self.socket_to_session.pop(websocket, None)
         if session_id is None:
             return
@@ -49,45 +151,135 @@ class ConnectionManager:
     def session_clients(self, session_id: str) -> int:
         return len(self.rooms.get(session_id, set()))
 
+    def max_queue_depth(self) -> int:
+        return max((len(queue) for queue in self.send_queues.values()), default=0)
+
     @staticmethod
     def _serialize_event(event: Event | dict) -> dict:
         if hasattr(event, "model_dump"):
             return event.model_dump(mode="json")
         return dict(event)
 
-    async def send_personal(self, websocket: WebSocket, event: Event | dict) -> None:
-        payload = self._serialize_event(event)
+    def subscription_for(self, websocket: WebSocket) -> SubscriptionFilter:
+        return self.socket_filters.get(websocket, PASSTHROUGH)
+
+    async def _deliver(
+        self,
+        websocket: WebSocket,
+        payload: dict,
+        priority: Priority,
+        *,
+        sheddable: bool = True,
+        trace: Trace | None = None,
+    ) -> bool:
+        queue = self.send_queues.get(websocket)
+        if queue is not None:
+            if sheddable and self.overload is not None and self.overload.should_shed(payload, len(queue)):
+                return True
+            queue.put(payload, priority, trace if trace is not None and trace.hold() else None)
+            return True
+        started = time.perf_counter()
         try:
-            await websocket.send_json(payload)
+            await _timed_send(websocket, payload)
         except Exception:
+            return False
+        if trace is not None:
+            trace.record("ws_send", started)
+            trace.delivered()
+        return True
+
+    async def send_personal(
+        self,
+        websocket: WebSocket,
+        event: Event | dict,
+        *,
+        priority: Priority | None = None,
+    ) -> None:
+        """Send ``event`` to one client; pass ``priority`` to pin replayed history to a single lane."""
+        payload = project_payload(
+            self._serialize_event(event),
+            self.subscription_for(websocket),
+            session_id=self.socket_to_session.get(websocket),
+        )
+        if payload is None:
+            return
+        # Explicitly prioritised frames are requested replays and are never shed.
+        sheddable = priority is None
+        if priority is None:
+            priority = event_priority(payload)
+        if not await self._deliver(websocket, payload, priority, sheddable=sheddable):
             await self.disconnect(websocket)
 
-    async def _send_many(self, sockets: Iterable[WebSocket], event: Event | dict) -> None:
+    async def _send_many(
+        self,
+        sockets: Iterable[WebSocket],
+        event: Event | dict,
+        *,
+        session_id: str | None = None,
+    ) -> None:
+        trace = current_trace.get()
+        started = time.perf_counter()
         payload = self._serialize_event(event)
+        encoded = time.perf_counter()
+        _WS_ENCODE_SECONDS.observe(encoded - started)
+        if trace is not None:
+            trace.record("ws_encode", started, encoded)
+        priority = event_priority(payload)
+        if self.overload is not None:
+            payload = self.overload.degrade(payload, priority, session_id=session_id)
+        # Projections are shared by every socket with the same filter profile.
+        projections: dict[SubscriptionFilter, dict | None] = {PASSTHROUGH: payload}
         stale: list[WebSocket] = []
         for websocket in list(sockets):
-            try:
-                await websocket.send_json(payload)
-            except Exception:
+            subscription = self.subscription_for(websocket)
+            if subscription not in projections:
+                projections[subscription] = project_payload(
+                    payload,
+                    subscription,
+                    session_id=session_id,
+                )
+            projected = projections[subscription]
+            if projected is None:
+                continue
+            if not await self._deliver(websocket, projected, priority, trace=trace):
                 stale.append(websocket)
         for websocket in stale:
             await self.disconnect(websocket)
 
     async def broadcast(self, session_id: str, event: Event | dict) -> None:
-        await self._send_many(self.rooms.get(session_id, set()), event)
+        await self._send_many(self.rooms.get(session_id, set()), event, session_id=session_id)
 
     async def broadcast_all(self, event: Event | dict) -> None:
-        await self._send_many(self.socket_to_session.keys(), event)
+        payload = self._serialize_event(event)
+        for session_id, sockets in list(self.rooms.items()):
+            await self._send_many(sockets, payload, session_id=session_id)
 
 
 async def _send_heartbeats(websocket: WebSocket) -> None:
     while True:
         await asyncio.sleep(30)
-        await websocket.send_json(HeartbeatEvent().model_dump(mode="json"))
+        await manager.send_personal(websocket, HeartbeatEvent())
 
 
 router = APIRouter()
-manager = ConnectionManager()
+manager = ConnectionManager(overload=overload_controller if resolve_overload_control() else None)
+
+
+metrics.collector(
+    "vibecheck_ws_clients",
+    "Connected WebSocket clients per session.",
+    lambda: [("vibecheck_ws_clients", {"session": session_id}, len(sockets)) for session_id, sockets in list(manager.rooms.items())],
+)
+metrics.collector(
+    "vibecheck_ws_send_queue_frames",
+    "Frames waiting in per-client send queues.",
+    lambda: [("vibecheck_ws_send_queue_frames", {}, sum(len(queue) for queue in list(manager.send_queues.values())))],
+)
+
+
+async def _backlog_replay(bridge: SessionBridge) -> tuple[StateChangeEvent, list[Event]]:
+    state = StateChangeEvent(state=bridge.state, attach_mode=bridge.attach_mode, controllable=bridge.controllable)
+    return state, await bridge.abacklog()
 
 
 def bind_session_manager() -> None:
@@ -97,27 +289,38 @@ def bind_session_manager() -> None:
 @router.websocket("/ws/events/{session_id}")
 async def events(websocket: WebSocket, session_id: str) -> None:
     provided_psk = websocket.query_params.get("psk")
-    connected = await manager.connect(websocket=websocket, session_id=session_id, psk=provided_psk)
+    connected = await manager.connect(
+        websocket=websocket,
+        session_id=session_id,
+        psk=provided_psk,
+        subscription=SubscriptionFilter.from_query(websocket.query_params),
+    )
     if not connected:
         return
 
-    if not session_manager.has_known_session(session_id):
+    # Lookup and attach mutate the manager, which belongs to the TUI loop in server-thread mode.
+    bridge = await session_manager.aattach_known(session_id)
+    if bridge is None:
         await websocket.close(code=4404)
         await manager.disconnect(websocket)
         return
 
-    bridge = session_manager.attach(session_id)
     await manager.send_personal(websocket, ConnectedEvent(session_id=session_id))
-    await manager.send_personal(
-        websocket,
-        StateChangeEvent(
-            state=bridge.state,
-            attach_mode=bridge.attach_mode,
-            controllable=bridge.controllable,
-        ),
-    )
-    for event in bridge.backlog():
-        await manager.send_personal(websocket, event)
+
+    resume_after = websocket.query_params.get("after_seq")
+    # Read initial state on the bridge's loop; it is not ours when the server has its own thread.
+    if resume_after is not None and resume_after.isdigit():
+        # Resuming clients already hold a snapshot; send only what they missed.
+        missed = await bridge.on_home_loop(functools.partial(bridge.ahistory, after_seq=int(resume_after), limit=500))
+        for _seq, event in missed:
+            await manager.send_personal(websocket, event, priority=Priority.BULK)
+    elif websocket.query_params.get("replay") == "backlog":
+        state, backlog = await bridge.on_home_loop(_backlog_replay, bridge)
+        await manager.send_personal(websocket, state)
+        for event in backlog:
+            await manager.send_personal(websocket, event, priority=Priority.BULK)
+    else:
+        await manager.send_personal(websocket, await bridge.on_home_loop(bridge.snapshot_event))
 
     heartbeat_task = asyncio.create_task(_send_heartbeats(websocket))
 
@@ -126,6 +329,18 @@ async def events(websocket: WebSocket, session_id: str) -> None:
             message = await websocket.receive()
             if message["type"] == "websocket.disconnect":
                 break
+            raw = message.get("text")
+            if raw is None and message.get("bytes") is not None:
+                raw = message["bytes"].decode("utf-8", errors="replace")
+            if raw is None:
+                continue
+            command = parse_command(raw)
+            if isinstance(command, CommandAckEvent):
+                ack = command
+            else:
+                # Commands resolve futures and touch queues owned by the bridge's loop.
+                ack = await bridge.on_home_loop(execute_command, bridge, command)
+            await manager.send_personal(websocket, ack)
     except WebSocketDisconnect:
         pass
     finally: